@@ -0,0 +1,144 @@
+"""Provides advisory inter-process file locks used to coordinate access to files shared by reef processes.
+
+Locks are held on a separate lock file (e.g. 'projects.json.lock'), which is created on first use and never removed
+(removing it could let two processes lock different files under the same path). On POSIX systems locks are taken
+with 'flock' and may be shared (for readers) or exclusive (for writers). On Windows all locks are exclusive
+and waiting for them is done by polling ('msvcrt.locking' gives up blocking attempts after about 10 seconds).
+"""
+
+import os
+import sys
+import time
+from typing import Any, Optional
+
+if sys.platform == "win32":  # pragma: no cover
+    import msvcrt
+else:
+    import fcntl
+
+LOCK_FILE_SUFFIX = ".lock"
+
+_LOCK_POLL_INTERVAL = 0.01
+
+
+class FileLock:
+    """Advisory lock on a lock file, usable as a context manager.
+
+    Arguments:
+
+    - lock_path (str) - path to lock file (see get_lock_path),
+    - shared (bool) - if true, lock is shared with other shared lock holders (readers),
+    - timeout (float) - maximum time (in seconds) to wait for the lock, or None to wait indefinitely.
+
+    Time spent waiting for the lock most recently acquired is available as 'wait_time'.
+    """
+
+    def __init__(self, lock_path: str, *, shared: bool = False, timeout: Optional[float] = None) -> None:
+        """Initializes lock object (lock is not acquired until acquire is called or context is entered)."""
+        self._lock_path = os.fspath(lock_path)
+        self._is_shared = shared
+        self._timeout = timeout
+        self._fd: Optional[int] = None
+        self._wait_time = 0.0
+
+    @property
+    def lock_path(self) -> str:
+        """Path to underlying lock file."""
+        return self._lock_path
+
+    @property
+    def is_shared(self) -> bool:
+        """Indicates whether lock is shared (otherwise it is exclusive)."""
+        return self._is_shared
+
+    @property
+    def is_locked(self) -> bool:
+        """Indicates whether lock is currently held by this object."""
+        return self._fd is not None
+
+    @property
+    def wait_time(self) -> float:
+        """Time (in seconds) spent waiting for the lock most recently acquired."""
+        return self._wait_time
+
+    def acquire(self) -> float:
+        """Acquires the lock, waiting for it if needed, and returns time spent waiting (in seconds).
+
+        Raises TimeoutError if lock could not be acquired within timeout.
+        """
+        if self._fd is not None:
+            raise RuntimeError(f"Lock on '{self._lock_path}' is already acquired.")
+        fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o666)
+        start = time.perf_counter()
+        try:
+            if self._timeout is None and sys.platform != "win32":
+                _lock(fd, self._is_shared, blocking=True)
+            else:
+                deadline = start + self._timeout if self._timeout is not None else None
+                while not _lock(fd, self._is_shared, blocking=False):
+                    if deadline is not None and time.perf_counter() >= deadline:
+                        raise TimeoutError(f"Lock on '{self._lock_path}' not acquired in {self._timeout} seconds.")
+                    time.sleep(_LOCK_POLL_INTERVAL)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._wait_time = time.perf_counter() - start
+        self._fd = fd
+        return self._wait_time
+
+    def release(self) -> None:
+        """Releases the lock (does nothing if lock is not held)."""
+        if self._fd is None:
+            return
+        fd, self._fd = self._fd, None
+        try:
+            _unlock(fd)
+        finally:
+            os.close(fd)
+
+    def __enter__(self) -> "FileLock":
+        """Acquires the lock."""
+        self.acquire()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Releases the lock."""
+        self.release()
+
+
+def get_lock_path(filepath: str) -> str:
+    """Returns path of lock file guarding file at given path."""
+    return f"{os.fspath(filepath)}{LOCK_FILE_SUFFIX}"
+
+
+### IMPLEMENTATION DETAILS:
+
+
+def _lock(fd: int, shared: bool, *, blocking: bool) -> bool:
+    """Locks file descriptor, returns False if lock is held elsewhere (only in non-blocking mode).
+
+    On Windows, only non-blocking mode is supported.
+    """
+    if sys.platform == "win32":  # pragma: no cover
+        assert not blocking
+        os.lseek(fd, 0, os.SEEK_SET)
+        try:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+    else:
+        operation = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+        try:
+            fcntl.flock(fd, operation if blocking else operation | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+    return True
+
+
+def _unlock(fd: int) -> None:
+    """Unlocks file descriptor locked with _lock."""
+    if sys.platform == "win32":  # pragma: no cover
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(fd, fcntl.LOCK_UN)
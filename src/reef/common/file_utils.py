@@ -1,22 +1,103 @@
 """Provides some basic utility functions and wrappers for handling file system and file I/O."""
 
-import json
+import hashlib
 import os
 
+from .json_codec import get_json_codec
+
+_HASH_CHUNK_SIZE = 1 << 16
+_NEW_FILE_MODE = 0o666
+
 
 def load_json(filepath):
-    """Returns object representing JSON data from file at given filepath."""
-    with open(filepath, encoding="utf-8") as fp:
-        return json.load(fp)
+    """Returns object representing JSON data from file at given filepath (decoded directly from bytes)."""
+    with open(filepath, mode="rb") as fp:
+        return get_json_codec().loads(fp.read())
+
+
+def dump_json(filepath, data, *, compact=False):
+    """Writes JSON data to file at given filepath (see write_file_if_changed).
+
+    Data is indented for readability, unless compact is true (intended for machine-owned files).
+    Returns True if file was written, or False if it already contained the same data.
+    """
+    return write_file_if_changed(filepath, get_json_codec().dumps(data, compact=compact))
+
+
+def write_file_if_changed(filepath, content):
+    """Atomically writes given bytes to file at given filepath, unless the file already has exactly that content.
+
+    Existing file is compared by its size first and then by content hash, so that unchanged files are not
+    rewritten (and keep their modification times). Otherwise, content is written to a temporary file in the
+    same directory, flushed to disk and renamed over the target, so the file is never left partially written.
+
+    Returns True if file was written, or False if it was left unchanged.
+    """
+    if is_file_content_equal(filepath, content):
+        return False
+    write_file_atomic(filepath, content)
+    return True
 
 
-def dump_json(filepath, data):
-    """Writes JSON data to file at given filepath."""
-    with open(filepath, mode="w", encoding="utf-8") as fp:
-        json.dump(data, fp, indent=2, ensure_ascii=False)
+def is_file_content_equal(filepath, content):
+    """Checks whether file at given filepath exists and contains exactly given bytes."""
+    try:
+        if os.stat(filepath).st_size != len(content):
+            return False
+        file_hash = hashlib.sha256()
+        with open(filepath, mode="rb") as fp:
+            for chunk in iter(lambda: fp.read(_HASH_CHUNK_SIZE), b""):
+                file_hash.update(chunk)
+    except FileNotFoundError:
+        return False
+    return file_hash.digest() == hashlib.sha256(content).digest()
+
+
+def write_file_atomic(filepath, content):
+    """Writes given bytes to file at given filepath using write-temp, fsync and rename sequence.
+
+    Permissions of an existing file are preserved.
+    """
+    filepath = os.path.abspath(filepath)
+    dirpath = os.path.dirname(filepath)
+    temp_filepath = f"{filepath}.{os.urandom(4).hex()}.tmp"
+
+    try:
+        mode = os.stat(filepath).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+
+    fd = os.open(temp_filepath, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), _NEW_FILE_MODE)
+    try:
+        with os.fdopen(fd, mode="wb") as fp:
+            fp.write(content)
+            fp.flush()
+            os.fsync(fp.fileno())
+        if mode is not None:
+            os.chmod(temp_filepath, mode)
+        os.replace(temp_filepath, filepath)
+    except BaseException:
+        if os.path.exists(temp_filepath):
+            os.remove(temp_filepath)
+        raise
+    _fsync_dir(dirpath)
 
 
 def ensure_dir(dirpath):
     """Checks if directory exists at dirpath and if it does not, creates an empty directory there."""
     if not os.path.exists(dirpath):
         os.makedirs(dirpath)
+
+
+### IMPLEMENTATION DETAILS:
+
+
+def _fsync_dir(dirpath):
+    """Flushes directory entry changes (e.g. renames) to disk, where supported by the platform."""
+    if os.name == "nt":
+        return
+    fd = os.open(dirpath, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
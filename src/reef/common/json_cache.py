@@ -0,0 +1,100 @@
+"""Provides pre-parsed binary snapshots of JSON files, used to skip parsing (and validation) on repeated loads.
+
+Snapshot of 'name.json' is stored next to it as 'name.json.cache'. It contains plain data (as loaded from JSON)
+serialized with 'marshal' module, together with snapshot format version (which includes reef version) and stat key
+of the source file (modification time, size and inode). Snapshot is used only when the key matches current state
+of the source file, otherwise JSON file is parsed (and validated) again and snapshot is transparently rebuilt.
+
+Snapshot of validated data also records schema key given by the caller (e.g. see get_settings_schema_key),
+and data is trusted to be valid only if it is loaded with the same schema key, so changes of validation rules
+(even without reef version change) invalidate earlier snapshots.
+
+Snapshots are a best-effort optimization: unreadable or outdated snapshots are ignored and failures to write them
+are silently skipped. Caching can be disabled by setting REEF_JSON_CACHE environment variable to '0'.
+"""
+
+import contextlib
+import marshal
+import os
+import sys
+from typing import Any, Callable, Optional, Tuple
+
+from ..version import __version__
+from .file_utils import load_json, write_file_atomic
+
+JSON_CACHE_ENV_VAR_NAME = "REEF_JSON_CACHE"
+JSON_CACHE_FILE_SUFFIX = ".cache"
+
+# bump when layout of stored snapshot changes (marshal format depends on Python version too)
+_SNAPSHOT_FORMAT_VERSION = (2, __version__, marshal.version, sys.version_info[0], sys.version_info[1])
+
+
+def is_json_cache_enabled() -> bool:
+    """Checks whether JSON snapshots are enabled (they are, unless REEF_JSON_CACHE is set to '0')."""
+    return os.environ.get(JSON_CACHE_ENV_VAR_NAME, "1") != "0"
+
+
+def get_json_cache_path(filepath: str) -> str:
+    """Returns path of snapshot file for JSON file at given path."""
+    return f"{os.fspath(filepath)}{JSON_CACHE_FILE_SUFFIX}"
+
+
+def load_json_cached(
+    filepath: str,
+    *,
+    validate: Optional[Callable[[Any], Any]] = None,
+    from_validated: Optional[Callable[[Any], Any]] = None,
+    schema_key: str = "",
+) -> Any:
+    """Returns data from JSON file at given path (or object representing it), using its snapshot if it is up to date.
+
+    If validate callable is given, it is called with loaded data (and may raise to reject it) and its result
+    (e.g. settings object constructed from data) is returned instead of plain data. Snapshot of data that passed
+    validation records given schema key. If from_validated callable is given too, it is called instead of validate
+    for data from snapshot recorded with the same schema key (so data is not validated again).
+    """
+    if not is_json_cache_enabled():
+        data = load_json(filepath)
+        return validate(data) if validate is not None else data
+
+    key = _stat_key(filepath)
+    cache_path = get_json_cache_path(filepath)
+    snapshot = _read_snapshot(cache_path)
+    if snapshot is not None and snapshot[0] == _SNAPSHOT_FORMAT_VERSION and snapshot[1] == key:
+        data = snapshot[3]
+        if validate is None:
+            return data
+        if snapshot[2] == schema_key:
+            return from_validated(data) if from_validated is not None else validate(data)
+        result = validate(data)
+    else:
+        data = load_json(filepath)
+        result = validate(data) if validate is not None else data
+    # only data that passed validation is recorded with schema key
+    _write_snapshot(cache_path, (_SNAPSHOT_FORMAT_VERSION, key, schema_key if validate is not None else None, data))
+    return result
+
+
+### IMPLEMENTATION DETAILS:
+
+
+def _stat_key(filepath: str) -> Tuple[int, int, int]:
+    """Returns key identifying current state of a file (raises FileNotFoundError if it does not exist)."""
+    stat = os.stat(filepath)
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def _read_snapshot(cache_path: str) -> Optional[Tuple[Any, ...]]:
+    """Returns contents of snapshot file, or None if it does not exist or cannot be read."""
+    try:
+        with open(cache_path, mode="rb") as fp:
+            snapshot = marshal.load(fp)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return snapshot if isinstance(snapshot, tuple) and len(snapshot) == 4 else None
+
+
+def _write_snapshot(cache_path: str, snapshot: Tuple[Any, ...]) -> None:
+    """Writes snapshot file, skipping it if data cannot be serialized or file cannot be written."""
+    with contextlib.suppress(OSError, ValueError):
+        write_file_atomic(cache_path, marshal.dumps(snapshot))
@@ -0,0 +1,107 @@
+"""Provides pluggable JSON codecs used for all reef file I/O.
+
+The fastest available backend is detected at runtime: 'orjson' is used if it is installed (see 'fast' extra),
+otherwise the codec falls back to the standard library 'json' module. Backend can be forced by setting
+REEF_JSON_BACKEND environment variable to one of backend names (or 'auto').
+
+Codecs decode directly from bytes (skipping a separate text-decoding pass) and encode to UTF-8 bytes, either
+in pretty (2-space indented) form for files edited by users, or compact form for machine-owned files.
+Both backends produce the same pretty output for plain JSON data (strings, numbers, booleans, lists, dicts).
+"""
+
+import json
+import os
+from typing import Any, Dict, Optional, Type, Union
+
+JSON_BACKEND_ENV_VAR_NAME = "REEF_JSON_BACKEND"
+JSON_BACKEND_AUTO = "auto"
+
+
+class JsonCodec:
+    """Base class for JSON codecs."""
+
+    name = ""
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Returns object represented by given JSON document."""
+        raise NotImplementedError
+
+    def dumps(self, obj: Any, *, compact: bool = False) -> bytes:
+        """Returns UTF-8 encoded JSON document representing given object (indented, unless compact)."""
+        raise NotImplementedError
+
+
+class StdlibJsonCodec(JsonCodec):
+    """JSON codec using standard library 'json' module."""
+
+    name = "stdlib"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Returns object represented by given JSON document."""
+        return json.loads(data)
+
+    def dumps(self, obj: Any, *, compact: bool = False) -> bytes:
+        """Returns UTF-8 encoded JSON document representing given object (indented, unless compact)."""
+        if compact:
+            return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec using optional 'orjson' package."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Initializes codec (raises ImportError if 'orjson' package is not available)."""
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Returns object represented by given JSON document."""
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any, *, compact: bool = False) -> bytes:
+        """Returns UTF-8 encoded JSON document representing given object (indented, unless compact)."""
+        return self._orjson.dumps(obj) if compact else self._orjson.dumps(obj, option=self._orjson.OPT_INDENT_2)
+
+
+# listed in order of preference
+JSON_CODEC_TYPES: Dict[str, Type[JsonCodec]] = {
+    OrjsonCodec.name: OrjsonCodec,
+    StdlibJsonCodec.name: StdlibJsonCodec,
+}
+
+_current_codec: Optional[JsonCodec] = None
+
+
+def get_json_codec() -> JsonCodec:
+    """Returns JSON codec currently used by reef (selected on first use)."""
+    global _current_codec
+    if _current_codec is None:
+        _current_codec = create_json_codec(os.environ.get(JSON_BACKEND_ENV_VAR_NAME, JSON_BACKEND_AUTO))
+    return _current_codec
+
+
+def set_json_codec(codec: Union[JsonCodec, str, None]) -> JsonCodec:
+    """Sets JSON codec used by reef, given as codec object or backend name (None resets to automatic selection)."""
+    global _current_codec
+    _current_codec = codec if isinstance(codec, JsonCodec) or codec is None else create_json_codec(codec)
+    return get_json_codec()
+
+
+def create_json_codec(backend: str = JSON_BACKEND_AUTO) -> JsonCodec:
+    """Creates JSON codec for given backend name, or the first available one if backend is 'auto'."""
+    if backend == JSON_BACKEND_AUTO:
+        for codec_type in JSON_CODEC_TYPES.values():
+            try:
+                return codec_type()
+            except ImportError:
+                continue
+    if backend not in JSON_CODEC_TYPES:
+        raise ValueError(
+            f"JSON backend '{backend}' is not supported "
+            + f"(supported values include: {', '.join([JSON_BACKEND_AUTO, *JSON_CODEC_TYPES])} )."
+        )
+    return JSON_CODEC_TYPES[backend]()
@@ -0,0 +1,85 @@
+"""Provides helpers that keep CLI startup fast by deferring imports and loading of state until they are needed.
+
+- LazyGroup - click group with subcommands imported only when they are dispatched to (or listed in help),
+- LazyContextObject - dictionary used as click context object, with values computed by registered loaders
+  on first access (e.g. configuration or repositories, which are not needed by every command).
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+import click
+
+
+class LazyGroup(click.Group):
+    """Click group with lazily imported subcommands.
+
+    Arguments (in addition to click.Group ones):
+
+    - lazy_subcommands (mapping) - maps subcommand names to 'module.path:attribute' import paths of command
+      objects; relative module paths (starting with '.') are resolved against 'package' argument,
+    - package (str) - package used to resolve relative import paths (usually __package__ of the caller).
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: Optional[Mapping[str, str]] = None,
+        package: Optional[str] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initializes group with lazily imported subcommands."""
+        super().__init__(*args, **kwargs)
+        self._lazy_subcommands: Dict[str, str] = dict(lazy_subcommands or {})
+        self._package = package
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """Returns sorted names of all subcommands (without importing lazy ones)."""
+        return sorted([*super().list_commands(ctx), *self._lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Returns subcommand with given name, importing it if it is a lazy one."""
+        if cmd_name in self._lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        """Imports lazy subcommand and registers it as a regular one."""
+        module_name, _, attribute_name = self._lazy_subcommands[cmd_name].partition(":")
+        command = getattr(importlib.import_module(module_name, self._package), attribute_name)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"Lazy subcommand '{cmd_name}' of '{self.name}' is not a click command.")
+        del self._lazy_subcommands[cmd_name]
+        self.add_command(command, cmd_name)
+        return command
+
+
+class LazyContextObject(dict):
+    """Dictionary with values computed on first access by loaders registered for their keys.
+
+    Loader is called with the object itself (so it can use other, possibly lazy, values) and its result is stored,
+    so each loader is called at most once. Explicitly assigned values take precedence over loaders.
+    Note that 'get' and 'in' do not trigger loaders, only item access does.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initializes dictionary (with the same arguments as dict) without any loaders."""
+        super().__init__(*args, **kwargs)
+        self._loaders: Dict[Any, Callable[[LazyContextObject], Any]] = {}
+
+    def set_loader(self, key: Any, loader: Callable[["LazyContextObject"], Any]) -> None:
+        """Registers loader computing value for given key on first access."""
+        self._loaders[key] = loader
+
+    def is_loaded(self, key: Any) -> bool:
+        """Checks whether value for given key was already assigned or computed."""
+        return key in self
+
+    def __missing__(self, key: Any) -> Any:
+        """Computes value for given key using its loader."""
+        loader = self._loaders.get(key)
+        if loader is None:
+            raise KeyError(key)
+        value = loader(self)
+        self[key] = value
+        return value
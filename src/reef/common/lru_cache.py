@@ -0,0 +1,91 @@
+"""Provides bounded mapping with least-recently-used eviction policy and usage statistics."""
+
+from collections import OrderedDict
+from typing import Callable, Generic, NamedTuple, Optional, TypeVar
+
+_Key = TypeVar("_Key")
+_Value = TypeVar("_Value")
+
+
+class CacheStats(NamedTuple):
+    """Usage statistics of a cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+    maxsize: int
+
+
+class LruCache(Generic[_Key, _Value]):
+    """Mapping that holds at most 'maxsize' entries, evicting the least recently used ones when it is full.
+
+    Entries can be validated on access (see get), so stale ones are dropped instead of being returned.
+    Counts hits, misses, evictions (due to size limit) and invalidations (due to failed validation).
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initializes empty cache with given maximum number of entries."""
+        if not isinstance(maxsize, int) or isinstance(maxsize, bool) or maxsize < 1:
+            raise ValueError("Cache 'maxsize' must be a positive integer.")
+        self._entries: OrderedDict[_Key, _Value] = OrderedDict()
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of entries held in the cache."""
+        return self._maxsize
+
+    @property
+    def stats(self) -> CacheStats:
+        """Current usage statistics of the cache."""
+        return CacheStats(self._hits, self._misses, self._evictions, self._invalidations, len(self), self._maxsize)
+
+    def __len__(self) -> int:
+        """Returns number of entries in the cache."""
+        return len(self._entries)
+
+    def __contains__(self, key: _Key) -> bool:
+        """Checks whether cache has entry for given key (does not affect entry order or statistics)."""
+        return key in self._entries
+
+    def get(self, key: _Key, is_valid: Optional[Callable[[_Value], bool]] = None) -> Optional[_Value]:
+        """Returns value cached for given key and marks it as most recently used, or None if there is none.
+
+        If 'is_valid' is given and returns False for cached value, entry is removed and None is returned.
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self._misses += 1
+            return None
+        if is_valid is not None and not is_valid(value):
+            del self._entries[key]
+            self._invalidations += 1
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def put(self, key: _Key, value: _Value) -> None:
+        """Stores value for given key as most recently used, evicting the least recently used entry if needed."""
+        if value is None:
+            raise ValueError("Cached value cannot be None.")
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def pop(self, key: _Key) -> Optional[_Value]:
+        """Removes entry for given key and returns its value (or None if there was no such entry)."""
+        return self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes all entries (statistics are kept)."""
+        self._entries.clear()
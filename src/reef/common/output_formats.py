@@ -0,0 +1,93 @@
+"""Provides writers streaming machine-readable records (e.g. one per project) in supported output formats."""
+
+import json
+from typing import Any, Iterable, Iterator, Mapping, TextIO, Tuple
+
+OUTPUT_FORMAT_TEXT = "text"
+OUTPUT_FORMAT_JSON = "json"
+OUTPUT_FORMAT_JSONL = "jsonl"
+OUTPUT_FORMAT_TSV = "tsv"
+
+OUTPUT_FORMATS = (OUTPUT_FORMAT_TEXT, OUTPUT_FORMAT_JSON, OUTPUT_FORMAT_JSONL, OUTPUT_FORMAT_TSV)
+MACHINE_READABLE_OUTPUT_FORMATS = (OUTPUT_FORMAT_JSON, OUTPUT_FORMAT_JSONL, OUTPUT_FORMAT_TSV)
+
+_TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def write_records(
+    stream: TextIO, records: Iterable[Mapping[str, Any]], output_format: str, *, key: str = "name"
+) -> None:
+    """Writes records to text stream in given machine-readable format, one record at a time.
+
+    Supported formats:
+
+    - json - single JSON array with one record per line,
+    - jsonl - one JSON object per line,
+    - tsv - one 'key<TAB>path<TAB>value' line per (nested) field of each record, where 'key' is value of
+      the record field given by 'key' argument (so records are identified without knowing their fields upfront).
+    """
+    if output_format == OUTPUT_FORMAT_JSON:
+        write_json_records(stream, records)
+    elif output_format == OUTPUT_FORMAT_JSONL:
+        write_jsonl_records(stream, records)
+    elif output_format == OUTPUT_FORMAT_TSV:
+        write_tsv_records(stream, records, key=key)
+    else:
+        raise ValueError(
+            f"Output format '{output_format}' is not supported "
+            + f"(supported formats include: {', '.join(MACHINE_READABLE_OUTPUT_FORMATS)} )."
+        )
+
+
+def write_json_records(stream: TextIO, records: Iterable[Mapping[str, Any]]) -> None:
+    """Writes records as JSON array, serializing and writing records one by one."""
+    separator = "[\n"
+    for record in records:
+        stream.write(separator)
+        stream.write(_dumps(record))
+        separator = ",\n"
+    stream.write("[]\n" if separator == "[\n" else "\n]\n")
+
+
+def write_jsonl_records(stream: TextIO, records: Iterable[Mapping[str, Any]]) -> None:
+    """Writes records as JSON lines (one compact JSON object per line)."""
+    for record in records:
+        stream.write(_dumps(record))
+        stream.write("\n")
+
+
+def write_tsv_records(stream: TextIO, records: Iterable[Mapping[str, Any]], *, key: str = "name") -> None:
+    """Writes records as tab-separated 'key<TAB>path<TAB>value' lines (with header line)."""
+    stream.write(f"{key}\tpath\tvalue\n")
+    for record in records:
+        record_key = _tsv_value(record.get(key))
+        for path, value in iter_flat_items(record):
+            stream.write(f"{record_key}\t{_tsv_value(path)}\t{_tsv_value(value)}\n")
+
+
+def iter_flat_items(record: Mapping[str, Any], prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    """Yields (path, value) pairs for all non-mapping values of nested record, with dot-separated paths."""
+    for name, value in record.items():
+        if isinstance(value, Mapping):
+            yield from iter_flat_items(value, f"{prefix}{name}.")
+        else:
+            yield f"{prefix}{name}", value
+
+
+### IMPLEMENTATION DETAILS:
+
+
+def _dumps(value: Any) -> str:
+    """Serializes single record (or value) as compact JSON."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def _tsv_value(value: Any) -> str:
+    """Returns value formatted as TSV field (JSON-like literals for non-strings, escaped special characters)."""
+    if isinstance(value, str):
+        return value.translate(_TSV_ESCAPES)
+    if value is None or isinstance(value, (bool, int, float)):
+        return json.dumps(value)
+    if isinstance(value, (list, tuple, dict)):
+        return _dumps(value).translate(_TSV_ESCAPES)
+    return str(value).translate(_TSV_ESCAPES)
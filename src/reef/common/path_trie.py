@@ -0,0 +1,118 @@
+"""Provides prefix tree of file system paths, answering "which registered path contains this one" queries.
+
+Paths are normalized (made absolute, with redundant separators and up-level references collapsed and case
+normalized on case-insensitive platforms) and split into components, so lookups take time proportional to depth
+of the queried path, regardless of number of registered paths. Normalization does not access the file system
+(symbolic links are not resolved).
+"""
+
+import os
+from typing import Any, Dict, List, Optional
+
+
+def normalize_path(path: str) -> str:
+    """Returns absolute, normalized form of given path, as used for path comparison."""
+    return os.path.normcase(os.path.abspath(os.fspath(path)))
+
+
+def split_path(path: str) -> List[str]:
+    """Returns components of normalized form of given path (starting with drive on platforms that use them)."""
+    drive, rest = os.path.splitdrive(normalize_path(path))
+    parts = [part for part in rest.split(os.sep) if part]
+    return [drive, *parts] if drive else parts
+
+
+class PathTrie:
+    """Prefix tree mapping file system paths to values.
+
+    Each path may be associated with multiple values; lookups return the one added most recently.
+    """
+
+    __slots__ = ("_root", "_count")
+
+    def __init__(self) -> None:
+        """Initializes empty tree."""
+        self._root = _PathTrieNode()
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Returns number of (path, value) entries in the tree."""
+        return self._count
+
+    def add(self, path: str, value: Any) -> None:
+        """Associates value with given path."""
+        node = self._root
+        for part in split_path(path):
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = _PathTrieNode()
+            node = child
+        node.values.append(value)
+        self._count += 1
+
+    def remove(self, path: str, value: Any) -> bool:
+        """Removes association of value with given path (returns False if there was no such association)."""
+        nodes = [self._root]
+        parts = split_path(path)
+        for part in parts:
+            child = nodes[-1].children.get(part)
+            if child is None:
+                return False
+            nodes.append(child)
+        values = nodes[-1].values
+        for i in range(len(values) - 1, -1, -1):
+            if values[i] == value:
+                del values[i]
+                break
+        else:
+            return False
+        self._count -= 1
+
+        # prune nodes that do not lead to any values anymore
+        for part, parent, node in zip(reversed(parts), reversed(nodes[:-1]), reversed(nodes[1:])):
+            if node.values or node.children:
+                break
+            del parent.children[part]
+        return True
+
+    def clear(self) -> None:
+        """Removes all entries from the tree."""
+        self._root = _PathTrieNode()
+        self._count = 0
+
+    def get(self, path: str) -> Optional[Any]:
+        """Returns value associated with exactly given path (or None)."""
+        node = self._root
+        for part in split_path(path):
+            child = node.children.get(part)
+            if child is None:
+                return None
+            node = child
+        return node.values[-1] if node.values else None
+
+    def find_longest_prefix(self, path: str) -> Optional[Any]:
+        """Returns value associated with the longest registered path that is equal to or contains given path."""
+        node = self._root
+        result = node.values[-1] if node.values else None
+        for part in split_path(path):
+            child = node.children.get(part)
+            if child is None:
+                break
+            node = child
+            if node.values:
+                result = node.values[-1]
+        return result
+
+
+### IMPLEMENTATION DETAILS:
+
+
+class _PathTrieNode:
+    """Single node of PathTrie, corresponding to a path component."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initializes node without children and values."""
+        self.children: Dict[str, _PathTrieNode] = {}
+        self.values: List[Any] = []
@@ -1,12 +1,86 @@
 """Provides base class for objects representing settings data."""
 
-from typing import Any, Iterable, Tuple
-
+from functools import lru_cache
+from types import MemberDescriptorType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
+
+_Settings = TypeVar("_Settings", bound="SettingsBase")
+
+_SETTINGS_PATH_CACHE_SIZE = 1024
 _SETTINGS_STR_SPACES_PER_INDENT_LEVEL = 2
 _SETTINGS_STR_LIST_POINT_CHARACTER = "-"
 _SETTINGS_STR_VALUE_SEPARATOR = ":"
 
 
+class _PropertyInfo(NamedTuple):
+    """Metadata of a single public @property defined by a settings class."""
+
+    name: str
+    is_readonly: bool
+    field_name: str
+    has_slot: bool
+
+
+class _CompiledPath(NamedTuple):
+    """Property path split into names of nested objects (with their full path prefixes) and final property name."""
+
+    parents: Tuple[str, ...]
+    prefixes: Tuple[str, ...]
+    leaf: str
+
+
+def _collect_properties(cls: type) -> Dict[str, _PropertyInfo]:
+    """Builds table of all public @property fields of given class (including inherited ones).
+
+    Properties are listed in the same (alphabetical) order as they are reported by dir().
+    Names starting with underscore ('_') are filtered out as private.
+    """
+    result = {}
+    for name in dir(cls):
+        if name.startswith("_"):
+            continue
+        attr = getattr(cls, name, None)
+        if isinstance(attr, property):
+            field_name = "_" + name
+            has_slot = isinstance(getattr(cls, field_name, None), MemberDescriptorType)
+            result[name] = _PropertyInfo(name, attr.fset is None, field_name, has_slot)
+    return result
+
+
+@lru_cache(maxsize=None)
+def _get_line_header(indent_level: int) -> str:
+    """Returns initial part of line for string representing a property at given indent level."""
+    return f" {'':^{indent_level * _SETTINGS_STR_SPACES_PER_INDENT_LEVEL}}{_SETTINGS_STR_LIST_POINT_CHARACTER}"
+
+
+def _is_field_referenced(prop: property, field_name: str) -> bool:
+    """Checks whether getter or setter of given property refers to attribute with given name."""
+    return any(
+        field_name in accessor.__code__.co_names
+        for accessor in (prop.fget, prop.fset, prop.fdel)
+        if accessor is not None and hasattr(accessor, "__code__")
+    )
+
+
 class SettingsBase:
     """A common base class for settings objects.
 
@@ -17,20 +91,92 @@ class SettingsBase:
     - handling paths for nested objects and arrays,
     - printing contents of settings,
     - facilities to simplify data serialization and deserialization.
+
+    Properties of each subclass are discovered only once, when the class is defined,
+    and stored in a per-class table. Properties attached to a class after its definition
+    are therefore not handled by the string-keyed accessors.
+
+    Each class can provide a shared, read-only default instance with all properties unset
+    (see 'shared_default'), that can be returned for unset nested objects without allocating
+    new ones. Setting or unsetting values by path replaces such shared default met on the way
+    with a new instance owned by its parent (copy-on-write).
     """
 
+    __slots__ = ()
+
+    __properties: ClassVar[Dict[str, _PropertyInfo]] = {}
+    _shared_default: ClassVar[Optional["SettingsBase"]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Builds property table for newly defined settings class."""
+        super().__init_subclass__(**kwargs)
+        cls.__properties = _collect_properties(cls)
+
+    @classmethod
+    def shared_default(cls) -> "SettingsBase":
+        """Returns shared, read-only instance of this class with all properties unset (created on first use)."""
+        instance = cls.__dict__.get("_shared_default")
+        if instance is None:
+            instance = cls()
+            cls._shared_default = instance
+        return instance
+
+    def is_shared_default(self) -> bool:
+        """Checks whether this object is a shared, read-only default instance of its class."""
+        return self is self._shared_default
+
+    if TYPE_CHECKING:
+        # methods generated for classes declared with reef.common.settings_schema (declared here, so that
+        # type checkers know their signatures, as generated code is not visible to them)
+
+        def __init__(self, obj: Optional[Mapping[str, Any]] = None, **overrides: Any) -> None: ...
+
+        @classmethod
+        def from_dict(cls: Type[_Settings], obj: Mapping[str, Any]) -> _Settings: ...
+
+        @classmethod
+        def from_validated_dict(cls: Type[_Settings], obj: Mapping[str, Any]) -> _Settings: ...
+
+        def to_dict(self) -> Optional[Dict[str, Any]]: ...
+
+        def validate(self) -> None: ...
+
     def get(self, path: str) -> Any:
         """Returns value associated with given property path."""
-        path_tail, child = self.__expand_path(path)
-        return self.__get_value(path) if path_tail is None else child.get(path_tail)
+        compiled = self.__compile_path(path)
+        return self.__resolve_parent(compiled).__get_value(compiled.leaf)
 
     def set(self, path: str, value: Any) -> None:
         """Sets value of property associated with given path."""
-        path_tail, child = self.__expand_path(path)
-        if path_tail is None:
-            self.__set_value(path, value)
-        else:
-            child.set(path_tail, value)
+        compiled = self.__compile_path(path)
+        self.__resolve_parent(compiled, for_update=True).__set_value(compiled.leaf, value)
+
+    def get_many(self, paths: Iterable[str]) -> Dict[str, Any]:
+        """Returns dictionary with values associated with each of given property paths.
+
+        Nested objects shared by several paths (e.g. 'temp' in 'temp.version' and 'temp.build.mode')
+        are resolved only once.
+        """
+        resolved: Dict[str, SettingsBase] = {}
+        result = {}
+        for path in paths:
+            compiled = self.__compile_path(path)
+            result[path] = self.__resolve_parent(compiled, resolved).__get_value(compiled.leaf)
+        return result
+
+    def set_many(self, values: Mapping[str, Any]) -> None:
+        """Sets values of properties associated with each of given paths (in mapping order).
+
+        Nested objects shared by several paths are resolved only once, unless they are replaced
+        by one of the preceding assignments.
+        """
+        resolved: Dict[str, SettingsBase] = {}
+        for path, value in values.items():
+            compiled = self.__compile_path(path)
+            self.__resolve_parent(compiled, resolved, for_update=True).__set_value(compiled.leaf, value)
+            if path in resolved:
+                for prefix in [prefix for prefix in resolved if prefix == path or prefix.startswith(path + ".")]:
+                    del resolved[prefix]
 
     def is_set(self, path: str) -> bool:
         """Checks whether property given by name is set.
@@ -38,19 +184,18 @@ class SettingsBase:
         Note, that property is not set when the value of field associated with that property
         (i.e. with '_' prefix) is None. This does not account for any default values.
         """
-        path_tail, child = self.__expand_path(path)
-        return (not self.__is_property_unset(path)) if path_tail is None else child.is_set(path_tail)
+        compiled = self.__compile_path(path)
+        parent = self.__resolve_parent(compiled)
+        parent.__assert_has_property(compiled.leaf)
+        return not parent.__is_property_unset(compiled.leaf)
 
     def unset(self, path: str) -> None:
         """Unsets value of property associated with given path."""
-        path_tail, child = self.__expand_path(path)
-        if path_tail is None:
-            self.__unset_value(path)
-        else:
-            child.unset(path_tail)
+        compiled = self.__compile_path(path)
+        self.__resolve_parent(compiled, for_update=True).__unset_value(compiled.leaf)
 
-    def to_string(self, *, indent_level: int = 0, skip_unset: bool = False, recurse: bool = True) -> str:
-        """Returns stringified representation of all object properties and its values.
+    def iter_lines(self, *, indent_level: int = 0, skip_unset: bool = False, recurse: bool = True) -> Iterator[str]:
+        """Yields lines (without line endings) of stringified representation of all object properties and its values.
 
         Arguments:
 
@@ -58,7 +203,47 @@ class SettingsBase:
         - skip_unset (bool) - if true, unset properties (with value None) are not stringified at all,
         - recurse (bool) - if true, nested objects are also expanded and stringified.
         """
-        return self._str_properties(indent_level, skip_unset, recurse)
+        return self.__iter_property_lines(indent_level, skip_unset, recurse)
+
+    def write_to(
+        self, stream: TextIO, *, indent_level: int = 0, skip_unset: bool = False, recurse: bool = True
+    ) -> None:
+        """Writes stringified representation of all object properties and its values to given text stream.
+
+        Lines are written one by one as they are produced, see 'iter_lines' for description of arguments.
+        """
+        for line in self.__iter_property_lines(indent_level, skip_unset, recurse):
+            stream.write(line)
+            stream.write("\n")
+
+    def to_string(self, *, indent_level: int = 0, skip_unset: bool = False, recurse: bool = True) -> str:
+        """Returns stringified representation of all object properties and its values.
+
+        See 'iter_lines' for description of arguments.
+        """
+        return "".join(f"{line}\n" for line in self.__iter_property_lines(indent_level, skip_unset, recurse))
+
+    def iter_items(self, *, skip_unset: bool = False) -> Iterator[Tuple[str, Any]]:
+        """Yields (path, value) pairs for all (non-object) properties, including those of nested objects.
+
+        Paths use the same dot-separated format as 'get'. If skip_unset is true, unset properties
+        (with value None) are skipped, together with nested objects they hold.
+        """
+        return self.__iter_property_items("", skip_unset)
+
+    def to_values_dict(self, *, skip_unset: bool = False) -> Dict[str, Any]:
+        """Returns nested dictionary with (effective) values of all properties, including those of nested objects.
+
+        Unlike serialization-oriented 'to_dict' of specific settings classes, it includes default values
+        of properties and read-only properties (unless skip_unset is true).
+        """
+        result = {}
+        for name in self.__properties:
+            if skip_unset and self.__is_property_unset(name):
+                continue
+            value = getattr(self, name)
+            result[name] = value.to_values_dict(skip_unset=skip_unset) if isinstance(value, SettingsBase) else value
+        return result
 
     def __str__(self):
         """Returns full string representation of a settings object."""
@@ -77,17 +262,14 @@ class SettingsBase:
 
         In addition, names starting with underscore ('_') are filtered out as private.
         """
-        try:
-            return False if name.startswith("_") else isinstance(getattr(type(self), name), property)
-        except AttributeError:
-            return False
+        return name in self.__properties
 
     def __is_property_readonly(self, name: str) -> bool:
         """Checks whether property given by name is read-only.
 
         Note, that property is read-only if it does not defie a setter.
         """
-        return getattr(type(self), name).fset is None
+        return self.__properties[name].is_readonly
 
     def __is_property_backed_by_field(self, name: str) -> bool:
         """Checks whether property given by name is backed by data member.
@@ -95,7 +277,8 @@ class SettingsBase:
         Note, that property is packed by data member if it defines a field with exactly
         the same ame as the property prefixed with an underscore ('_').
         """
-        return ("_" + name) in dir(self)
+        info = self.__properties[name]
+        return info.has_slot or hasattr(self, info.field_name)
 
     def __is_property_unset(self, name: str) -> bool:
         """Checks whether property given by name is unset.
@@ -103,77 +286,105 @@ class SettingsBase:
         Note, that property is unset when the value of field associated with that property
         (i.e. with '_' prefix) is None. This does not account for any default values.
         """
-        try:
-            return getattr(self, "_" + name) is None
-        except AttributeError:
-            return True
-
-    def __list_property_names(self) -> Iterable[str]:
-        """Returns iterable over stringified names of all fields marked as @property."""
-        return (name for name in dir(self) if self.__is_property(name))
-
-    def __get_line_header(self, indent_level: int) -> str:
-        """Returns initial part of line for string representing a property at given indent level."""
-        return f" {'':^{indent_level * _SETTINGS_STR_SPACES_PER_INDENT_LEVEL}}{_SETTINGS_STR_LIST_POINT_CHARACTER}"
-
-    def _str_properties(self, indent_level: int, skip_unset: bool, recurse: bool) -> str:
-        """Returns stringified representation of all object properties and its values.
-
-        Arguments:
-
-        - indent_level (int) - current level of indentation to be used for nested objects,
-        - skip_unset (bool) - if true, unset properties (with value None) are not stringified at all,
-        - recurse (bool) - if true, nested objects are also expanded and stringified.
-        """
-        result = ""
-        for property_name in self.__list_property_names():
-            result += f"{self.__str_property(property_name, indent_level, skip_unset, recurse)}\n"
-        return result
+        return getattr(self, self.__properties[name].field_name, None) is None
 
-    def __str_property(self, name: str, indent_level: int, skip_unset: bool, recurse: bool) -> str:
-        """Returns stringified representation of object property and its value.
+    def __iter_property_lines(self, indent_level: int, skip_unset: bool, recurse: bool) -> Iterator[str]:
+        """Yields lines of stringified representation of all object properties and its values.
 
         Arguments:
 
-        - name (string) - name of a property to be stringified,
         - indent_level (int) - current level of indentation to be used for nested objects,
         - skip_unset (bool) - if true, unset properties (with value None) are not stringified at all,
         - recurse (bool) - if true, nested objects are also expanded and stringified.
         """
-        if skip_unset and self.__is_property_unset(name):
-            return ""
-
-        value = getattr(self, name)
-        if isinstance(value, SettingsBase):
-            if recurse:
-                value_str = f"\n{value._str_properties(indent_level + 1, skip_unset, recurse)}"
+        header = _get_line_header(indent_level)
+        for name in self.__properties:
+            if skip_unset and self.__is_property_unset(name):
+                continue
+
+            value = getattr(self, name)
+            if isinstance(value, SettingsBase):
+                if recurse:
+                    yield f"{header} {name}{_SETTINGS_STR_VALUE_SEPARATOR}"
+                    yield from value.__iter_property_lines(indent_level + 1, skip_unset, recurse)
+                else:
+                    yield f"{header} {name}{_SETTINGS_STR_VALUE_SEPARATOR} <object '{type(value)}'>"
             else:
-                value_str = f"<object '{type(value)}'>"
-        else:
-            value_str = str(value)
-
-        return f"{self.__get_line_header(indent_level)} {name}{_SETTINGS_STR_VALUE_SEPARATOR} {value_str}"
+                yield f"{header} {name}{_SETTINGS_STR_VALUE_SEPARATOR} {value}"
+
+    def __iter_property_items(self, prefix: str, skip_unset: bool) -> Iterator[Tuple[str, Any]]:
+        """Yields (path, value) pairs for all (non-object) properties, with paths prefixed by given string."""
+        for name in self.__properties:
+            if skip_unset and self.__is_property_unset(name):
+                continue
+            value = getattr(self, name)
+            if isinstance(value, SettingsBase):
+                yield from value.__iter_property_items(f"{prefix}{name}.", skip_unset)
+            else:
+                yield f"{prefix}{name}", value
 
     def __assert_has_property(self, name: str) -> None:
         """Checks if property with given name is defined for object and throws if it does not."""
         if not self.__is_property(name):
             raise KeyError(f"No property '{name}' found in class '{type(self)}'")
 
-    def __expand_path(self, path: str) -> Tuple[str, Any]:
+    def __assert_not_shared_default(self) -> None:
+        """Checks if object is not a shared default instance and throws if it is."""
+        if self.is_shared_default():
+            raise RuntimeError(
+                f"Shared default object of class '{type(self)}' cannot be modified. "
+                + "Assign a new object to its parent property or modify it by path from its parent."
+            )
+
+    @classmethod
+    @lru_cache(maxsize=_SETTINGS_PATH_CACHE_SIZE)
+    def __compile_path(cls, path: str) -> _CompiledPath:
+        """Splits given property path once and caches the result (per class and path).
+
+        The first name in the path is validated against properties of given class, so that only paths
+        that can be valid are cached. Names on further levels depend on actual nested objects and are
+        validated while the path is being resolved.
+        """
+        tokens = path.split(".")
+        if tokens[0] not in cls.__properties:
+            raise KeyError(f"No property '{tokens[0]}' found in class '{cls}'")
+        prefixes = tuple(".".join(tokens[: i + 1]) for i in range(len(tokens) - 1))
+        return _CompiledPath(tuple(tokens[:-1]), prefixes, tokens[-1])
+
+    def __resolve_parent(
+        self,
+        compiled: _CompiledPath,
+        resolved: Optional[Dict[str, "SettingsBase"]] = None,
+        *,
+        for_update: bool = False,
+    ) -> "SettingsBase":
         """Helper function to recurse down the nested settings structure.
 
-        Given path returns either (1) None and None - when given object is the target item in the path,
-        or otherwise (2) tail of the path (without head) and nested settings object pointed by the head.
+        Given compiled path returns nested settings object that contains its final property. If dictionary
+        of already resolved objects is given, nested objects are looked up there by path prefix first,
+        and newly resolved ones are stored there. If path is resolved for update, shared default objects
+        on the way are replaced by new instances owned by their parents.
         """
-        if "." not in path:
-            self.__assert_has_property(path)
-            return None, None
-        tokens = path.split(".", 1)
-        self.__assert_has_property(tokens[0])
-        child = getattr(self, tokens[0])
+        node = self
+        for name, prefix in zip(compiled.parents, compiled.prefixes):
+            child = resolved.get(prefix) if resolved is not None else None
+            if child is None:
+                child = node.__get_child(name)
+                if for_update and child.is_shared_default():
+                    child = type(child)()
+                    node.__set_value(name, child)
+                if resolved is not None:
+                    resolved[prefix] = child
+            node = child
+        return node
+
+    def __get_child(self, name: str) -> "SettingsBase":
+        """Returns nested settings object held by property with given name (throws if there is none)."""
+        self.__assert_has_property(name)
+        child = getattr(self, name)
         if not isinstance(child, SettingsBase):
-            raise KeyError(f"Object '{tokens[0]}' contains no further nested properties.")
-        return tokens[1], child
+            raise KeyError(f"Object '{name}' contains no further nested properties.")
+        return child
 
     def __get_value(self, key: str) -> Any:
         """Returns value associated with given property name (key)."""
@@ -183,6 +394,7 @@ class SettingsBase:
     def __set_value(self, key: str, value: Any) -> None:
         """Sets value of property associated with given name (key)."""
         self.__assert_has_property(key)
+        self.__assert_not_shared_default()
         if self.__is_property_readonly(key):
             raise RuntimeError(f"Property '{key}' of class '{type(self)}' cannot be set. It is read-only.")
         return setattr(self, key, value)
@@ -190,12 +402,67 @@ class SettingsBase:
     def __unset_value(self, key: str) -> None:
         """Unsets value of property associated with given name (key)."""
         self.__assert_has_property(key)
+        self.__assert_not_shared_default()
         if self.__is_property_readonly(key):
             raise RuntimeError(f"Property '{key}' of class '{type(self)}' cannot be unset. It is read-only.")
         if not self.__is_property_backed_by_field(key):
-            field_name = "_" + key
+            field_name = self.__properties[key].field_name
             raise RuntimeError(
                 f"Property '{key}' of class '{type(self)}' cannot be unset."
                 + f"It is not backed by the standard '{field_name}' field."
             )
-        return setattr(self, "_" + key, None)
+        return setattr(self, self.__properties[key].field_name, None)
+
+
+_T = TypeVar("_T", bound=SettingsBase)
+
+
+@overload
+def settings_slots(cls: Type[_T], *, extra_fields: Iterable[str] = ()) -> Type[_T]: ...
+
+
+@overload
+def settings_slots(cls: None = None, *, extra_fields: Iterable[str] = ()) -> Callable[[Type[_T]], Type[_T]]: ...
+
+
+def settings_slots(
+    cls: Optional[Type[_T]] = None, *, extra_fields: Iterable[str] = ()
+) -> Union[Type[_T], Callable[[Type[_T]], Type[_T]]]:
+    """Class decorator that re-creates given settings class so that it stores its fields in __slots__.
+
+    Slots are derived from declared properties: a slot is created for the standard backing field
+    (i.e. property name with '_' prefix) of every property whose getter, setter or deleter refers to it.
+    Any other private fields used by the class have to be listed in 'extra_fields'.
+
+    Note, that instances lose their per-instance '__dict__' only when all settings classes they derive from
+    use slots as well. Since the class is re-created, its methods must not use argument-less super().
+
+    Can be used either as '@settings_slots' or '@settings_slots(extra_fields=[...])'.
+    """
+
+    def wrap(cls: Type[_T]) -> Type[_T]:
+        if "__slots__" in cls.__dict__:
+            raise TypeError(f"Class '{cls}' already defines its own __slots__.")
+
+        inherited: Set[str] = set()
+        for base in cls.__mro__[1:]:
+            base_slots = getattr(base, "__slots__", ())
+            inherited.update((base_slots,) if isinstance(base_slots, str) else base_slots)
+
+        fields = [
+            "_" + name
+            for name in dir(cls)
+            if not name.startswith("_")
+            and isinstance(getattr(cls, name, None), property)
+            and _is_field_referenced(getattr(cls, name), "_" + name)
+        ]
+        slots = tuple(dict.fromkeys(field for field in (*fields, *extra_fields) if field not in inherited))
+
+        cls_dict = {key: value for key, value in cls.__dict__.items() if key not in ("__dict__", "__weakref__")}
+        cls_dict["__slots__"] = slots
+        metaclass: Any = type(cls)
+        slotted_cls = cast(Type[_T], metaclass(cls.__name__, cls.__bases__, cls_dict))
+        slotted_cls.__qualname__ = cls.__qualname__
+        return slotted_cls
+
+    return wrap if cls is None else wrap(cls)
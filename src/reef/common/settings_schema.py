@@ -0,0 +1,333 @@
+"""Provides declarative field schema for settings objects.
+
+Settings classes declare their properties as SettingsField objects, and the settings_schema class decorator
+generates specialised, straight-line code for them once per class:
+
+- getter and validating setter of each property (backed by standard '_'-prefixed field),
+- constructor accepting dictionary with data (e.g. loaded from JSON) and keyword overrides,
+- 'from_dict', 'from_validated_dict', 'to_dict' and 'validate' methods.
+
+Schema key of a settings class (see get_settings_schema_key) changes whenever validation rules of its fields change,
+so data validated earlier (e.g. cached by reef.common.json_cache) can be trusted only if schema key is the same.
+
+Unset nested settings properties return shared default instance of their class (see SettingsBase.shared_default),
+so reading sparse settings does not allocate, and generated setters refuse to modify such shared instances.
+"""
+
+import hashlib
+import re
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Type, TypeVar, Union, cast, overload
+
+from .settings_base import SettingsBase, settings_slots
+
+_EMPTY_DATA: Any = MappingProxyType({})
+_RESERVED_FIELD_NAMES = frozenset(["self", "obj", "v", "result"])
+_TYPE_DESCRIPTIONS = {str: "a string", bool: "a boolean", int: "an integer", float: "a number"}
+
+_schema_keys: Dict[type, str] = {}
+
+
+class SettingsField:
+    """Declaration of a single settings property backed by standard '_'-prefixed field.
+
+    Arguments:
+
+    - value_type (type) - type of values, nested settings classes are converted from dictionaries,
+    - default (Any) - value returned when property is unset (if choices are given, defaults to the first one),
+    - default_factory (callable) - alternative to default, called with settings object to compute default value,
+    - choices (sequence) - list of values allowed for the property,
+    - required (bool) - if true, property cannot be None,
+    - allow_empty (bool) - if true, empty strings are allowed,
+    - pattern (str) - regular expression that (string) values have to fully match,
+    - pattern_hint (str) - human-readable format used in error message when pattern is not matched,
+    - doc (str) - property docstring.
+    """
+
+    def __init__(
+        self,
+        value_type: type = str,
+        *,
+        default: Any = None,
+        default_factory: Optional[Callable[[Any], Any]] = None,
+        choices: Optional[Sequence[Any]] = None,
+        required: bool = False,
+        allow_empty: bool = False,
+        pattern: Optional[str] = None,
+        pattern_hint: Optional[str] = None,
+        doc: Optional[str] = None,
+    ) -> None:
+        """Initializes field declaration (its name is assigned when owner class is created)."""
+        if default is not None and default_factory is not None:
+            raise ValueError("Only one of 'default' and 'default_factory' can be given.")
+        self.name: str = ""
+        self.value_type = value_type
+        self.default = choices[0] if default is None and default_factory is None and choices else default
+        self.default_factory = default_factory
+        self.choices = tuple(choices) if choices is not None else None
+        self.required = required
+        self.allow_empty = allow_empty
+        self.pattern = pattern
+        self.pattern_hint = pattern_hint if pattern_hint is not None else pattern
+        self.doc = doc
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Assigns name of the property being declared."""
+        self.name = name
+
+    @property
+    def is_nested(self) -> bool:
+        """Indicates whether field holds nested settings object."""
+        return isinstance(self.value_type, type) and issubclass(self.value_type, SettingsBase)
+
+    if TYPE_CHECKING:
+        # declarations are replaced with generated properties by settings_schema, so for type checkers
+        # they behave as attributes of any type
+
+        def __get__(self, obj: Any, objtype: Any = None) -> Any: ...
+
+        def __set__(self, obj: Any, value: Any) -> None: ...
+
+
+_T = TypeVar("_T", bound=SettingsBase)
+
+
+@overload
+def settings_schema(cls: Type[_T], *, slots: bool = False) -> Type[_T]: ...
+
+
+@overload
+def settings_schema(cls: None = None, *, slots: bool = False) -> Callable[[Type[_T]], Type[_T]]: ...
+
+
+def settings_schema(
+    cls: Optional[Type[_T]] = None, *, slots: bool = False
+) -> Union[Type[_T], Callable[[Type[_T]], Type[_T]]]:
+    """Class decorator that generates properties and (de)serialization code from SettingsField declarations.
+
+    Fields declared in base classes (that use settings_schema too) are included in generated constructor
+    and methods. Methods explicitly defined in the class body are not overwritten. If 'slots' is true,
+    the generated class uses __slots__ (see settings_slots).
+
+    Can be used either as '@settings_schema' or '@settings_schema(slots=True)'.
+    """
+
+    def wrap(cls: Type[_T]) -> Type[_T]:
+        own_fields = {name: value for name, value in cls.__dict__.items() if isinstance(value, SettingsField)}
+        for name in own_fields:
+            if name in _RESERVED_FIELD_NAMES:
+                raise ValueError(f"Settings field in class '{cls}' cannot be named '{name}'.")
+        fields: Dict[str, SettingsField] = {}
+        for base in reversed(cls.__mro__[1:]):
+            fields.update(base.__dict__.get("_settings_fields", {}))
+        fields.update(own_fields)
+
+        namespace: Dict[str, Any] = {"_EMPTY_DATA": _EMPTY_DATA}
+        for field in fields.values():
+            namespace[f"_type_{field.name}"] = field.value_type
+            if field.default_factory is not None:
+                namespace[f"_default_{field.name}"] = field.default_factory
+            elif field.default is None and field.is_nested:
+                namespace[f"_default_{field.name}"] = cast(Type[SettingsBase], field.value_type).shared_default()
+            else:
+                namespace[f"_default_{field.name}"] = field.default
+            if field.choices is not None:
+                namespace[f"_choices_{field.name}"] = frozenset(field.choices)
+            if field.pattern is not None:
+                namespace[f"_pattern_{field.name}"] = re.compile(field.pattern)
+
+        cls_dict = {key: value for key, value in cls.__dict__.items() if key not in own_fields}
+        for field in own_fields.values():
+            cls_dict[field.name] = _make_property(field, namespace)
+        generated: Dict[str, Any] = {
+            "__init__": _make_init(fields.values(), namespace),
+            "to_dict": _make_to_dict(fields.values(), namespace),
+            "validate": _make_validate(fields.values(), namespace),
+            "from_dict": classmethod(_from_dict),
+            "from_validated_dict": classmethod(_make_from_validated_dict(fields.values(), namespace)),
+        }
+        for name, function in generated.items():
+            if name not in cls_dict:
+                cls_dict[name] = function
+        cls_dict["_settings_fields"] = MappingProxyType(fields)
+
+        metaclass: Any = type(cls)
+        schema_cls = cast(Type[_T], metaclass(cls.__name__, cls.__bases__, cls_dict))
+        schema_cls.__qualname__ = cls.__qualname__
+        for name in ("__init__", "to_dict", "validate"):
+            generated[name].__qualname__ = f"{cls.__qualname__}.{name}"
+        generated["from_validated_dict"].__func__.__qualname__ = f"{cls.__qualname__}.from_validated_dict"
+        return settings_slots(schema_cls) if slots else schema_cls
+
+    return wrap if cls is None else wrap(cls)
+
+
+def get_settings_schema_key(cls: Type[SettingsBase]) -> str:
+    """Returns key identifying validation rules of fields of given settings class (including nested classes).
+
+    Note, that it does not account for validation code written by hand (e.g. in explicitly defined 'validate').
+    """
+    key = _schema_keys.get(cls)
+    if key is None:
+        key = hashlib.sha256(repr(_schema_description(cls)).encode()).hexdigest()
+        _schema_keys[cls] = key
+    return key
+
+
+### IMPLEMENTATION DETAILS:
+
+
+def _schema_description(cls: type) -> Any:
+    """Returns description of validation rules of fields of given settings class (with nested classes expanded)."""
+    fields: Dict[str, SettingsField] = getattr(cls, "_settings_fields", {})
+    return [
+        (
+            field.name,
+            _schema_description(field.value_type) if field.is_nested else field.value_type.__name__,
+            repr(field.default) if field.default_factory is None else "<factory>",
+            field.choices,
+            field.required,
+            field.allow_empty,
+            field.pattern,
+        )
+        for field in fields.values()
+    ]
+
+
+def _from_dict(cls: Type[Any], obj: Dict[str, Any]) -> SettingsBase:
+    """Constructs settings object from dictionary with its data (e.g. loaded from JSON)."""
+    return cls(obj)
+
+
+def _compile(name: str, lines: List[str], namespace: Dict[str, Any]) -> Callable[..., Any]:
+    """Compiles source of a single generated function and returns it."""
+    local_namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace, local_namespace)
+    return local_namespace[name]
+
+
+def _indent(lines: List[str], level: int = 1) -> List[str]:
+    """Indents lines of generated source."""
+    return [("    " * level) + line for line in lines]
+
+
+def _check_lines(field: SettingsField, var: str) -> List[str]:
+    """Returns lines of generated code validating given variable (which is not None) against field declaration."""
+    name = field.name
+    if field.is_nested:
+        message = f"'{name}' property must be an instance of {field.value_type.__name__} class."
+    else:
+        type_description = _TYPE_DESCRIPTIONS.get(field.value_type, f"of type '{field.value_type.__name__}'")
+        message = f"'{name}' property must be {type_description}."
+    lines = [f"if not isinstance({var}, _type_{name}):", f"    raise ValueError({message!r})"]
+
+    if field.value_type is str and not field.allow_empty:
+        message = f"'{name}' property cannot be an empty string."
+        lines += [f"if not {var}:", f"    raise ValueError({message!r})"]
+    if field.choices is not None:
+        prefix = f"'{name}' cannot be '"
+        suffix = f"' (supported values include: {', '.join(str(choice) for choice in field.choices)} )."
+        lines += [
+            f"if {var} not in _choices_{name}:",
+            f"    raise ValueError({prefix!r} + str({var}) + {suffix!r})",
+        ]
+    if field.pattern is not None:
+        message = f"'{name}' must have proper format: '{field.pattern_hint}'."
+        lines += [f"if _pattern_{name}.fullmatch({var}) is None:", f"    raise ValueError({message!r})"]
+    return lines
+
+
+def _value_lines(field: SettingsField, var: str) -> List[str]:
+    """Returns lines of generated code validating given (possibly None) variable against field declaration."""
+    if field.required:
+        message = f"'{field.name}' property cannot be None."
+        return [f"if {var} is None:", f"    raise ValueError({message!r})", *_check_lines(field, var)]
+    return [f"if {var} is not None:", *_indent(_check_lines(field, var))]
+
+
+def _make_property(field: SettingsField, namespace: Dict[str, Any]) -> property:
+    """Generates property with getter and validating setter for given field."""
+    name = field.name
+    getter_lines = [f"def {name}(self):", f"    v = self._{name}"]
+    if field.default_factory is not None:
+        getter_lines.append(f"    return v if v is not None else _default_{name}(self)")
+    elif field.default is not None or field.is_nested:
+        getter_lines.append(f"    return v if v is not None else _default_{name}")
+    else:
+        getter_lines.append("    return v")
+    setter_lines = [
+        f"def {name}(self, v):",
+        "    if self is self._shared_default:",
+        "        raise RuntimeError(f\"Shared default object of class '{type(self)}' cannot be modified.\")",
+        *_indent(_value_lines(field, "v")),
+        f"    self._{name} = v",
+    ]
+
+    getter = _compile(name, getter_lines, namespace)
+    setter = _compile(name, setter_lines, namespace)
+    return property(getter, setter, doc=field.doc)
+
+
+def _make_init(fields: Any, namespace: Dict[str, Any]) -> Callable[..., None]:
+    """Generates constructor taking data dictionary and keyword overrides for all fields."""
+    fields = list(fields)
+    args = "".join(f", {field.name}=None" for field in fields)
+    lines = [f"def __init__(self, obj=None, *{args}):" if fields else "def __init__(self, obj=None):"]
+    lines += ["    if obj is None:", "        obj = _EMPTY_DATA"]
+    for field in fields:
+        name = field.name
+        lines.append(f"    v = {name} if {name} is not None else obj.get({name!r})")
+        if field.is_nested:
+            message = f"'{name}' property must be an instance of {field.value_type.__name__} class."
+            lines += [
+                f"    if v is not None and not isinstance(v, _type_{name}):",
+                "        if not isinstance(v, dict):",
+                f"            raise ValueError({message!r})",
+                f"        v = _type_{name}(v)",
+            ]
+        else:
+            lines += _indent(_value_lines(field, "v"))
+        lines.append(f"    self._{name} = v")
+    return _compile("__init__", lines, namespace)
+
+
+def _make_from_validated_dict(fields: Any, namespace: Dict[str, Any]) -> Callable[..., SettingsBase]:
+    """Generates class method constructing settings object from already validated dictionary, skipping checks.
+
+    Intended for data that passed validation before (e.g. loaded from JSON snapshot, see reef.common.json_cache).
+    """
+    lines = ["def from_validated_dict(cls, obj):", "    self = cls.__new__(cls)"]
+    for field in fields:
+        name = field.name
+        lines.append(f"    v = obj.get({name!r})")
+        if field.is_nested:
+            lines += ["    if v is not None:", f"        v = _type_{name}.from_validated_dict(v)"]
+        lines.append(f"    self._{name} = v")
+    lines.append("    return self")
+    return _compile("from_validated_dict", lines, namespace)
+
+
+def _make_to_dict(fields: Any, namespace: Dict[str, Any]) -> Callable[[Any], Optional[Dict[str, Any]]]:
+    """Generates method returning dictionary with set fields (or None if no field is set)."""
+    lines = ["def to_dict(self):", "    result = {}"]
+    for field in fields:
+        name = field.name
+        lines += [f"    v = self._{name}", "    if v is not None:"]
+        if field.is_nested:
+            lines += ["        v = v.to_dict()", "        if v is not None:", f"            result[{name!r}] = v"]
+        else:
+            lines.append(f"        result[{name!r}] = v")
+    lines.append("    return result if result else None")
+    return _compile("to_dict", lines, namespace)
+
+
+def _make_validate(fields: Any, namespace: Dict[str, Any]) -> Callable[[Any], None]:
+    """Generates method validating all fields (including nested settings objects)."""
+    lines = ["def validate(self):"]
+    for field in fields:
+        lines += [f"    v = self._{field.name}", *_indent(_value_lines(field, "v"))]
+        if field.is_nested:
+            lines += ["    if v is not None:", "        v.validate()"]
+    if len(lines) == 1:
+        lines.append("    pass")
+    return _compile("validate", lines, namespace)
@@ -0,0 +1,5 @@
+from .client import main
+
+# allows running reef client with 'python -m' (e.g. from reef executable shell script)
+if __name__ == "__main__":
+    main()
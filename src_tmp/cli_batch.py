@@ -0,0 +1,69 @@
+import shlex
+
+import click
+
+from .cli_project import echo_lock_wait_time, project, set_project_loaders
+
+# project subcommands (as tuples of command names) that can be used in batch scripts
+BATCH_COMMANDS = [
+    ("get-default",),
+    ("set-default",),
+    ("get-default-module",),
+    ("set-default-module",),
+    ("config", "get"),
+    ("config", "set"),
+    ("config", "reset"),
+]
+
+
+@click.command("batch")
+@click.argument("script", type=click.File("r"), default="-")
+@click.pass_context
+def batch(ctx, script):
+    """
+    Executes project commands read from script file (or standard input) in a single process.
+
+    Each line holds one command, as given in command line (e.g. 'project config set KEY VALUE -p NAME'), with optional
+    'reef' prefix. Empty lines and comments (starting with '#') are skipped. Settings file of each modified project
+    and project repository are saved once, after all commands succeed, and only if their contents changed. If any
+    command fails, no changes are saved.
+    """
+    set_project_loaders(ctx.obj)
+    manager = ctx.obj["project_manager"]
+    command_count = 0
+    # commands are executed quietly, summary is written once at the end
+    is_verbose = ctx.obj.get("is_verbose")
+    ctx.obj["is_verbose"] = False
+    with manager.deferred_save():
+        for line_number, line in enumerate(script, 1):
+            try:
+                args = _parse_batch_line(line)
+                if not args:
+                    continue
+                project.main(args=args, prog_name="reef project", standalone_mode=False, obj=ctx.obj)
+            except click.ClickException as e:
+                raise click.ClickException(f"Line {line_number}: {e.format_message()}") from e
+            except (KeyError, ValueError, RuntimeError, NotImplementedError) as e:
+                raise click.ClickException(f"Line {line_number}: {e}") from e
+            command_count += 1
+    if is_verbose:
+        click.echo(f"Executed {command_count} command(s) in batch mode.", err=True)
+        echo_lock_wait_time(ctx.obj)
+
+
+def _parse_batch_line(line):
+    """Returns arguments of project command given in batch script line (or empty list for empty lines)."""
+    try:
+        tokens = shlex.split(line, comments=True)
+    except ValueError as e:
+        raise click.ClickException(f"Invalid syntax ({e}).") from e
+    if tokens[:1] == ["reef"]:
+        tokens = tokens[1:]
+    if not tokens:
+        return []
+    if tokens[0] != "project" or not any(tuple(tokens[1 : len(c) + 1]) == c for c in BATCH_COMMANDS):
+        supported = ", ".join(" ".join(["project", *command]) for command in BATCH_COMMANDS)
+        raise click.ClickException(
+            f"Command '{' '.join(tokens[:3])}' is not supported in batch mode (supported commands include: {supported} )."
+        )
+    return tokens[1:]
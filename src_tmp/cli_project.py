@@ -1,10 +1,16 @@
+import sys
+import time
 from os import path
 
 import click
 
-from .projects.project_manager import ProjectManager
+from reef.common.output_formats import OUTPUT_FORMAT_TEXT, OUTPUT_FORMATS, write_records
 
-PROJECT_REPOSITORY_JSON_FILEPATH = "projects.json"
+from .projects.repository.project_repository_backends import (
+    REPOSITORY_BACKENDS,
+    create_project_repository,
+    migrate_project_repository,
+)
 
 
 def _resolve_project_name(ctx, override=None, is_override_required=False):
@@ -12,17 +18,61 @@ def _resolve_project_name(ctx, override=None, is_override_required=False):
         assert False  # TODO
     if override:
         return override
-    if ctx.obj.get("project"):
+    if ctx.obj["project"]:
         return ctx.obj["project"]
     return None
 
 
+def _resolve_project_names(ctx, override=None, are_all_projects=False):
+    if are_all_projects:
+        return list(ctx.obj["project_manager"].project_names)
+    return [_resolve_project_name(ctx, override)]
+
+
+def _output_format_option(function):
+    return click.option(
+        "--format",
+        "-f",
+        "output_format",
+        type=click.Choice(OUTPUT_FORMATS),
+        default=OUTPUT_FORMAT_TEXT,
+        help="Output format (machine-readable formats stream one record per project)",
+    )(function)
+
+
 @click.group("project")
 @click.pass_context
 def project(ctx):
     """Handles reef project creation and maintenance."""
-    project_repo_path = path.join(ctx.obj["config"].projects_path(), PROJECT_REPOSITORY_JSON_FILEPATH)
-    ctx.obj["project_manager"] = ProjectManager(repository_path=project_repo_path)
+    # repository and manager are created on first use (manager pulls in project settings and templates code)
+    set_project_loaders(ctx.obj)
+    if ctx.obj.get("is_verbose"):
+        ctx.call_on_close(lambda: echo_lock_wait_time(ctx.obj))
+
+
+def set_project_loaders(obj):
+    """Registers loaders of project repository and project manager in lazy context object."""
+    obj.set_loader("project_repository", _load_project_repository)
+    obj.set_loader("project_manager", _load_project_manager)
+
+
+def _load_project_repository(obj):
+    config = obj["config"]
+    return create_project_repository(config.project_repository_path, config.repository_backend)
+
+
+def _load_project_manager(obj):
+    from .projects.project_factory import ProjectFactory
+    from .projects.project_manager import ProjectManager
+
+    return ProjectManager(factory=ProjectFactory(obj["project_repository"]))
+
+
+def echo_lock_wait_time(obj):
+    """Writes time spent waiting for project repository locks to stderr (if repository was loaded)."""
+    if obj.is_loaded("project_repository"):
+        lock_wait_time = obj["project_repository"].lock_wait_time
+        click.echo(f"Project repository lock wait time: {lock_wait_time:.3f}s", err=True)
 
 
 @project.command("info")
@@ -57,13 +107,45 @@ def project_list(ctx):
 
 @project.command("describe")
 @click.option("--project", "-p", default="", help="Name of project to describe")
+@click.option("--all", "-a", "are_all_projects", is_flag=True, help="Describe all registered projects")
 @click.option("--verbose", "-v", is_flag=True, help="Verbose mode (include unset properties with default values)")
+@_output_format_option
 @click.pass_context
-def project_describe(project, verbose, ctx):
+def project_describe(ctx, project, are_all_projects, verbose, output_format):
     """Displays more information and settings used in given reef project."""
     manager = ctx.obj["project_manager"]
-    project_name = _resolve_project_name(ctx, project)
-    manager.describe(project_name, verbose)
+    project_names = _resolve_project_names(ctx, project, are_all_projects)
+    if output_format != OUTPUT_FORMAT_TEXT:
+        write_records(sys.stdout, manager.project_records(project_names, verbose), output_format)
+        return
+    for project_name in project_names:
+        manager.describe(project_name, verbose)
+
+
+@project.command("validate")
+@click.option("--project", "-p", default="", help="Name of project to validate")
+@click.option("--all", "-a", "are_all_projects", is_flag=True, help="Validate all registered projects")
+@click.option("--jobs", "-j", type=click.IntRange(min=1), default=None, help="Number of projects validated in parallel")
+@_output_format_option
+@click.pass_context
+def project_validate(ctx, project, are_all_projects, jobs, output_format):
+    """Loads and validates settings of given reef project (or all of them)."""
+    manager = ctx.obj["project_manager"]
+    project_names = None if are_all_projects else _resolve_project_names(ctx, project)
+    results = manager.validate_projects(project_names, jobs)
+
+    if output_format != OUTPUT_FORMAT_TEXT:
+        write_records(sys.stdout, (result.to_record() for result in results), output_format)
+    else:
+        for result in results:
+            status = "OK  " if result.is_valid else "FAIL"
+            suffix = "" if result.is_valid else f": {result.error}"
+            print(f"{status} {result.name} ({result.duration * 1000:.1f} ms){suffix}")
+        failed_count = sum(1 for result in results if not result.is_valid)
+        print(f"{len(results) - failed_count} of {len(results)} project(s) valid.")
+
+    if any(not result.is_valid for result in results):
+        ctx.exit(1)
 
 
 @project.command("create")
@@ -71,7 +153,7 @@ def project_describe(project, verbose, ctx):
 @click.option("--template", "-t", default="", help="Name of template for created project")
 @click.option("--output-path", "-o", default=".", help="Top-level directory where project is to be created")
 @click.pass_context
-def project_create(name, template, output_path, ctx):
+def project_create(ctx, name, template, output_path):
     """Creates new reef project."""
     ctx.obj["project_manager"].create(name, template, output_path)
 
@@ -80,17 +162,68 @@ def project_create(name, template, output_path, ctx):
 @click.argument("path")
 @click.option("--name", "-n", default="", help="Name of imported project (if other than already specified)")
 @click.pass_context
-def project_import(path, name, ctx):
+def project_import(ctx, path, name):
     """Adds an existing reef project to currently used reef repository."""
     ctx.obj["project_manager"].import_existing(path, name)
 
 
 @project.command("refresh")
 @click.option("--project", "-p", default="", help="Name of project to refresh")
+@click.option("--all", "-a", "are_all_projects", is_flag=True, help="Refresh all registered projects")
+@click.option(
+    "--match",
+    "-m",
+    "name_patterns",
+    multiple=True,
+    help="Refresh only projects with names matching shell-style pattern",
+)
+@click.option("--jobs", "-j", type=click.IntRange(min=1), default=None, help="Number of projects refreshed in parallel")
+@_output_format_option
 @click.pass_context
-def project_refresh(project, ctx):
-    """Refreshes reef generated files for given project."""
-    ctx.obj["project_manager"].refresh(_resolve_project_name(ctx, project))
+def project_refresh(ctx, project, are_all_projects, name_patterns, jobs, output_format):
+    """Refreshes reef generated files for given project (or all of them)."""
+    manager = ctx.obj["project_manager"]
+    if not are_all_projects and not name_patterns:
+        result = manager.refresh(_resolve_project_name(ctx, project))
+        if output_format != OUTPUT_FORMAT_TEXT:
+            write_records(sys.stdout, [result.to_record()], output_format)
+            return
+        if result.is_up_to_date:
+            print(f"Project '{result.name}' is up-to-date ({result.duration * 1000:.1f} ms).")
+            return
+        for file in result.updated_files:
+            print(f"Updated: {file}")
+        print(
+            f"Refreshed '{result.name}': {len(result.updated_files)} file(s) updated, "
+            + f"{len(result.unchanged_files)} unchanged ({result.duration * 1000:.1f} ms)."
+        )
+        return
+
+    # patterns alone filter all registered projects
+    project_names = None if are_all_projects or not project else _resolve_project_names(ctx, project)
+    start = time.perf_counter()
+    results = manager.refresh_many(project_names, jobs, name_patterns or None)
+
+    if output_format != OUTPUT_FORMAT_TEXT:
+        write_records(sys.stdout, (result.to_record() for result in results), output_format)
+    else:
+        for result in results:
+            if not result.is_successful:
+                status, details = "FAIL", f": {result.error}"
+            else:
+                status, details = (
+                    "OK  ",
+                    "" if result.is_up_to_date else f": {len(result.updated_files)} file(s) updated",
+                )
+            print(f"{status} {result.name} ({result.duration * 1000:.1f} ms){details}")
+        failed_count = sum(1 for result in results if not result.is_successful)
+        print(
+            f"{len(results) - failed_count} of {len(results)} project(s) refreshed "
+            + f"({(time.perf_counter() - start) * 1000:.1f} ms)."
+        )
+
+    if any(not result.is_successful for result in results):
+        ctx.exit(1)
 
 
 @project.command("remove")
@@ -99,7 +232,7 @@ def project_refresh(project, ctx):
     "--remove-files", "-r", is_flag=True, help="Removes all files in addition to removing project from reef repository"
 )
 @click.pass_context
-def project_remove(name, remove_files, ctx):
+def project_remove(ctx, name, remove_files):
     """Removes project from reef repository."""
     ctx.obj["project_manager"].remove(_resolve_project_name(ctx, name, True), remove_files)
 
@@ -108,7 +241,7 @@ def project_remove(name, remove_files, ctx):
 @click.pass_context
 def project_get_default(ctx):
     """Outputs name of reef project used as a default in current context."""
-    default_project = ctx.obj["project_manager"].default_project_name
+    default_project = ctx.obj["project_repository"].default_project_name
 
     if default_project:
         print(default_project)
@@ -119,7 +252,7 @@ def project_get_default(ctx):
 @project.command("set-default")
 @click.argument("name")
 @click.pass_context
-def project_set_default(name, ctx):
+def project_set_default(ctx, name):
     """Sets default reef project to be used in current context."""
     project_name = _resolve_project_name(ctx, name, True)
     ctx.obj["project_manager"].change_default_project(project_name)
@@ -143,12 +276,33 @@ def get_project_default_module(ctx, project):
 @click.argument("name")
 @click.option("--project", "-p", default="", help="Name of project considered")
 @click.pass_context
-def project_default_module(name, project, ctx):
+def project_default_module(ctx, name, project):
     """Sets default module for current/given reef project."""
     project_name = _resolve_project_name(ctx, project)
     default_module = ctx.obj["project_manager"].change_default_module_for(project_name, name)
 
 
+@project.command("migrate-repository")
+@click.argument("backend", type=click.Choice(list(REPOSITORY_BACKENDS)))
+@click.pass_context
+def project_migrate_repository(ctx, backend):
+    """Migrates reef project repository to given storage backend (and switches reef config to use it)."""
+    config = ctx.obj["config"]
+    if backend == config.repository_backend:
+        print(f"Project repository already uses '{backend}' backend.")
+        return
+
+    target_path = config.project_repository_path_for(backend)
+    if path.exists(target_path):
+        raise click.ClickException(f"Project repository file '{target_path}' already exists.")
+
+    count = migrate_project_repository(config.project_repository_path, config.repository_backend, target_path, backend)
+
+    config.repository_backend = backend
+    config.save_as_json(config.config_path)
+    print(f"Migrated {count} project(s) to '{target_path}'.")
+
+
 @project.group("config")
 @click.pass_context
 def project_config(ctx):
@@ -157,72 +311,82 @@ def project_config(ctx):
     """
 
 
-@project_config.group("list")
+@project_config.command("list")
+@click.option("--all", "-a", "are_all_projects", is_flag=True, help="List configuration of all registered projects")
+@click.option("--verbose", "-v", is_flag=True, help="Verbose mode (include unset properties with default values)")
+@_output_format_option
 @click.pass_context
-def project_config_list(ctx):
+def project_config_list(ctx, are_all_projects, verbose, output_format):
     """Lists configuration items for given reef project."""
     manager = ctx.obj["project_manager"]
-    project_name = _resolve_project_name(ctx, "")
-    manager.config_list_entries(project_name)
+    project_names = _resolve_project_names(ctx, "", are_all_projects)
+    if output_format != OUTPUT_FORMAT_TEXT:
+        write_records(sys.stdout, manager.config_records(project_names, verbose), output_format)
+        return
+    for project_name in project_names:
+        manager.config_list_entries(project_name, verbose)
 
 
-@project_config.group("get")
+@project_config.command("get")
 @click.argument("key")
+@click.option("--project", "-p", default="", help="Name of project considered")
 @click.pass_context
-def project_config_get(key, ctx):
+def project_config_get(ctx, key, project):
     """Gets value of given configuration item."""
     manager = ctx.obj["project_manager"]
-    project_name = _resolve_project_name(ctx, "")
+    project_name = _resolve_project_name(ctx, project)
     print(manager.config_get_entry(key, project_name))
 
 
-@project_config.group("set")
+@project_config.command("set")
 @click.argument("key")
 @click.argument("value")
+@click.option("--project", "-p", default="", help="Name of project considered")
 @click.pass_context
-def project_config_set(key, value, ctx):
+def project_config_set(ctx, key, value, project):
     """Sets value of given configuration item."""
     manager = ctx.obj["project_manager"]
-    project_name = _resolve_project_name(ctx, "")
+    project_name = _resolve_project_name(ctx, project)
     manager.config_set_entry(key, value, project_name)
 
 
-@project_config.group("reset")
+@project_config.command("reset")
 @click.argument("key")
+@click.option("--project", "-p", default="", help="Name of project considered")
 @click.pass_context
-def project_config_reset(key, ctx):
+def project_config_reset(ctx, key, project):
     """Resets given configuration item to its default value."""
     manager = ctx.obj["project_manager"]
-    project_name = _resolve_project_name(ctx, "")
+    project_name = _resolve_project_name(ctx, project)
     manager.config_reset_entry(key, project_name)
 
 
-@project_config.group("add-item")
+@project_config.command("add-item")
 @click.argument("key")
 @click.argument("value")
 @click.pass_context
-def project_config_add_item(key, value, ctx):
+def project_config_add_item(ctx, key, value):
     """Adds value to list for given configuration item."""
     manager = ctx.obj["project_manager"]
     project_name = _resolve_project_name(ctx, "")
     manager.config_add_entry_item(key, value, project_name)
 
 
-@project_config.group("remove-item")
+@project_config.command("remove-item")
 @click.argument("key")
 @click.argument("value")
 @click.pass_context
-def project_config_remove_item(key, value, ctx):
+def project_config_remove_item(ctx, key, value):
     """Removes value from list for given configuration item."""
     manager = ctx.obj["project_manager"]
     project_name = _resolve_project_name(ctx, "")
     manager.config_remove_entry_item(key, value, project_name)
 
 
-@project_config.group("clear-items")
+@project_config.command("clear-items")
 @click.argument("key")
 @click.pass_context
-def project_config_clear_items(key, ctx):
+def project_config_clear_items(ctx, key):
     """Removes all values from list for given configuration item."""
     manager = ctx.obj["project_manager"]
     project_name = _resolve_project_name(ctx, "")
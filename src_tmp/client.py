@@ -0,0 +1,128 @@
+import json
+import os
+import socket
+import sys
+from os import path
+from typing import Any
+
+# client is kept free of other reef imports, so it starts fast (config module defines the same variable name)
+CONFIG_PATH_ENV_VAR_NAME = "REEF_CONFIG"
+DAEMON_ENV_VAR_NAME = "REEF_DAEMON"
+DAEMON_SOCKET_FILE_NAME = "daemon.sock"
+
+# commands that are always executed in-process (they read standard input or control the daemon itself)
+LOCAL_COMMANDS = frozenset(["init", "batch", "serve"])
+# options of main command taking a value (so that it is not mistaken for command name)
+_VALUE_OPTIONS = frozenset(["-c", "--context"])
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Entry point of reef command line client.
+
+    Commands are forwarded to reef daemon (see 'reef serve') if it is running for current reef config, which avoids
+    paying for imports and loading of project data on every call. Otherwise, commands are executed in-process.
+    """
+    argv = sys.argv[1:] if argv is None else list(argv)
+    exit_code = forward_command(argv)
+    if exit_code is None:
+        from .main import main as reef_main
+
+        reef_main(args=argv, prog_name="reef")
+    sys.exit(exit_code)
+
+
+def get_daemon_socket_path(config_path: str | None = None) -> str | None:
+    """Returns path of daemon socket for given (or current) reef config directory (None if it is not available)."""
+    config_path = config_path if config_path is not None else os.environ.get(CONFIG_PATH_ENV_VAR_NAME)
+    if not config_path or not hasattr(socket, "AF_UNIX"):
+        return None
+    return path.join(path.abspath(config_path), DAEMON_SOCKET_FILE_NAME)
+
+
+def is_daemon_enabled() -> bool:
+    """Checks whether forwarding commands to reef daemon is enabled (it can be disabled by setting REEF_DAEMON=0)."""
+    return os.environ.get(DAEMON_ENV_VAR_NAME, "1") != "0"
+
+
+def forward_command(argv: list[str]) -> int | None:
+    """Executes command with given arguments in reef daemon, writing its output to stdout and stderr.
+
+    Returns exit code of the command, or None if daemon is not running (so command was not executed).
+    """
+    socket_path = get_daemon_socket_path()
+    if socket_path is None or not is_daemon_enabled() or get_command_name(argv) in LOCAL_COMMANDS:
+        return None
+    connection = connect_to_daemon(socket_path)
+    if connection is None:
+        return None
+    with connection:
+        # once request is sent, command may have been executed, so it must not be repeated in-process
+        try:
+            send_message(connection, {"argv": argv, "cwd": os.getcwd()})
+            response = receive_message(connection)
+        except OSError as e:
+            response = {"exit_code": 1, "stderr": f"Error: Connection to reef daemon failed ({e}).\n"}
+    if response is None:
+        response = {"exit_code": 1, "stderr": "Error: Reef daemon closed connection without response.\n"}
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    return response.get("exit_code", 1)
+
+
+def get_command_name(argv: list[str]) -> str | None:
+    """Returns name of (top-level) command given in command line arguments, or None if there is none.
+
+    Command is the first argument that is neither an option of main command nor its value, so arguments of the
+    command itself (e.g. project named 'batch') are not taken into account.
+    """
+    args = iter(argv)
+    for arg in args:
+        if arg == "--":
+            return next(args, None)
+        if arg in _VALUE_OPTIONS or (_is_short_options(arg) and arg.find("c") == len(arg) - 1):
+            # value of the option is the next argument (also for short options grouped with flags, e.g. '-vc')
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+def stop_daemon(socket_path: str) -> bool:
+    """Requests reef daemon listening on given socket to shut down (returns False if it is not running)."""
+    connection = connect_to_daemon(socket_path)
+    if connection is None:
+        return False
+    with connection:
+        send_message(connection, {"shutdown": True})
+        return receive_message(connection) is not None
+
+
+def connect_to_daemon(socket_path: str) -> socket.socket | None:
+    """Returns connection to reef daemon listening on given socket (or None if it is not running)."""
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(socket_path)
+    except OSError:
+        connection.close()
+        return None
+    return connection
+
+
+def send_message(connection: socket.socket, message: dict[str, Any]) -> None:
+    """Sends message (as a single line of JSON) through given connection."""
+    connection.sendall(json.dumps(message).encode() + b"\n")
+
+
+def receive_message(connection: socket.socket) -> dict[str, Any] | None:
+    """Receives message sent with 'send_message' (returns None if connection was closed)."""
+    with connection.makefile("rb") as fp:
+        line = fp.readline()
+    return json.loads(line) if line else None
+
+
+### IMPLEMENTATION DETAILS:
+
+
+def _is_short_options(arg: str) -> bool:
+    """Checks whether argument is a group of (one or more) short options, e.g. '-v' or '-vc'."""
+    return len(arg) > 1 and arg[0] == "-" and arg[1] != "-"
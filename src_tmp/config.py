@@ -1,6 +1,13 @@
 from os import environ, path
 
-from src.utils import dump_json, ensure_dir, load_json
+from reef.common.file_utils import dump_json, ensure_dir
+from reef.common.json_cache import load_json_cached
+
+from .projects.repository.project_repository_backends import (
+    REPOSITORY_BACKEND_JSON,
+    REPOSITORY_BACKENDS,
+    REPOSITORY_FILE_NAMES,
+)
 
 CONFIG_PATH_ENV_VAR_NAME = "REEF_CONFIG"
 CONFIG_FILE_NAME = "config.json"
@@ -8,12 +15,13 @@ CONFIG_PROJECT_DIR = "projects"
 
 
 class Config:
-    def __init__(self, config_path, exec_path, version) -> None:
+    def __init__(self, config_path, exec_path, version, repository_backend=REPOSITORY_BACKEND_JSON) -> None:
         super().__init__()
 
         self._config_path = path.abspath(config_path)
         self._exec_path = path.abspath(exec_path)
         self._version = version
+        self.repository_backend = repository_backend
 
     @property
     def config_path(self) -> str:
@@ -28,17 +36,30 @@ class Config:
         return self._version
 
     @property
-    def version_major(self) -> str:
+    def version_major(self) -> int:
         return int(self._version.split(".")[0])
 
     @property
-    def version_minor(self) -> str:
+    def version_minor(self) -> int:
         return int(self._version.split(".")[1])
 
     @property
-    def version_patch(self) -> str:
+    def version_patch(self) -> int:
         return int(self._version.split(".")[2])
 
+    @property
+    def repository_backend(self) -> str:
+        return self._repository_backend
+
+    @repository_backend.setter
+    def repository_backend(self, repository_backend) -> None:
+        if repository_backend not in REPOSITORY_BACKENDS:
+            raise ValueError(
+                f"Project repository backend '{repository_backend}' is not supported "
+                + f"(supported values include: {', '.join(REPOSITORY_BACKENDS)} )."
+            )
+        self._repository_backend = repository_backend
+
     @property
     def config_file_path(self) -> str:
         return Config._filepath(self.config_path)
@@ -47,17 +68,25 @@ class Config:
     def projects_path(self) -> str:
         return path.join(self.config_path, CONFIG_PROJECT_DIR)
 
+    @property
+    def project_repository_path(self) -> str:
+        return self.project_repository_path_for(self.repository_backend)
+
+    def project_repository_path_for(self, repository_backend) -> str:
+        return path.join(self.projects_path, REPOSITORY_FILE_NAMES[repository_backend])
+
     def __str__(self) -> str:
         result = ""
 
         result += "Directories:" + "\n"
         result += " - config:     " + self.config_path + "\n"
         result += " - executable: " + self.exec_path + "\n"
+        result += "Project repository backend: " + self.repository_backend + "\n"
 
         return result
 
     @staticmethod
-    def get_path() -> str:
+    def get_path() -> str | None:
         return environ.get(CONFIG_PATH_ENV_VAR_NAME)
 
     @staticmethod
@@ -66,15 +95,25 @@ class Config:
 
     @staticmethod
     def from_json(dirpath):
-        data = load_json(Config._filepath(dirpath))
-        return Config(data["config_path"], data["exec_path"], data["version"])
+        data = load_json_cached(Config._filepath(dirpath))
+        return Config(
+            data["config_path"],
+            data["exec_path"],
+            data["version"],
+            data.get("repository_backend", REPOSITORY_BACKEND_JSON),
+        )
 
     def save_as_json(self, dirpath, verbose=False) -> None:
         filepath = Config._filepath(dirpath)
         if verbose:
             print(f"Saving current config in '{filepath}'... ", end="")
 
-        data = {"config_path": self.config_path, "exec_path": self.exec_path, "version": self.version}
+        data = {
+            "config_path": self.config_path,
+            "exec_path": self.exec_path,
+            "version": self.version,
+            "repository_backend": self.repository_backend,
+        }
 
         ensure_dir(dirpath)
         dump_json(filepath, data)
@@ -97,7 +136,7 @@ class Config:
         dirpath = Config.get_path()
         if not dirpath:
             raise RuntimeError("No config path set. Run init command to initialize reef environment.")
-        config.save_as_json()
+        config.save_as_json(dirpath)
 
     def update_shell_config(self, verbose=False):
         INTRO = "# >>> reef initialize >>>"
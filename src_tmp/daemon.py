@@ -0,0 +1,231 @@
+import io
+import os
+import signal
+import socket
+import sys
+import traceback
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from typing import Any, Iterator
+
+import click
+
+from .client import get_daemon_socket_path, receive_message, send_message
+from .config import Config
+from .projects.project_factory import ProjectFactory
+from .projects.project_manager import ProjectManager
+from .projects.repository.project_repository_backends import create_project_repository
+
+# suffixes of files (next to repository data source file) whose changes require reloading repository
+_REPOSITORY_FILE_SUFFIXES = ("", ".journal", "-wal")
+
+
+class ReefDaemon:
+    """
+    Long-running reef process executing CLI commands forwarded by reef client (see client.py) over a Unix socket.
+
+    Keeps reef config, project repository and project manager (with its cache of loaded projects) in memory
+    between commands. Before each command, reef config and repository files are checked for changes (one stat call
+    per file) and all state is reloaded if any of them was changed by another process (changes made by commands
+    executed by the daemon itself are recorded after each command). Changes of project settings files are detected
+    by project manager's cache. Commands are executed one at a time, in order of arrival.
+    """
+
+    def __init__(self, version: str, socket_path: str | None = None):
+        """Initializes daemon for current reef config (optionally, listening on non-default socket path)."""
+        self._version = version
+        config_path = Config.get_path()
+        if not config_path:
+            raise ValueError("Reef config path is not set (reef environment is not initialised).")
+        socket_path = socket_path if socket_path is not None else get_daemon_socket_path(config_path)
+        if socket_path is None:
+            raise ValueError("Reef daemon requires Unix domain sockets, which are not supported on this platform.")
+        self._config_path: str = config_path
+        self._socket_path: str = socket_path
+        self._state: dict[str, Any] | None = None
+        self._watched_files_state: tuple[Any, ...] | None = None
+        self._command_count = 0
+        self._is_stopped = False
+
+    @property
+    def socket_path(self) -> str:
+        """Path of Unix socket the daemon listens on."""
+        return self._socket_path
+
+    @property
+    def command_count(self) -> int:
+        """Number of commands executed by the daemon."""
+        return self._command_count
+
+    def serve_forever(self) -> None:
+        """Listens for commands until shutdown is requested (or process is interrupted or terminated)."""
+        with self._listening_socket() as server:
+            previous_handler = signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+            try:
+                while not self._is_stopped:
+                    connection, _ = server.accept()
+                    with connection:
+                        self._handle_connection(connection)
+            except KeyboardInterrupt:
+                pass
+            finally:
+                signal.signal(signal.SIGTERM, previous_handler)
+
+    def execute(self, argv: list[str], cwd: str | None = None) -> dict[str, Any]:
+        """Executes reef command with given arguments (in given working directory).
+
+        Returns response with exit code and captured output ('exit_code', 'stdout' and 'stderr' keys).
+        """
+        from .main import main
+
+        self._command_count += 1
+        obj = dict(self._get_state())
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr), _working_directory(cwd), _no_stdin():
+            try:
+                result = main.main(args=argv, prog_name="reef", standalone_mode=False, obj=obj)
+                exit_code = result if isinstance(result, int) else 0
+            except click.ClickException as e:
+                e.show()
+                exit_code = e.exit_code
+            except click.Abort:
+                click.echo("Aborted!", err=True)
+                exit_code = 1
+            except SystemExit as e:
+                exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+        if exit_code != 0:
+            # failed command may have left unsaved changes in memory
+            self._reset_state()
+        else:
+            self._update_watched_files_state()
+        return {"exit_code": exit_code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+    def _handle_connection(self, connection: socket.socket) -> None:
+        """Receives single request from given connection, executes it and sends back response."""
+        try:
+            request = receive_message(connection)
+            if request is None:
+                return
+            if request.get("shutdown"):
+                self._is_stopped = True
+                response = {"exit_code": 0}
+            else:
+                response = self.execute(request.get("argv", []), request.get("cwd"))
+            send_message(connection, response)
+        except (OSError, ValueError) as e:
+            print(f"WARNING: [ReefDaemon] Failed to handle request: {e}", file=sys.stderr)
+
+    def _get_state(self) -> dict[str, Any]:
+        """Returns context objects shared by commands, reloading them if config or repository files changed."""
+        if self._state is not None and self._read_watched_files_state() != self._watched_files_state:
+            self._reset_state()
+        if self._state is None:
+            config = Config.load(self._version)
+            repository = create_project_repository(config.project_repository_path, config.repository_backend)
+            self._state = {
+                "config": config,
+                "project_repository": repository,
+                "project_manager": ProjectManager(factory=ProjectFactory(repository)),
+            }
+            self._watched_files_state = self._read_watched_files_state()
+        return self._state
+
+    def _reset_state(self) -> None:
+        """Discards shared context objects, so they are reloaded before next command."""
+        if self._state is not None:
+            close = getattr(self._state["project_repository"], "close", None)
+            if close is not None:
+                close()
+        self._state = None
+        self._watched_files_state = None
+
+    def _update_watched_files_state(self) -> None:
+        """Records state of watched files after command executed by the daemon, so that its own writes to repository
+        files do not cause reloading before next command (changes of reef config still do, as config object kept
+        in memory may not reflect them)."""
+        if self._state is None or self._watched_files_state is None:
+            return
+        files_state = self._read_watched_files_state()
+        if files_state[0] != self._watched_files_state[0]:
+            self._reset_state()
+        else:
+            self._watched_files_state = files_state
+
+    def _read_watched_files_state(self) -> tuple[Any, ...]:
+        """Returns modification times, sizes and inodes of config and repository files (None for missing ones)."""
+        paths = [Config._filepath(self._config_path)]
+        if self._state is not None:
+            repository_path = self._state["config"].project_repository_path
+            paths.extend(f"{repository_path}{suffix}" for suffix in _REPOSITORY_FILE_SUFFIXES)
+        result: list[tuple[int, int, int] | None] = []
+        for file_path in paths:
+            try:
+                stat = os.stat(file_path)
+            except FileNotFoundError:
+                result.append(None)
+            else:
+                result.append((stat.st_mtime_ns, stat.st_size, stat.st_ino))
+        return tuple(result)
+
+    @contextmanager
+    def _listening_socket(self) -> Iterator[socket.socket]:
+        """Binds socket (accessible only to current user), removing it when daemon stops."""
+        if os.path.exists(self._socket_path):
+            if _is_socket_alive(self._socket_path):
+                raise RuntimeError(f"Reef daemon is already running (listening on '{self._socket_path}').")
+            # stale socket left by daemon that did not exit cleanly
+            os.remove(self._socket_path)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        previous_umask = os.umask(0o077)
+        try:
+            server.bind(self._socket_path)
+        finally:
+            os.umask(previous_umask)
+        try:
+            server.listen()
+            yield server
+        finally:
+            server.close()
+            os.remove(self._socket_path)
+
+
+def _is_socket_alive(socket_path: str) -> bool:
+    """Checks whether some process accepts connections on given socket."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(socket_path)
+        except OSError:
+            return False
+    return True
+
+
+def _raise_keyboard_interrupt(signum: int, frame: Any) -> None:
+    """Signal handler stopping the daemon gracefully (as on Ctrl+C)."""
+    raise KeyboardInterrupt
+
+
+@contextmanager
+def _working_directory(directory: str | None) -> Iterator[None]:
+    """Changes current working directory for the duration of the context (if directory is given)."""
+    if directory is None:
+        yield
+        return
+    previous_directory = os.getcwd()
+    os.chdir(directory)
+    try:
+        yield
+    finally:
+        os.chdir(previous_directory)
+
+
+@contextmanager
+def _no_stdin() -> Iterator[None]:
+    """Replaces standard input with an empty stream (commands cannot interact with client's user)."""
+    previous_stdin = sys.stdin
+    sys.stdin = io.StringIO()
+    try:
+        yield
+    finally:
+        sys.stdin = previous_stdin
@@ -1,22 +1,41 @@
+import os
 from os import path
 
 import click
 
-from .cli_project import project
-from .config import Config
+from reef.common.lazy_cli import LazyContextObject, LazyGroup
+from reef.version import __version__ as VERSION
 
-GROUP_COMMANDS = ["init", "project", "module", "component", "extras", "config"]
-
-VERSION = "0.1.0"
+GROUP_COMMANDS = ["init", "project", "module", "component", "extras", "config", "batch", "serve"]
 
 CTX = dict(help_option_names=["-h", "--help"])
 
 
-@click.group(invoke_without_command=True, context_settings=CTX)
+# subcommand groups imported only when invoked (they pull in most of the code base)
+LAZY_SUBCOMMANDS = {
+    "project": ".cli_project:project",
+    "batch": ".cli_batch:batch",
+}
+
+CONTEXT_KEYS = ["project", "module", "component"]
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands=LAZY_SUBCOMMANDS,
+    package=__package__,
+    invoke_without_command=True,
+    context_settings=CTX,
+)
 @click.pass_context
 @click.option("--verbose", "-v", is_flag=True, help="Increase output verbosity level")
 @click.option("--version", "-V", is_flag=True, help="Print current version of reef used")
-@click.option("--context", "-c", default="", help="Provides context as project::module::component")
+@click.option(
+    "--context",
+    "-c",
+    default="",
+    help="Provides context as project::module::component (inferred from current directory if not given)",
+)
 def main(ctx, context, verbose, version):
     """
     Strands ecosystem tool for generating project structures, build systems and
@@ -38,13 +57,50 @@ def main(ctx, context, verbose, version):
             print(cmd, end=" ")
         print()
 
-    context_tokens = context.split("::", 3) if context else []
-    ctx.obj["project"] = context_tokens[0] if len(context_tokens) > 0 else ""
-    ctx.obj["module"] = context_tokens[1] if len(context_tokens) > 1 else ""
-    ctx.obj["component"] = context_tokens[2] if len(context_tokens) > 2 else ""
-
+    # config and context are loaded on first use, so commands that do not need them start faster
+    ctx.obj = LazyContextObject(ctx.obj or {})
     ctx.obj["is_verbose"] = verbose
-    ctx.obj["config"] = Config.load(VERSION)
+    ctx.obj.set_loader("config", _load_config)
+    if context:
+        ctx.obj.set_loader("context_tokens", lambda obj: context.split("::", 3))
+    else:
+        ctx.obj.set_loader("context_tokens", _infer_context_tokens)
+    for i, key in enumerate(CONTEXT_KEYS):
+        ctx.obj.set_loader(key, lambda obj, i=i: obj["context_tokens"][i] if len(obj["context_tokens"]) > i else "")
+
+
+def _load_config(obj):
+    """Loads reef config (imported on first use, as it pulls in file utilities)."""
+    from .config import Config
+
+    return Config.load(VERSION)
+
+
+def _infer_context_tokens(obj):
+    """Infers context tokens from current working directory (using context cache in reef config directory).
+
+    Directories of projects that are not registered yield no context, so default project is used for them.
+    """
+    from .projects.project_context import CONTEXT_CACHE_FILE_NAME, ProjectContextResolver
+
+    config = obj["config"]
+    cache_path = path.join(config.config_path, CONTEXT_CACHE_FILE_NAME) if config is not None else None
+    resolver = ProjectContextResolver(cache_path)
+    try:
+        inferred = resolver.resolve(os.getcwd(), lambda project_name: _is_project_registered(obj, project_name))
+    except (OSError, ValueError):
+        return []
+    resolver.save_cache()
+    return list(inferred) if inferred is not None else []
+
+
+def _is_project_registered(obj, project_name):
+    """Checks whether project is registered (assumed so for commands that do not use project repository)."""
+    try:
+        project_repository = obj["project_repository"]
+    except KeyError:
+        return True
+    return project_name in project_repository
 
 
 @main.command("init", context_settings=CTX)
@@ -68,6 +124,8 @@ def init(ctx, config_path, exec_path):
     Initialises reef config and environment before first use.
     """
 
+    from .config import Config
+
     new_config = Config(config_path, exec_path, VERSION)
 
     if Config.get_path() and not click.confirm("There is a reef environment already initialised. Continue anyway?"):
@@ -86,9 +144,6 @@ def init(ctx, config_path, exec_path):
     click.echo("\nReef init successful.")
 
 
-main.add_command(project)
-
-
 @main.command("module", context_settings=CTX)
 @click.pass_context
 def module(ctx):
@@ -108,7 +163,7 @@ def component(ctx):
     """
     Handles component cration and mainteneance of reef projects and modules.
     """
-    config = Config.load(VERSION)
+    config = ctx.obj["config"]
 
     print("###======================###")
     print("### component subcommand ###")
@@ -117,11 +172,11 @@ def component(ctx):
 
 @main.command("extras", context_settings=CTX)
 @click.pass_context
-def component(ctx):
+def extras(ctx):
     """
     Extra features unhandled elsewhere.
     """
-    config = Config.load(VERSION)
+    config = ctx.obj["config"]
 
     print("###===================###")
     print("### extras subcommand ###")
@@ -130,12 +185,38 @@ def component(ctx):
 
 @main.command("config", context_settings=CTX)
 @click.pass_context
-def component(ctx):
+def general_config(ctx):
     """
     Handles general reef configuration.
     """
-    config = Config.load(VERSION)
+    config = ctx.obj["config"]
 
     print("###===================###")
     print("### config subcommand ###")
     print("###===================###")
+
+
+@main.command("serve", context_settings=CTX)
+@click.option("--stop", is_flag=True, help="Stop reef daemon running for current reef config")
+@click.pass_context
+def serve(ctx, stop):
+    """
+    Runs reef daemon, which keeps project data in memory and executes commands forwarded by reef client.
+    """
+    from .client import get_daemon_socket_path, stop_daemon
+    from .daemon import ReefDaemon
+
+    if stop:
+        socket_path = get_daemon_socket_path()
+        if socket_path is None or not stop_daemon(socket_path):
+            raise click.ClickException("Reef daemon is not running.")
+        click.echo("Reef daemon stopped.")
+        return
+
+    try:
+        daemon = ReefDaemon(VERSION)
+        click.echo(f"Reef daemon listening on '{daemon.socket_path}' (stop with Ctrl+C or 'reef serve --stop').")
+        daemon.serve_forever()
+    except (ValueError, RuntimeError) as e:
+        raise click.ClickException(str(e)) from e
+    click.echo(f"Reef daemon stopped after executing {daemon.command_count} command(s).")
@@ -0,0 +1,258 @@
+import re
+from typing import Any, NamedTuple
+
+from reef.common.json_codec import get_json_codec
+
+from ..settings.project_settings import ProjectSettings
+from .project_layout import PRIVATE_SOURCE_DIR_NAME, PUBLIC_INCLUDE_DIR_NAME, ModuleLayout, ProjectLayout
+
+CMAKE_LISTS_FILE_NAME = "CMakeLists.txt"
+CMAKE_PRESETS_FILE_NAME = "CMakePresets.json"
+
+# version of generated file format (bumped whenever generated contents change for the same inputs)
+CMAKE_TEMPLATE_VERSION = 1
+
+SUPPORTED_CPP_STANDARDS = ["98", "11", "14", "17", "20", "23", "26"]
+
+_GENERATED_HEADER = "# Generated by reef - do not edit (changes are overwritten by 'reef project refresh')."
+_CPP_STANDARD_PATTERN = re.compile(r"(?:(c|gnu)\+\+)?(\d+)")
+# with 'auto' policy, export is enabled by presets only (so it can be overridden when configuring build tree)
+_COMPILE_COMMANDS_EXPORT_LINES = {
+    "auto": [],
+    "always": ["set(CMAKE_EXPORT_COMPILE_COMMANDS ON)", ""],
+    "never": ["set(CMAKE_EXPORT_COMPILE_COMMANDS OFF)", ""],
+}
+# settings each kind of generated file depends on (keep in sync with generation code below)
+_TOP_LEVEL_SETTINGS_PATHS = [
+    "name",
+    "name_short",
+    "details.description",
+    "details.homepage",
+    "cmake.version_required",
+    "temp.version",
+    "temp.hierarchy.is_multiproject",
+    "languages.cpp.standard",
+    "languages.cpp.allow_extensions",
+    "advanced.compile_commands_export_policy",
+]
+_MODULE_SETTINGS_PATHS = ["name_short"]
+_PRESETS_SETTINGS_PATHS = ["cmake.version_required", "advanced.compile_commands_export_policy"]
+# configure and build presets generated for each build type (preset name, CMAKE_BUILD_TYPE value)
+_BUILD_TYPE_PRESETS = [("debug", "Debug"), ("release", "Release")]
+# minimum CMake minor version (with major version 3) supporting each version of presets file format
+_PRESETS_FORMAT_VERSIONS = [(21, 3), (20, 2), (19, 1)]
+
+
+class GeneratedFile(NamedTuple):
+    """Contents of a file generated by reef (path is relative to project source directory and uses '/' separators)."""
+
+    path: str
+    content: bytes
+
+
+class GeneratedFileInputs(NamedTuple):
+    """Inputs contents of a generated file depend on (apart from template version): values of settings (by their
+    paths) and JSON-serializable description of scanned sources."""
+
+    settings: dict[str, Any]
+    sources: Any
+
+
+def generate_cmake_files(settings: ProjectSettings, layout: ProjectLayout) -> list[GeneratedFile]:
+    """Generates CMake files for project with given settings and layout.
+
+    These are: top-level CMakeLists.txt, one CMakeLists.txt per module (for multi-module projects, otherwise module
+    target is defined in the top-level one) and CMakePresets.json (if required CMake version supports presets).
+    """
+    cmake_version = _parse_cmake_version(settings.cmake.version_required)
+    is_multiproject = settings.temp.hierarchy.is_multiproject
+    lines = [
+        *_project_lines(settings, cmake_version),
+        *_cpp_standard_lines(settings),
+        *_COMPILE_COMMANDS_EXPORT_LINES[settings.advanced.compile_commands_export_policy],
+    ]
+    files = []
+    if is_multiproject:
+        lines += [f"add_subdirectory({_quote_argument(module.name)})" for module in layout.modules]
+        for module in layout.modules:
+            module_lines = [_GENERATED_HEADER, "", *_module_target_lines(settings, module)]
+            files.append(GeneratedFile(f"{module.name}/{CMAKE_LISTS_FILE_NAME}", _join_lines(module_lines)))
+    else:
+        for module in layout.modules:
+            lines += _module_target_lines(settings, module)
+    files.insert(0, GeneratedFile(CMAKE_LISTS_FILE_NAME, _join_lines(lines)))
+
+    presets = _presets_data(cmake_version, settings.advanced.compile_commands_export_policy != "never")
+    if presets is not None:
+        files.append(GeneratedFile(CMAKE_PRESETS_FILE_NAME, get_json_codec().dumps(presets)))
+    return files
+
+
+def get_cmake_file_inputs(settings: ProjectSettings, layout: ProjectLayout) -> dict[str, GeneratedFileInputs]:
+    """Returns inputs of each CMake file generated for project with given settings and layout (by file path).
+
+    Contents of each file are fully determined by its inputs, so a file needs to be regenerated only if they changed.
+    """
+    modules = [_module_layout_data(module) for module in layout.modules]
+    is_multiproject = settings.temp.hierarchy.is_multiproject
+    inputs = {
+        CMAKE_LISTS_FILE_NAME: GeneratedFileInputs(
+            settings.get_many(_TOP_LEVEL_SETTINGS_PATHS),
+            [module["name"] for module in modules] if is_multiproject else modules,
+        )
+    }
+    if is_multiproject:
+        module_settings = settings.get_many(_MODULE_SETTINGS_PATHS)
+        for module in modules:
+            inputs[f"{module['name']}/{CMAKE_LISTS_FILE_NAME}"] = GeneratedFileInputs(module_settings, module)
+    if _presets_format_version(_parse_cmake_version(settings.cmake.version_required)) > 0:
+        inputs[CMAKE_PRESETS_FILE_NAME] = GeneratedFileInputs(settings.get_many(_PRESETS_SETTINGS_PATHS), None)
+    return inputs
+
+
+def parse_cpp_standard(standard: str) -> tuple[str, bool]:
+    """Returns CMake C++ standard number for given standard name (e.g. 'c++20', 'gnu++17' or '20') and whether
+    it implies GNU extensions."""
+    match = _CPP_STANDARD_PATTERN.fullmatch(standard.strip().lower())
+    if match is None or match.group(2) not in SUPPORTED_CPP_STANDARDS:
+        raise ValueError(
+            f"C++ standard '{standard}' is not supported "
+            + f"(supported values include: {', '.join('c++' + s for s in SUPPORTED_CPP_STANDARDS)} )."
+        )
+    return match.group(2), match.group(1) == "gnu"
+
+
+### IMPLEMENTATION DETAILS:
+
+
+def _parse_cmake_version(version: str) -> tuple[int, int]:
+    """Returns major and minor parts of CMake version."""
+    major, minor = version.split(".")[:2]
+    return int(major), int(minor)
+
+
+def _project_lines(settings: ProjectSettings, cmake_version: tuple[int, int]) -> list[str]:
+    """Returns header of top-level CMakeLists.txt (with required CMake version and project command)."""
+    lines = [
+        _GENERATED_HEADER,
+        "",
+        f"cmake_minimum_required(VERSION {cmake_version[0]}.{cmake_version[1]})",
+        "",
+        f"project({_quote_argument(settings.name)}",
+        f"    VERSION {settings.temp.version}",
+    ]
+    if settings.details.description:
+        lines.append(f"    DESCRIPTION {_quote_argument(settings.details.description, always=True)}")
+    if settings.details.homepage:
+        lines.append(f"    HOMEPAGE_URL {_quote_argument(settings.details.homepage, always=True)}")
+    return [*lines, "    LANGUAGES CXX", ")", ""]
+
+
+def _cpp_standard_lines(settings: ProjectSettings) -> list[str]:
+    """Returns lines setting C++ standard and extensions used by all targets."""
+    cpp = settings.languages.cpp
+    lines = []
+    is_gnu = False
+    if cpp.standard:
+        number, is_gnu = parse_cpp_standard(cpp.standard)
+        lines += [f"set(CMAKE_CXX_STANDARD {number})", "set(CMAKE_CXX_STANDARD_REQUIRED ON)"]
+    lines.append(f"set(CMAKE_CXX_EXTENSIONS {'ON' if cpp.allow_extensions or is_gnu else 'OFF'})")
+    return [*lines, ""]
+
+
+def _module_target_lines(settings: ProjectSettings, module: ModuleLayout) -> list[str]:
+    """Returns lines defining target built from module sources (relative to module's CMakeLists.txt directory)."""
+    short_name = _sanitize_target_name(settings.name_short)
+    target = f"{short_name}_{_sanitize_target_name(module.name)}" if module.name else short_name
+    files = [*module.sources, *module.headers]
+
+    if module.is_executable:
+        lines, scope = [f"add_executable({target})"], "PRIVATE"
+    elif module.sources:
+        lines, scope = [f"add_library({target})"], "PUBLIC"
+    else:
+        lines, scope, files = [f"add_library({target} INTERFACE)"], "INTERFACE", []
+    if not module.is_executable:
+        alias = f"{short_name}::{_sanitize_target_name(module.name)}" if module.name else f"{short_name}::{short_name}"
+        lines.append(f"add_library({alias} ALIAS {target})")
+
+    if files:
+        lines += ["", f"target_sources({target} PRIVATE", *[f"    {_quote_argument(file)}" for file in files], ")"]
+
+    lines += ["", f"target_include_directories({target}"]
+    if module.has_public_include_dir:
+        lines.append(f"    {scope} {_source_dir_argument(PUBLIC_INCLUDE_DIR_NAME)}")
+        if module.has_private_source_dir and scope != "INTERFACE":
+            lines.append(f"    PRIVATE {_source_dir_argument(PRIVATE_SOURCE_DIR_NAME)}")
+    else:
+        lines.append(f"    {scope} {_source_dir_argument()}")
+    return [*lines, ")", ""]
+
+
+def _presets_data(cmake_version: tuple[int, int], is_compile_commands_exported: bool) -> dict | None:
+    """Returns contents of CMakePresets.json in the newest format supported by given CMake version (or None)."""
+    format_version = _presets_format_version(cmake_version)
+    if format_version == 0:
+        return None
+    major, minor = cmake_version
+    data = {
+        "version": format_version,
+        "cmakeMinimumRequired": {"major": major, "minor": minor, "patch": 0},
+        "configurePresets": [
+            {
+                "name": name,
+                "displayName": build_type,
+                "binaryDir": "${sourceDir}/build/" + name,
+                "cacheVariables": {
+                    "CMAKE_BUILD_TYPE": build_type,
+                    **({"CMAKE_EXPORT_COMPILE_COMMANDS": "ON"} if is_compile_commands_exported else {}),
+                },
+            }
+            for name, build_type in _BUILD_TYPE_PRESETS
+        ],
+    }
+    if format_version >= 2:
+        data["buildPresets"] = [{"name": name, "configurePreset": name} for name, _ in _BUILD_TYPE_PRESETS]
+    return data
+
+
+def _presets_format_version(cmake_version: tuple[int, int]) -> int:
+    """Returns newest version of presets file format supported by given CMake version (0 if none is)."""
+    major, minor = cmake_version
+    if major != 3:
+        return 3 if major > 3 else 0
+    return next((version for min_minor, version in _PRESETS_FORMAT_VERSIONS if minor >= min_minor), 0)
+
+
+def _module_layout_data(module: ModuleLayout) -> dict[str, Any]:
+    """Returns JSON-serializable description of module layout."""
+    return {**module._asdict(), "sources": list(module.sources), "headers": list(module.headers)}
+
+
+def _sanitize_target_name(name: str) -> str:
+    """Replaces characters not allowed in CMake target names."""
+    return re.sub(r"[^A-Za-z0-9_.+-]", "_", name)
+
+
+def _quote_argument(value: str, *, always: bool = False) -> str:
+    """Returns CMake argument with given value (quoted and escaped if needed)."""
+    if not always and re.fullmatch(r"[A-Za-z0-9_./+-]+", value):
+        return value
+    return f'"{_escape(value)}"'
+
+
+def _source_dir_argument(*parts: str) -> str:
+    """Returns quoted CMake argument with path (given by non-empty parts) relative to current source directory."""
+    return '"${CMAKE_CURRENT_SOURCE_DIR}' + "".join(f"/{_escape(part)}" for part in parts if part) + '"'
+
+
+def _escape(value: str) -> str:
+    """Escapes characters that have special meaning in quoted CMake arguments."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("$", "\\$").replace("\n", "\\n")
+
+
+def _join_lines(lines: list[str]) -> bytes:
+    """Returns file contents with given lines (without trailing empty lines)."""
+    while lines and not lines[-1]:
+        lines = lines[:-1]
+    return ("\n".join(lines) + "\n").encode()
@@ -0,0 +1,100 @@
+import os
+from os import path
+from typing import NamedTuple
+
+from ..settings.project_temp_hierarchy_settings import ProjectTempHierarchySettings
+
+CPP_SOURCE_EXTENSIONS = frozenset([".cpp", ".cc", ".cxx", ".c++"])
+CPP_HEADER_EXTENSIONS = frozenset([".h", ".hpp", ".hh", ".hxx", ".inl", ".ipp"])
+
+PUBLIC_INCLUDE_DIR_NAME = "include"
+PRIVATE_SOURCE_DIR_NAME = "src"
+
+# directories that never contain project sources (build trees, reef config, VCS metadata, etc.)
+_IGNORED_DIR_NAMES = frozenset(["build", "out"])
+_IGNORED_DIR_PREFIXES = (".", "cmake-build-")
+
+
+class ModuleLayout(NamedTuple):
+    """C++ files of a single project module (paths are relative to module directory and use '/' separators).
+
+    Module name is also the path of its directory relative to project source directory (empty for single-module
+    projects, where source directory itself is the module directory).
+    """
+
+    name: str
+    sources: tuple[str, ...]
+    headers: tuple[str, ...]
+    has_public_include_dir: bool
+    has_private_source_dir: bool
+
+    @property
+    def is_executable(self) -> bool:
+        """Indicates whether module builds an executable (i.e. it has 'main' source file)."""
+        return any(path.splitext(path.basename(source))[0] == "main" for source in self.sources)
+
+
+class ProjectLayout(NamedTuple):
+    """Modules found in project source directory (in name order).
+
+    Directories are paths of all scanned directories (relative to project source directory, using '/' separators,
+    with empty path for source directory itself). Layout can change only if entries of one of them change.
+    """
+
+    modules: tuple[ModuleLayout, ...]
+    directories: tuple[str, ...] = ()
+
+    @property
+    def file_count(self) -> int:
+        """Number of C++ source and header files in all modules."""
+        return sum(len(module.sources) + len(module.headers) for module in self.modules)
+
+
+def scan_project_layout(source_path: str, hierarchy: ProjectTempHierarchySettings) -> ProjectLayout:
+    """Scans project source directory for modules and their C++ files.
+
+    In multi-module projects, each top-level directory containing C++ files is a module. Otherwise, the whole source
+    directory is a single module (with empty name and path).
+    """
+    directories: list[str] = []
+    if not hierarchy.is_multiproject:
+        return ProjectLayout((_scan_module(source_path, "", hierarchy, directories),), tuple(directories))
+    directories.append("")
+    modules = []
+    for entry in sorted(os.scandir(source_path), key=lambda entry: entry.name):
+        if entry.is_dir() and not _is_ignored_dir(entry.name):
+            module = _scan_module(entry.path, entry.name, hierarchy, directories)
+            if module.sources or module.headers:
+                modules.append(module)
+    return ProjectLayout(tuple(modules), tuple(directories))
+
+
+def _scan_module(
+    module_path: str, name: str, hierarchy: ProjectTempHierarchySettings, directories: list[str]
+) -> ModuleLayout:
+    """Collects C++ files in module directory (recursively), appending paths of scanned directories to given list."""
+    sources: list[str] = []
+    headers: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(module_path):
+        dirnames[:] = sorted(dirname for dirname in dirnames if not _is_ignored_dir(dirname))
+        relpath = path.relpath(dirpath, module_path)
+        prefix = "" if relpath == os.curdir else relpath.replace(os.sep, "/") + "/"
+        directories.append(f"{name}/{prefix}".strip("/") if name else prefix.rstrip("/"))
+        for filename in sorted(filenames):
+            extension = path.splitext(filename)[1].lower()
+            if extension in CPP_SOURCE_EXTENSIONS:
+                sources.append(prefix + filename)
+            elif extension in CPP_HEADER_EXTENSIONS:
+                headers.append(prefix + filename)
+    return ModuleLayout(
+        name,
+        tuple(sources),
+        tuple(headers),
+        hierarchy.separate_public_includes and path.isdir(path.join(module_path, PUBLIC_INCLUDE_DIR_NAME)),
+        hierarchy.separate_public_includes and path.isdir(path.join(module_path, PRIVATE_SOURCE_DIR_NAME)),
+    )
+
+
+def _is_ignored_dir(name: str) -> bool:
+    """Checks whether directory with given name is skipped when scanning for sources."""
+    return name in _IGNORED_DIR_NAMES or name.startswith(_IGNORED_DIR_PREFIXES)
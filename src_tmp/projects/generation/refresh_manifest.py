@@ -0,0 +1,162 @@
+import hashlib
+import json
+import os
+import time
+from os import path
+from typing import Any
+
+from reef.common.file_utils import dump_json, load_json
+
+from .cmake_generator import GeneratedFileInputs
+from .project_layout import ModuleLayout, ProjectLayout
+
+REFRESH_MANIFEST_FILENAME = "refresh_manifest.json"
+
+# version of manifest format (manifests in other formats are discarded)
+_MANIFEST_FORMAT_VERSION = 1
+# entries may be added to directories modified this close to the time they are stamped without changing their
+# timestamps (e.g. with coarse timestamp resolution), so names of their entries are recorded and compared too
+_RACY_TIMESTAMP_WINDOW_NS = 2_000_000_000
+
+
+class RefreshManifest:
+    """
+    Records inputs each file generated by 'reef project refresh' came from, so refresh can skip work when they did
+    not change.
+
+    For each generated file, manifest holds hashes of settings and scanned sources it depends on, versions of
+    generator template and reef, and modification time and size of written file. It also caches result of scanning
+    project sources, together with modification times of scanned directories, so sources need to be scanned again
+    only if entries of some directory changed. Manifest is stored in project config directory (see
+    REFRESH_MANIFEST_FILENAME) and is machine-owned.
+    """
+
+    def __init__(self, data: dict[str, Any] | None = None):
+        """Initializes manifest with given data (as loaded from manifest file), or an empty one."""
+        self._data: dict[str, Any] = data if data is not None else {"format_version": _MANIFEST_FORMAT_VERSION}
+        self._data.setdefault("outputs", {})
+
+    @staticmethod
+    def load(config_path: str) -> "RefreshManifest":
+        """Loads manifest from project config directory (returns empty manifest if it is missing or outdated)."""
+        try:
+            data = load_json(path.join(config_path, REFRESH_MANIFEST_FILENAME))
+        except (OSError, ValueError):
+            return RefreshManifest()
+        if not isinstance(data, dict) or data.get("format_version") != _MANIFEST_FORMAT_VERSION:
+            return RefreshManifest()
+        return RefreshManifest(data)
+
+    def save(self, config_path: str) -> bool:
+        """Saves manifest to (existing) project config directory (returns False if it was unchanged)."""
+        return dump_json(path.join(config_path, REFRESH_MANIFEST_FILENAME), self._data, compact=True)
+
+    def get_layout(self, source_path: str, hierarchy: dict[str, Any]) -> ProjectLayout | None:
+        """Returns cached layout of project sources, or None if it may be outdated (so sources need to be scanned).
+
+        Layout is outdated if it was scanned from another source directory or with other hierarchy settings, or if
+        entries of any scanned directory may have changed since (checked with one stat call per directory, and by
+        listing directories that were modified shortly before they were stamped).
+        """
+        layout = self._data.get("layout")
+        if layout is None or layout["source_path"] != source_path or layout["hierarchy"] != hierarchy:
+            return None
+        for directory, key in layout["directories"].items():
+            dirpath = path.join(source_path, *directory.split("/"))
+            if key is None or key[:2] != _read_file_key(dirpath):
+                return None
+            if len(key) > 2 and key[2] != _read_entries_hash(dirpath):
+                return None
+        modules = tuple(
+            ModuleLayout(m["name"], tuple(m["sources"]), tuple(m["headers"]), *m["flags"]) for m in layout["modules"]
+        )
+        return ProjectLayout(modules, tuple(layout["directories"]))
+
+    def set_layout(self, source_path: str, hierarchy: dict[str, Any], layout: ProjectLayout) -> None:
+        """Caches layout of project sources scanned with given hierarchy settings.
+
+        Modification times of scanned directories are read now, so it should be called after all generated files
+        are written (as writing them modifies their directories).
+        """
+        now = time.time_ns()
+        self._data["layout"] = {
+            "source_path": source_path,
+            "hierarchy": hierarchy,
+            "directories": {
+                directory: _read_directory_key(path.join(source_path, *directory.split("/")), now)
+                for directory in layout.directories
+            },
+            "modules": [
+                {
+                    "name": module.name,
+                    "sources": list(module.sources),
+                    "headers": list(module.headers),
+                    "flags": [module.has_public_include_dir, module.has_private_source_dir],
+                }
+                for module in layout.modules
+            ],
+        }
+
+    def is_output_current(self, filepath: str, relpath: str, inputs: dict[str, Any]) -> bool:
+        """Checks whether generated file was written from given inputs (see 'get_output_inputs') and was not
+        modified since then."""
+        output = self._data["outputs"].get(relpath)
+        if output is None or output["inputs"] != inputs:
+            return False
+        return output["file_key"] is not None and output["file_key"] == _read_file_key(filepath)
+
+    def set_output(self, filepath: str, relpath: str, inputs: dict[str, Any]) -> None:
+        """Records that generated file (just written or verified) is up-to-date with given inputs.
+
+        Contents of the file are known at this point, so it is stamped right away, even if it was just modified.
+        """
+        self._data["outputs"][relpath] = {"inputs": inputs, "file_key": _read_file_key(filepath)}
+
+    def retain_outputs(self, relpaths: set[str]) -> None:
+        """Forgets about generated files other than given ones (e.g. files of removed modules)."""
+        self._data["outputs"] = {p: output for p, output in self._data["outputs"].items() if p in relpaths}
+
+
+def get_output_inputs(inputs: GeneratedFileInputs, template_version: int, reef_version: str) -> dict[str, Any]:
+    """Returns manifest record of inputs generated file depends on (with hashes of settings and sources)."""
+    return {
+        "settings_hash": _hash_data(inputs.settings),
+        "sources_hash": _hash_data(inputs.sources),
+        "template_version": template_version,
+        "reef_version": reef_version,
+    }
+
+
+### IMPLEMENTATION DETAILS:
+
+
+def _hash_data(data: Any) -> str:
+    """Returns hash of JSON-serializable data (independent of order of dictionary keys)."""
+    return hashlib.sha256(json.dumps(data, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+
+def _read_file_key(filepath: str) -> list[int] | None:
+    """Returns modification time and size of file or directory (or None if it does not exist)."""
+    try:
+        stat = os.stat(filepath)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _read_directory_key(dirpath: str, now: int) -> list[Any] | None:
+    """Returns key of directory (as '_read_file_key'), which also holds hash of its entry names if the directory
+    was modified too recently (before given current time) for its timestamp to be trusted."""
+    key: list[Any] | None = _read_file_key(dirpath)
+    if key is None or key[0] <= now - _RACY_TIMESTAMP_WINDOW_NS:
+        return key
+    entries_hash = _read_entries_hash(dirpath)
+    return key + [entries_hash] if entries_hash is not None else None
+
+
+def _read_entries_hash(dirpath: str) -> str | None:
+    """Returns hash of names of directory entries (or None if it cannot be listed)."""
+    try:
+        return _hash_data(sorted(os.listdir(dirpath)))
+    except OSError:
+        return None
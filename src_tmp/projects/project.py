@@ -1,23 +1,37 @@
+import os
+import sys
+from contextlib import contextmanager
 from os import mkdir, path
-from typing import Any
+from typing import Any, Iterator
 
 from .repository.data.project_item_data import ProjectItemData
-from .settings.project_settings import ProjectSettings
+from .settings.project_settings import PROJECT_SETTINGS_FILENAME, ProjectSettings
 
 
 class Project:
-    """Represents data and functionality for Reef projects."""
+    """
+    Represents data and functionality for Reef projects.
+
+    Project settings are loaded from project's config file on first access to a member that depends on them, so
+    members available from project repository data (name, paths) never touch per-project files. Use 'preload' to
+    load settings upfront.
+    """
 
     def __init__(self, info: ProjectItemData, *, settings: ProjectSettings | None = None):
-        """Initializes repository given loaded project list data."""
+        """Initializes repository given loaded project list data (and optionally, already loaded settings)."""
         self._info: ProjectItemData = info
         self._settings: ProjectSettings | None = settings
+        self._settings_file_key: tuple[int, int, int] | None = None
+        self._is_editing = False
 
-        if self._settings is None:
-            self.reload_settings()
+        if self._settings is not None:
+            assert self._settings.name == self._info.name
+            self._settings_file_key = self._read_settings_file_key()
 
-        assert self._settings is not None
-        assert self._settings.name == self._info.name
+    @property
+    def info(self) -> ProjectItemData:
+        """Project item data stored in the project repository."""
+        return self._info
 
     @property
     def name(self) -> str:
@@ -32,7 +46,7 @@ class Project:
     @property
     def source_path(self) -> str:
         """Path where reef project source is located."""
-        return self._info.config_path
+        return self._info.source_path
 
     @property
     def is_config_inplace(self) -> bool:
@@ -45,15 +59,34 @@ class Project:
             print(f"SOURCE PATH: {self.source_path}")
             print(f"CONFIG PATH: {'(IN)' if self.is_config_inplace else '(OUT)'} {self.config_path}")
             print("PROJECT SETTINGS:")
-        self._settings.print_properties(skip_unset=not verbose)
+        self.settings.write_to(sys.stdout, skip_unset=not verbose)
+
+    def to_record(self, verbose: bool = False) -> dict[str, Any]:
+        """Returns machine-readable record with project info and settings (including unset ones if verbose)."""
+        return {
+            "name": self.name,
+            "source_path": self.source_path,
+            "config_path": self.config_path,
+            "is_config_inplace": self.is_config_inplace,
+            "settings": self.settings.to_values_dict(skip_unset=not verbose),
+        }
 
     def get(self, key: str) -> Any:
         """Returns value for setting given by key."""
-        return self._settings.get(key)
+        return self.settings.get(key)
 
-    def config_set_entry(self, key: str, value: str, project_name: str | None = None) -> None:
-        """Sets value for a setting given by key."""
-        return self._settings.set(key, value)
+    def config_set_entry(self, key: str, value: Any, project_name: str | None = None) -> None:
+        """Sets value for a setting given by key (string values are converted to setting's type, if needed).
+
+        Settings are saved, unless the change is a part of an enclosing editing session (see 'edit').
+        """
+        with self.edit() as settings:
+            settings.set(key, _convert_setting_value(settings, key, value))
+
+    def config_reset_entry(self, key: str) -> None:
+        """Resets setting given by key to its default value (saving settings as in 'config_set_entry')."""
+        with self.edit() as settings:
+            settings.unset(key)
 
     def config_add_entry_item(self, key: str, value: str, project_name: str | None = None):
         """Adds an entry to the list-like setting given by key."""
@@ -67,13 +100,80 @@ class Project:
         """Clears all items from the list-like setting given by key."""
         raise NotImplementedError("List-like project setting are not yey implemented.")
 
+    @property
+    def settings_file_path(self) -> str:
+        """Path to default JSON config file with project settings."""
+        return path.join(self.config_path, PROJECT_SETTINGS_FILENAME)
+
+    @property
+    def settings(self) -> ProjectSettings:
+        """Project settings (loaded from default JSON config file on first access)."""
+        if self._settings is None:
+            self.reload_settings()
+        assert self._settings is not None
+        return self._settings
+
+    @property
+    def is_settings_loaded(self) -> bool:
+        """Indicates whether project settings were already loaded (or given explicitly)."""
+        return self._settings is not None
+
+    def preload(self) -> "Project":
+        """Loads project settings now, if they are not loaded yet (e.g. to read config files of many projects in
+        one batch). Returns the project itself."""
+        if self._settings is None:
+            self.reload_settings()
+        return self
+
+    def is_settings_stale(self) -> bool:
+        """Checks whether default JSON config file was changed since settings were loaded or saved."""
+        return self._settings_file_key is not None and self._settings_file_key != self._read_settings_file_key()
+
     def reload_settings(self) -> None:
         """Loads or reloads settings from default JSON config file."""
-        self._settings = ProjectSettings.load_from_json(self.config_path)
+        self._settings_file_key = self._read_settings_file_key()
+        settings = ProjectSettings.load_from_json(self.config_path)
+        if settings.name != self._info.name:
+            raise ValueError(
+                f"Project name in settings ('{settings.name}') does not match its registered name ('{self.name}')."
+            )
+        self._settings = settings
+
+    @contextmanager
+    def edit(self) -> Iterator[ProjectSettings]:
+        """Starts editing session of project settings, which are given as context value.
+
+        Any number of changes can be made within the context. At its end, settings are validated and saved once
+        (file is written only if its contents changed). If the context exits with an exception (or validation fails),
+        all changes are rolled back instead. Nested sessions are merged into the outermost one.
+        """
+        settings = self.settings
+        if self._is_editing:
+            yield settings
+            return
+        snapshot = settings.to_dict()
+        self._is_editing = True
+        try:
+            yield settings
+            settings.validate()
+            self.save_settings()
+        except BaseException:
+            # restore in place, so references to settings taken before the session see pre-edit values
+            ProjectSettings.__init__(settings, snapshot)
+            raise
+        finally:
+            self._is_editing = False
 
-    def save_settings(self) -> None:
-        """Saves current project settings to default JSON config file."""
-        self._settings.save_to_json(self.config_path)
+    @property
+    def is_editing(self) -> bool:
+        """Indicates whether editing session of project settings is in progress (see 'edit')."""
+        return self._is_editing
+
+    def save_settings(self) -> bool:
+        """Saves current project settings to default JSON config file (returns False if it was unchanged)."""
+        is_written = self.settings.save_to_json(self.config_path)
+        self._settings_file_key = self._read_settings_file_key()
+        return is_written
 
     def initialize_inplace_settings(self) -> None:
         """Given proper settings, it initializes proper in-place config directory and settings file there."""
@@ -86,3 +186,42 @@ class Project:
         if not path.exists(self.config_path):
             mkdir(self.config_path)
         self.save_settings()
+
+    def _read_settings_file_key(self) -> tuple[int, int, int] | None:
+        """Returns key identifying current state of default JSON config file (or None if it does not exist)."""
+        try:
+            stat = os.stat(self.settings_file_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+_BOOLEAN_STRINGS = {
+    "true": True,
+    "yes": True,
+    "on": True,
+    "1": True,
+    "false": False,
+    "no": False,
+    "off": False,
+    "0": False,
+}
+
+
+def _convert_setting_value(settings: ProjectSettings, key: str, value: Any) -> Any:
+    """Converts string value (e.g. given in command line) to the type of setting given by key."""
+    if not isinstance(value, str):
+        return value
+    parent_key, _, leaf_key = key.rpartition(".")
+    parent = settings.get(parent_key) if parent_key else settings
+    field = getattr(type(parent), "_settings_fields", {}).get(leaf_key)
+    if field is None or field.value_type is str:
+        return value
+    if field.value_type is bool and value.lower() in _BOOLEAN_STRINGS:
+        return _BOOLEAN_STRINGS[value.lower()]
+    if field.value_type in (int, float):
+        try:
+            return field.value_type(value)
+        except ValueError:
+            pass
+    raise ValueError(f"Value '{value}' is not valid for setting '{key}' of type '{field.value_type.__name__}'.")
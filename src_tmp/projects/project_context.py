@@ -0,0 +1,140 @@
+import marshal
+import os
+from os import path
+from typing import Any, Callable, NamedTuple
+
+from reef.common.file_utils import write_file_atomic
+
+REEF_CONFIG_DIR_NAME = ".reef"
+PROJECT_CONFIG_FILE_NAME = "project.json"
+CONTEXT_CACHE_FILE_NAME = "context_cache.bin"
+
+_CONTEXT_CACHE_FORMAT_VERSION = 1
+_CONTEXT_CACHE_MAX_ENTRIES = 256
+
+
+class ProjectContext(NamedTuple):
+    """Project, module and component (empty string if not applicable) that given directory belongs to."""
+
+    project: str
+    module: str = ""
+    component: str = ""
+
+
+class ProjectContextResolver:
+    """
+    Infers project context (project::module::component) from a directory, e.g. current working directory.
+
+    Directory tree is walked upward to the nearest directory containing in-place reef config ('.reef'), which
+    is a project source directory. Module and component are then given by directories below it, according to
+    project's hierarchy settings (in multi-module projects the first level are modules and the second level are
+    components, in single-module projects the first level are components).
+
+    Results are memoized per directory and can be stored in a persistent cache file. Cached result is valid as long
+    as modification times of all directories visited by the walk and of project config file are unchanged (which
+    takes a single stat call per directory to check). Project settings are only imported and loaded on cache miss.
+    """
+
+    def __init__(self, cache_path: str | None = None):
+        """Initializes context resolver (optionally, with path to the persistent cache file)."""
+        self._cache_path = cache_path
+        self._memo: dict[str, ProjectContext | None] = {}
+        self._cache: dict[str, tuple[Any, list[tuple[str, int]]]] = self._load_cache(cache_path) if cache_path else {}
+        self._is_cache_modified = False
+
+    def resolve(self, directory: str, is_registered: Callable[[str], bool] | None = None) -> ProjectContext | None:
+        """Returns context inferred for given directory, or None if it is not contained in reef project.
+
+        If predicate checking whether project with given name is registered is given, None is also returned for
+        directories of unregistered projects (so that default project is used for them instead).
+        """
+        result = self._resolve(path.abspath(directory))
+        if result is not None and is_registered is not None and not is_registered(result.project):
+            return None
+        return result
+
+    def save_cache(self) -> bool:
+        """Writes persistent cache file if it was modified (returns False if it was not)."""
+        if self._cache_path is None or not self._is_cache_modified:
+            return False
+        entries = list(self._cache.items())[-_CONTEXT_CACHE_MAX_ENTRIES:]
+        try:
+            write_file_atomic(self._cache_path, marshal.dumps((_CONTEXT_CACHE_FORMAT_VERSION, entries)))
+        except OSError:
+            return False
+        self._is_cache_modified = False
+        return True
+
+    ### IMPLEMENTATION DETAILS:
+
+    def _resolve(self, directory: str) -> ProjectContext | None:
+        """Returns context inferred for given absolute directory path (memoized and cached)."""
+        if directory in self._memo:
+            return self._memo[directory]
+
+        entry = self._cache.get(directory)
+        if entry is not None and _are_stamps_valid(entry[1]):
+            result = ProjectContext(*entry[0]) if entry[0] is not None else None
+        else:
+            result, stamps = self._infer(directory)
+            self._cache.pop(directory, None)
+            self._cache[directory] = (tuple(result) if result is not None else None, stamps)
+            self._is_cache_modified = True
+
+        self._memo[directory] = result
+        return result
+
+    def _load_cache(self, cache_path: str) -> dict[str, tuple[Any, list[tuple[str, int]]]]:
+        """Loads persistent cache file (returns empty cache if it does not exist or cannot be read)."""
+        try:
+            with open(cache_path, mode="rb") as fp:
+                version, entries = marshal.load(fp)
+        except (OSError, EOFError, ValueError, TypeError):
+            return {}
+        return dict(entries) if version == _CONTEXT_CACHE_FORMAT_VERSION else {}
+
+    def _infer(self, directory: str) -> tuple[ProjectContext | None, list[tuple[str, int]]]:
+        """Infers context for given directory by walking up the directory tree.
+
+        Returns inferred context and list of (path, modification time) pairs the result depends on.
+        """
+        stamps = []
+        root = directory
+        while True:
+            try:
+                stamps.append((root, os.stat(root).st_mtime_ns))
+            except FileNotFoundError:
+                return None, stamps
+            if path.isdir(path.join(root, REEF_CONFIG_DIR_NAME)):
+                break
+            parent = path.dirname(root)
+            if parent == root:
+                return None, stamps
+            root = parent
+
+        config_path = path.join(root, REEF_CONFIG_DIR_NAME)
+        config_file_path = path.join(config_path, PROJECT_CONFIG_FILE_NAME)
+        try:
+            stamps.append((config_file_path, os.stat(config_file_path).st_mtime_ns))
+        except FileNotFoundError:
+            return None, stamps
+        from .settings.project_settings import ProjectSettings
+
+        settings = ProjectSettings.load_from_json(config_path)
+
+        parts = path.relpath(directory, root).split(os.sep) if directory != root else []
+        if parts and parts[0].startswith("."):
+            parts = []
+        if not settings.temp.hierarchy.is_multiproject:
+            parts = ["", *parts]
+        module = parts[0] if len(parts) > 0 else ""
+        component = parts[1] if len(parts) > 1 else ""
+        return ProjectContext(settings.name, module, component), stamps
+
+
+def _are_stamps_valid(stamps: list[tuple[str, int]]) -> bool:
+    """Checks whether all paths still have recorded modification times."""
+    try:
+        return all(os.stat(stamp_path).st_mtime_ns == mtime for stamp_path, mtime in stamps)
+    except FileNotFoundError:
+        return False
@@ -1,20 +1,41 @@
-from typing import Iterable
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator
+
+from reef.common.lru_cache import CacheStats, LruCache
 
 from .project import Project
 from .repository.data.project_item_data import ProjectItemData
-from .repository.project_repository import ProjectRepository
+
+if TYPE_CHECKING:
+    from .repository.project_repository_backends import AnyProjectRepository
+
+DEFAULT_PROJECT_CACHE_SIZE = 64
 
 
 class ProjectFactory:
     """Foctory that references project repository and manages creation and loading of project settings data."""
 
-    def __init__(self, project_repository: ProjectRepository):
-        """Initializes factory object given Reef project repository."""
-        self._repository: ProjectRepository = project_repository
-        self._project_cache: dict[str, Project] = {}
+    def __init__(self, project_repository: AnyProjectRepository, *, cache_size: int = DEFAULT_PROJECT_CACHE_SIZE):
+        """Initializes factory object given Reef project repository (and maximum number of cached projects)."""
+        self._repository: AnyProjectRepository = project_repository
+        self._project_cache: LruCache[str, Project] = LruCache(cache_size)
+        # projects being edited (see 'edit_project'), which are kept regardless of cache eviction
+        self._pinned_projects: dict[str, Project] = {}
+
+    @property
+    def repository(self) -> AnyProjectRepository:
+        """Reef project repository referenced by the factory."""
+        return self._repository
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        """Usage statistics of the project cache."""
+        return self._project_cache.stats
 
     @property
-    def project_items(self) -> Iterable[ProjectItemData]:
+    def project_items(self) -> Iterator[ProjectItemData]:
         """Allows to iterate over project data items registered in project repository."""
         return iter(self._repository)
 
@@ -24,9 +45,14 @@ class ProjectFactory:
             raise KeyError(f"Project '{project_name}' is not registered in reef project repository.")
         return self._repository[project_name]
 
+    def find_project_for_path(self, project_path: str) -> Project | None:
+        """Gets Project whose source or config directory contains given path (or None if there is no such project)."""
+        item = self._repository.find_project_for_path(project_path)
+        return self._get_project_impl(item.name) if item is not None else None
+
     def __contains__(self, project_name: str) -> bool:
         """Checks whether reef project with given name is registered."""
-        return project_name in self._repository.project_names
+        return project_name in self._repository
 
     def __getitem__(self, project_name: str) -> Project:
         """Gets Project object representing reef project with given name."""
@@ -38,16 +64,19 @@ class ProjectFactory:
         """Adds given project to the repository."""
         if project.name in self._repository:
             raise KeyError(f"Project with name '{project.name}' is already registered in reef project repository.")
-        self._repository.add_project_from_data(project.info)
-        self._repository.save()
-        self._project_cache[project.name] = project
+        with self._repository.edit():
+            self._repository.add_project_from_data(project.info)
+        self._project_cache.put(project.name, project)
 
     def remove(self, project_name: str) -> None:
         """Removes named project to the repository."""
         if project_name not in self._repository:
             raise KeyError(f"Project '{project_name}' is not registered in reef project repository.")
-        self._repository.remove_project(project_name)
-        self._repository.save()
+        if project_name in self._pinned_projects:
+            raise RuntimeError(f"Project '{project_name}' cannot be removed while its settings are being edited.")
+        with self._repository.edit():
+            self._repository.remove_project(project_name)
+        self._project_cache.pop(project_name)
 
     @property
     def default_project_name(self) -> str | None:
@@ -66,8 +95,8 @@ class ProjectFactory:
         if project_name == self.default_project_name:
             return
 
-        self._repository.default_project_name = project_name
-        self._repository.save()
+        with self._repository.edit():
+            self._repository.default_project_name = project_name
 
     def get_default_module_name_for(self, project_name: str) -> str | None:
         """Returns name of a module set as a default for a project, or None if not set."""
@@ -82,12 +111,54 @@ class ProjectFactory:
         if module_name == self.get_default_module_name_for(project_name):
             return
 
-        self._repository[project_name].default_module = module_name
-        self._repository.save()
+        with self._repository.edit():
+            self._repository.set_default_module(project_name, module_name)
+
+    @contextmanager
+    def deferred_save(self) -> Iterator[None]:
+        """Defers saving project repository until the end of the context (see repository's 'edit'), so it is saved
+        at most once (and only if it was modified). If the context exits with an exception, unsaved changes are
+        discarded instead.
+        """
+        try:
+            with self._repository.edit():
+                yield
+        except BaseException:
+            # cached projects may refer to discarded repository items
+            self._project_cache.clear()
+            raise
+
+    @contextmanager
+    def edit_project(self, project_name: str) -> Iterator[Project]:
+        """Starts editing session of settings of project with given name (see Project's 'edit'), which is given as
+        context value. Project is pinned in the factory until the end of the context, so the same (edited) object
+        is returned for it even if it is evicted from the cache in the meantime (so unsaved changes are not lost).
+        """
+        project = self[project_name]
+        if project_name in self._pinned_projects:
+            with project.edit():
+                yield project
+            return
+        self._pinned_projects[project_name] = project
+        try:
+            with project.edit():
+                yield project
+        finally:
+            del self._pinned_projects[project_name]
 
     def _get_project_impl(self, project_name: str) -> Project:
-        """Implemets project retrieval using cache."""
+        """Implemets project retrieval using cache (projects with settings changed on disk are loaded again)."""
         assert project_name in self
-        if project_name not in self._project_cache:
-            self._project_cache[project_name] = Project(info=self._repository[project_name])
-        return self._project_cache[project_name]
+        project = self._pinned_projects.get(project_name)
+        if project is not None:
+            return project
+        project = self._project_cache.get(project_name, is_valid=_is_project_up_to_date)
+        if project is None:
+            project = Project(info=self._repository[project_name])
+            self._project_cache.put(project_name, project)
+        return project
+
+
+def _is_project_up_to_date(project: Project) -> bool:
+    """Checks whether cached project's settings are up to date with its config file."""
+    return not project.is_settings_stale()
@@ -1,12 +1,18 @@
+from contextlib import ExitStack, contextmanager
+from fnmatch import fnmatchcase
 from os import path
 from shutil import rmtree
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
+
+from reef.common.lru_cache import CacheStats
 
 from .project import Project
-from .project_factory import ProjectFactory
+from .project_factory import DEFAULT_PROJECT_CACHE_SIZE, ProjectFactory
+from .project_refresh import ProjectRefreshResult, refresh_project, refresh_projects
 from .project_templates.project_template_repository import ProjectTemplateRepository
+from .project_validation import ProjectValidationResult, validate_projects
 from .repository.data.project_item_data import ProjectItemData
-from .repository.project_repository import ProjectRepository
+from .repository.project_repository_backends import REPOSITORY_BACKEND_JSON, create_project_repository
 from .settings.project_settings import ProjectSettings
 
 
@@ -18,6 +24,8 @@ class ProjectManager:
         factory: ProjectFactory | None = None,
         repository_path: str | None = None,
         template_repository: ProjectTemplateRepository | None = None,
+        repository_backend: str = REPOSITORY_BACKEND_JSON,
+        project_cache_size: int = DEFAULT_PROJECT_CACHE_SIZE,
     ):
         """Creates project manager with injected project factory, or path to the underlying project data repository."""
         if factory is None and repository_path is None:
@@ -33,17 +41,36 @@ class ProjectManager:
                     "WARNING: [ProjectManager] Project repository path was provided while injecting ProjectFactory object. Injected object is used."
                 )
         else:
-            repository = ProjectRepository(repository_path)
-            self._factory = ProjectFactory(repository)
+            assert repository_path is not None
+            repository = create_project_repository(repository_path, repository_backend)
+            self._factory = ProjectFactory(repository, cache_size=project_cache_size)
 
         self._templates = template_repository if template_repository is not None else ProjectTemplateRepository()
+        self._edit_session: ExitStack | None = None
+        # projects joined to current deferred save, by path of their settings file
+        self._edited_projects: dict[str, Project] = {}
 
         assert self._factory is not None
 
     @property
     def project_items(self) -> Iterable[tuple[str, str, bool]]:
         """Allows to iterate over basic informaton for registered Reef projects including: name, source path and whether config is inplace."""
-        return ((p.name, p.source_path, p.is_config_inplace) for p in self._factory)
+        return ((p.name, p.source_path, p.is_config_inplace) for p in self._factory.project_items)
+
+    @property
+    def project_names(self) -> Iterable[str]:
+        """Allows to iterate over names of all registered Reef projects."""
+        return (p.name for p in self._factory.project_items)
+
+    @property
+    def project_cache_stats(self) -> CacheStats:
+        """Usage statistics (hits, misses, evictions, etc.) of the cache of loaded projects."""
+        return self._factory.cache_stats
+
+    @property
+    def repository_lock_wait_time(self) -> float:
+        """Total time (in seconds) spent waiting for project repository file locks (to diagnose contention)."""
+        return self._factory.repository.lock_wait_time
 
     @property
     def default_project(self) -> Project | None:
@@ -55,22 +82,82 @@ class ProjectManager:
         """Returns name of a project set as a default, or None if not set."""
         return self._factory.default_project_name
 
+    def find_project_for_path(self, project_path: str) -> Project | None:
+        """Returns registered Project that contains given path (the innermost one, if projects are nested)."""
+        return self._factory.find_project_for_path(project_path)
+
     def change_default_project(self, project_name: str) -> None:
         """Changes project set as default to the one given by name."""
         return self._factory.change_default_project(project_name)
 
-    def refresh(self, project_name: str) -> None:
-        """Regenerate project files handled by reef."""
-        # TODO
-        raise NotImplementedError("Refresh functionality not yet implemented.")
+    @contextmanager
+    def deferred_save(self) -> Iterator[None]:
+        """Defers saving changes until the end of the context: settings file of each modified project and project
+        repository are saved at most once, and only if their contents changed. Settings of all modified projects are
+        validated before any of them is saved. If the context exits with an exception (or validation fails), all
+        changes are rolled back instead.
+        """
+        if self._edit_session is not None:
+            yield
+            return
+        with ExitStack() as session:
+            self._edit_session = session
+            try:
+                session.enter_context(self._factory.deferred_save())
+                yield
+                for project in self._edited_projects.values():
+                    project.settings.validate()
+            finally:
+                self._edit_session = None
+                self._edited_projects = {}
+
+    def refresh(self, project_name: str | None = None) -> ProjectRefreshResult:
+        """Regenerates build files of given (or default) project, rewriting only files whose contents changed."""
+        return refresh_project(self._factory[self._config_process_project_name(project_name)])
+
+    def refresh_many(
+        self,
+        project_names: Iterable[str | None] | None = None,
+        jobs: int | None = None,
+        name_patterns: Iterable[str] | None = None,
+    ) -> list[ProjectRefreshResult]:
+        """Regenerates build files of given (or default) projects, or all registered ones, using 'jobs' processes.
+
+        Projects can be filtered by shell-style patterns their names have to match (any of them). Results (with
+        timings and errors) are returned in registration order (or order of given project names).
+        """
+        if project_names is None:
+            items = list(self._factory.project_items)
+        else:
+            items = [self._factory.item_for(self._config_process_project_name(name)) for name in project_names]
+        if name_patterns is not None:
+            patterns = list(name_patterns)
+            items = [item for item in items if any(fnmatchcase(item.name, pattern) for pattern in patterns)]
+        return refresh_projects(items, jobs)
 
     def describe(self, project_name: str | None = None, verbose: bool = False):
         """Prints configuration information for given project."""
-        if project_name is None:
-            project_name = self.default_project_name
-        if project_name not in self._factory:
-            raise KeyError(f"Project with name '{project_name}' not found.")
-        self._factory[project_name].describe(verbose)
+        self._factory[self._config_process_project_name(project_name)].describe(verbose)
+
+    def project_records(
+        self, project_names: Iterable[str | None] | None = None, verbose: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        """Yields machine-readable records with settings for given (or default) projects, or all registered ones."""
+        for project_name in project_names if project_names is not None else list(self.project_names):
+            yield self._factory[self._config_process_project_name(project_name)].to_record(verbose)
+
+    def validate_projects(
+        self, project_names: Iterable[str | None] | None = None, jobs: int | None = None
+    ) -> list[ProjectValidationResult]:
+        """Loads and validates settings of given (or default) projects, or all registered ones, using 'jobs' threads.
+
+        Results (with timings and errors) are returned in registration order (or order of given project names).
+        """
+        if project_names is None:
+            items = list(self._factory.project_items)
+        else:
+            items = [self._factory.item_for(self._config_process_project_name(name)) for name in project_names]
+        return validate_projects((Project(item) for item in items), jobs)
 
     def create(self, project_name: str, project_template_name: str, base_path: str) -> None:
         """Creates a new project with config based on given template in new directory named as project located in bae path given."""
@@ -143,36 +230,70 @@ class ProjectManager:
 
     def _config_process_project_name(self, project_name: str | None = None) -> str:
         """Validates project name if given, or returns default project name if None is given."""
-        if project_name is None:
-            project_name = self.default_project_name
-        if project_name not in self._factory:
-            raise KeyError(f"Project with name '{project_name}' not found.")
-        return project_name
+        name = project_name if project_name is not None else self.default_project_name
+        if name is None:
+            raise KeyError("Project name was not given and no default project is set.")
+        if name not in self._factory:
+            raise KeyError(f"Project with name '{name}' not found.")
+        return name
 
     def config_get_entry(self, key: str, project_name: str | None = None) -> Any:
         """Returns value for setting given by key for a specified (or default) project."""
         return self._factory[self._config_process_project_name(project_name)].get(key)
 
-    def config_set_entry(self, key: str, value: str, project_name: str | None = None) -> None:
+    def config_set_entry(self, key: str, value: Any, project_name: str | None = None) -> None:
         """Sets value for a setting given by key for a specified (or default) project."""
-        return self._factory[self._config_process_project_name(project_name)].set(key, value)
+        project = self._join_edit_session(self._factory[self._config_process_project_name(project_name)])
+        project.config_set_entry(key, value)
 
-    def config_list_entries(self, project_name: str | None = None) -> None:
+    def config_list_entries(self, project_name: str | None = None, verbose: bool = False) -> None:
         """Lists value for all settings for a specified (or default) project."""
-        return self._factory[self._config_process_project_name(project_name)].describe(config_only=True)
+        return self._factory[self._config_process_project_name(project_name)].describe(verbose, config_only=True)
+
+    def config_records(
+        self, project_names: Iterable[str | None] | None = None, verbose: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        """Yields machine-readable settings (as listed by 'config_list_entries') for given (or default) projects, or all
+        registered ones."""
+        for project_name in project_names if project_names is not None else list(self.project_names):
+            project = self._factory[self._config_process_project_name(project_name)]
+            yield project.settings.to_values_dict(skip_unset=not verbose)
+
+    def config_reset_entry(self, key: str, project_name: str | None = None) -> None:
+        """Resets (to default value) the setting given by key for a specified (or default) project."""
+        project = self._join_edit_session(self._factory[self._config_process_project_name(project_name)])
+        project.config_reset_entry(key)
 
     def config_unset_entry(self, key: str, project_name: str | None = None) -> None:
         """Unsets (to default value) the setting given by key for a specified (or default) project."""
-        return self.config_set_entry(key, None, project_name)
+        return self.config_reset_entry(key, project_name)
 
     def config_add_entry_item(self, key: str, value: str, project_name: str | None = None):
         """Adds an entry to the list-like setting given by key for a specified (or default) project."""
-        return self._factory[self._config_process_project_name(project_name)].add_item(key, value)
+        project = self._join_edit_session(self._factory[self._config_process_project_name(project_name)])
+        return project.config_add_entry_item(key, value)
 
     def config_remove_entry_item(self, key: str, value: str, project_name: str | None = None):
         """Removess an entry from the list-like setting given by key for a specified (or default) project."""
-        return self._factory[self._config_process_project_name(project_name)].remove_item(key, value)
+        project = self._join_edit_session(self._factory[self._config_process_project_name(project_name)])
+        return project.config_remove_entry_item(key, value)
 
     def config_clear_entry_items(self, key: str, project_name: str | None = None):
         """Clears all items from the list-like setting given by key for a specified (or default) project."""
-        return self._factory[self._config_process_project_name(project_name)].clear_items(key)
+        project = self._join_edit_session(self._factory[self._config_process_project_name(project_name)])
+        return project.config_clear_entry_items(key)
+
+    def _join_edit_session(self, project: Project) -> Project:
+        """Starts editing session of given project within current deferred save (see 'deferred_save'), if any.
+
+        Returns project object holding changes made within the session (projects are identified by their settings
+        file, so each file is saved once, even if another object was loaded for the same project in the meantime).
+        """
+        if self._edit_session is None:
+            return project
+        settings_file_path = path.normcase(path.abspath(project.settings_file_path))
+        if settings_file_path not in self._edited_projects:
+            self._edited_projects[settings_file_path] = self._edit_session.enter_context(
+                self._factory.edit_project(project.name)
+            )
+        return self._edited_projects[settings_file_path]
@@ -0,0 +1,153 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from os import path
+from typing import Any, Iterable, NamedTuple
+
+from reef.common.file_utils import ensure_dir, write_file_if_changed
+from reef.version import __version__ as VERSION
+
+from .generation.cmake_generator import CMAKE_TEMPLATE_VERSION, generate_cmake_files, get_cmake_file_inputs
+from .generation.project_layout import scan_project_layout
+from .generation.refresh_manifest import RefreshManifest, get_output_inputs
+from .project import Project
+from .repository.data.project_item_data import ProjectItemData
+
+
+class ProjectRefreshResult(NamedTuple):
+    """Result of regenerating build files of a single project (file paths are relative to its source directory).
+
+    Project is up-to-date if refresh manifest showed that no inputs of generated files changed (so nothing was
+    scanned, generated or compared). Error is given if refresh failed (then no files are listed).
+    """
+
+    name: str
+    updated_files: tuple[str, ...]
+    unchanged_files: tuple[str, ...]
+    is_up_to_date: bool
+    duration: float
+    error: str | None = None
+
+    @property
+    def is_successful(self) -> bool:
+        """Indicates whether refresh succeeded."""
+        return self.error is None
+
+    def to_record(self) -> dict[str, Any]:
+        """Returns machine-readable record with refresh result."""
+        return {
+            **self._asdict(),
+            "updated_files": list(self.updated_files),
+            "unchanged_files": list(self.unchanged_files),
+        }
+
+
+def refresh_project(project: Project, reef_version: str = VERSION) -> ProjectRefreshResult:
+    """Regenerates build files of given project from its settings and sources, measuring time it takes.
+
+    Refresh manifest (see RefreshManifest) is checked first: if inputs of all generated files are the same as when
+    they were written, and files themselves were not modified since, refresh returns without scanning sources.
+    Otherwise, only stale files are regenerated and each of them is written only if its contents changed, so build
+    tools do not see unchanged files as modified (which would trigger CMake re-configuration).
+    """
+    start = time.perf_counter()
+    settings = project.settings
+    hierarchy = settings.temp.hierarchy.to_values_dict()
+    manifest = RefreshManifest.load(project.config_path)
+    layout = manifest.get_layout(project.source_path, hierarchy)
+    is_scanned = layout is None
+    if layout is None:
+        layout = scan_project_layout(project.source_path, settings.temp.hierarchy)
+
+    inputs = {
+        relpath: get_output_inputs(file_inputs, CMAKE_TEMPLATE_VERSION, reef_version)
+        for relpath, file_inputs in get_cmake_file_inputs(settings, layout).items()
+    }
+    stale_files = {
+        relpath
+        for relpath, file_inputs in inputs.items()
+        if not manifest.is_output_current(_get_filepath(project, relpath), relpath, file_inputs)
+    }
+    if not stale_files and not is_scanned:
+        return ProjectRefreshResult(project.name, (), tuple(inputs), True, time.perf_counter() - start)
+
+    # config directory (holding manifest) is created upfront, as it may be inside one of scanned directories
+    ensure_dir(project.config_path)
+    updated_files = []
+    unchanged_files = []
+    for generated_file in generate_cmake_files(settings, layout):
+        if generated_file.path not in stale_files:
+            unchanged_files.append(generated_file.path)
+            continue
+        filepath = _get_filepath(project, generated_file.path)
+        ensure_dir(path.dirname(filepath))
+        if write_file_if_changed(filepath, generated_file.content):
+            updated_files.append(generated_file.path)
+        else:
+            unchanged_files.append(generated_file.path)
+        manifest.set_output(filepath, generated_file.path, inputs[generated_file.path])
+    manifest.retain_outputs(set(inputs))
+    manifest.set_layout(project.source_path, hierarchy, layout)
+    manifest.save(project.config_path)
+    return ProjectRefreshResult(
+        project.name, tuple(updated_files), tuple(unchanged_files), False, time.perf_counter() - start
+    )
+
+
+def refresh_projects(items: Iterable[ProjectItemData], jobs: int | None = None) -> list[ProjectRefreshResult]:
+    """Refreshes given projects concurrently using pool of 'jobs' processes (default pool size if None is given).
+
+    Scanning sources and generating files is CPU-bound, so projects are refreshed in separate processes (each one
+    loads settings of its projects itself). Failure of a project is reported in its result and does not stop
+    refreshing other ones. Results are returned in the same order as projects were given.
+    """
+    if jobs is not None and jobs < 1:
+        raise ValueError("Number of refresh jobs must be a positive integer.")
+    items = list(items)
+    workers = min(jobs or os.cpu_count() or 1, len(items))
+    if workers <= 1:
+        return [_refresh_project_item(item) for item in items]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # projects are sent in chunks, so inter-process communication does not dominate for quick refreshes
+        chunksize = max(1, len(items) // (workers * _CHUNKS_PER_WORKER))
+        futures = [
+            executor.submit(_refresh_project_items, items[i : i + chunksize]) for i in range(0, len(items), chunksize)
+        ]
+        results = []
+        for future, start in zip(futures, range(0, len(items), chunksize)):
+            try:
+                results.extend(future.result())
+            except Exception as e:
+                # worker process died (e.g. was killed), so results of the whole chunk are lost
+                results.extend(_failed_result(item.name, 0.0, e) for item in items[start : start + chunksize])
+        return results
+
+
+### IMPLEMENTATION DETAILS:
+
+# number of chunks each worker process gets (on average) - more chunks balance load better, fewer reduce overhead
+_CHUNKS_PER_WORKER = 4
+
+
+def _refresh_project_items(items: list[ProjectItemData]) -> list[ProjectRefreshResult]:
+    """Refreshes given projects one by one (executed in worker process)."""
+    return [_refresh_project_item(item) for item in items]
+
+
+def _refresh_project_item(item: ProjectItemData) -> ProjectRefreshResult:
+    """Refreshes project given by its repository data, reporting any error in the result."""
+    start = time.perf_counter()
+    try:
+        return refresh_project(Project(item))
+    except Exception as e:
+        return _failed_result(item.name, time.perf_counter() - start, e)
+
+
+def _failed_result(name: str, duration: float, error: Exception) -> ProjectRefreshResult:
+    """Returns result of failed project refresh."""
+    return ProjectRefreshResult(name, (), (), False, duration, f"{type(error).__name__}: {error}")
+
+
+def _get_filepath(project: Project, relpath: str) -> str:
+    """Returns path of generated file given by path relative to project source directory."""
+    return path.join(project.source_path, *relpath.split("/"))
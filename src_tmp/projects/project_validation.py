@@ -0,0 +1,43 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, NamedTuple
+
+from .project import Project
+
+
+class ProjectValidationResult(NamedTuple):
+    """Result of loading and validating settings of a single project."""
+
+    name: str
+    is_valid: bool
+    duration: float
+    error: str | None = None
+
+    def to_record(self) -> dict[str, Any]:
+        """Returns machine-readable record with validation result."""
+        return self._asdict()
+
+
+def validate_project(project: Project) -> ProjectValidationResult:
+    """Loads project settings from its config file and validates them, measuring time it takes."""
+    start = time.perf_counter()
+    try:
+        project.reload_settings()
+        project.settings.validate()
+    except Exception as e:
+        return ProjectValidationResult(project.name, False, time.perf_counter() - start, f"{type(e).__name__}: {e}")
+    return ProjectValidationResult(project.name, True, time.perf_counter() - start)
+
+
+def validate_projects(projects: Iterable[Project], jobs: int | None = None) -> list[ProjectValidationResult]:
+    """Validates given projects concurrently using pool of 'jobs' threads (default pool size if None is given).
+
+    Loading settings is I/O-bound, so threads overlap waiting for files (e.g. on network file systems).
+    Results are returned in the same order as projects were given.
+    """
+    if jobs is not None and jobs < 1:
+        raise ValueError("Number of validation jobs must be a positive integer.")
+    if jobs == 1:
+        return [validate_project(project) for project in projects]
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="reef-validate") as executor:
+        return list(executor.map(validate_project, projects))
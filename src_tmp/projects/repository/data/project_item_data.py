@@ -9,7 +9,7 @@ class ProjectItemData:
 
     def __init__(
         self,
-        obj: dict[str, Any],
+        obj: dict[str, Any] | None,
         *,
         name: str | None = None,
         source_path: str | None = None,
@@ -19,6 +19,8 @@ class ProjectItemData:
         """
         Constructs ProjectItemData object from item dictionary or manual property value overrides.
         """
+        if obj is None:
+            obj = {}
         self.name = name if name is not None else (obj["name"] if "name" in obj else None)
         self.source_path = (
             source_path if source_path is not None else (obj["source_path"] if "source_path" in obj else None)
@@ -32,13 +34,23 @@ class ProjectItemData:
             else (obj["default_module"] if "default_module" in obj else None)
         )
 
+    @classmethod
+    def from_validated_dict(cls, obj: dict[str, Any]) -> "ProjectItemData":
+        """Constructs ProjectItemData object from item dictionary that passed validation before (skips checks)."""
+        item = cls.__new__(cls)
+        item._name = obj["name"]
+        item._source_path = obj["source_path"]
+        item._config_path = obj.get("config_path")
+        item._default_module = obj.get("default_module")
+        return item
+
     @property
     def name(self) -> str:
         """Project name."""
         return self._name
 
     @name.setter
-    def name(self, name: str) -> None:
+    def name(self, name: str | None) -> None:
         """Project name."""
         if name is None:
             raise ValueError("'name' property cannot be None.")
@@ -54,7 +66,7 @@ class ProjectItemData:
         return self._source_path
 
     @source_path.setter
-    def source_path(self, source_path: str) -> None:
+    def source_path(self, source_path: str | None) -> None:
         """Path to the top-level directory where project's source files are contained."""
         if source_path is None:
             raise ValueError("'source_path' property cannot be None.")
@@ -81,7 +93,13 @@ class ProjectItemData:
 
     @property
     def is_config_inplace(self) -> bool:
-        return self._config_path is None or path.commonpath(self.source_path, self.config_path) == self.source_path
+        """Indicates whether project's Reef config files are contained within its source directory."""
+        return self._config_path is None or path.commonpath([self.source_path, self.config_path]) == self.source_path
+
+    @property
+    def indexed_paths(self) -> list[str]:
+        """Paths owned by the project, i.e. its source path and config path (if it is located out of place)."""
+        return [self.source_path] if self._config_path is None else [self.source_path, self._config_path]
 
     @property
     def default_module(self) -> str | None:
@@ -100,7 +118,7 @@ class ProjectItemData:
 
     def to_dict(self) -> dict[str, Any]:
         """Returns ProjectItemData as a dictionary with its properties (convenient for conversion to JSON)."""
-        result = {"name": self.name, "source_path": self.source_path}
+        result: dict[str, Any] = {"name": self.name, "source_path": self.source_path}
 
         if self._config_path is not None:
             result["config_path"] = self.config_path
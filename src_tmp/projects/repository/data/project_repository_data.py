@@ -1,5 +1,8 @@
 from collections import abc
-from typing import Any, Iterable
+from os import path
+from typing import Any, Iterable, Iterator
+
+from reef.common.path_trie import PathTrie
 
 from .project_item_data import ProjectItemData
 
@@ -11,29 +14,48 @@ class ProjectRepositoryData:
 
     def __init__(
         self,
-        obj: dict[str, Any],
+        obj: dict[str, Any] | None = None,
         *,
         projects: Iterable[ProjectItemData] | None = None,
         default_project: str | None = None,
+        revision: int | None = None,
     ):
         """Constructs ProjectRepositoryData object from item dictionary or manual property value overrides."""
-        self._projects = {}
+        if obj is None:
+            obj = {}
+        self._projects: dict[str, ProjectItemData] = {}
+        self._path_index: PathTrie | None = None
+        self._base_path: str | None = None
         self.add_projects(projects)
-        self.add_projects(obj["projects"] if "projects" in obj else [])
+        self.add_projects(ProjectItemData(item) for item in obj.get("projects", []))
 
         self.default_project = (
             default_project
             if default_project is not None
             else (obj["default_project"] if "default_project" in obj else None)
         )
+        self.revision = revision if revision is not None else obj.get("revision", 0)
+
+    @classmethod
+    def from_validated_dict(cls, obj: dict[str, Any]) -> "ProjectRepositoryData":
+        """Constructs ProjectRepositoryData object from dictionary that passed validation before (skips checks)."""
+        data = cls.__new__(cls)
+        data._projects = {}
+        data._path_index = None
+        data._base_path = None
+        for item in obj.get("projects", []):
+            data._projects[item["name"]] = ProjectItemData.from_validated_dict(item)
+        data._default_project = obj.get("default_project")
+        data._revision = obj.get("revision", 0)
+        return data
 
     def __contains__(self, project_name: str) -> bool:
         """Checks if project with given name is contained in the repository."""
         return project_name in self._projects
 
-    def __iter__(self) -> Iterable[ProjectItemData]:
+    def __iter__(self) -> Iterator[ProjectItemData]:
         """Lists all project items."""
-        return iter(self._projects.values)
+        return iter(self._projects.values())
 
     def add_projects(self, projects: Iterable[ProjectItemData] | None) -> None:
         """Adds project items from an iterable collection."""
@@ -55,25 +77,60 @@ class ProjectRepositoryData:
                 f"'project' cannot be added, as it has name ('{project.name}') that already exists in the repository."
             )
         self._projects[project.name] = project
+        if self._path_index is not None:
+            for project_path in self._get_indexed_paths(project):
+                self._path_index.add(project_path, project.name)
 
     def remove_project(self, project_name: str) -> None:
         """Removes a project with given name from the repository (raises error if name is not found)."""
         if project_name not in self:
             raise KeyError(f"Project with name '{project_name}' does not exist.")
-        del self._projects[project_name]
+        project = self._projects.pop(project_name)
+        if self._path_index is not None:
+            for project_path in self._get_indexed_paths(project):
+                self._path_index.remove(project_path, project_name)
         if self.default_project == project_name:
             self.default_project = None
 
     def clear_projects(self) -> None:
         """Removes all projects from repository."""
         self._projects = {}
-
-    def __get_item_(self, project_name: str) -> ProjectItemData:
+        self._path_index = None
+
+    def find_project_for_path(self, project_path: str) -> ProjectItemData | None:
+        """Returns project whose source or config directory contains given path (the innermost one, if nested).
+
+        Path index is built on first use and then kept up to date, so lookups take time proportional to path depth.
+        """
+        if self._path_index is None:
+            self._path_index = PathTrie()
+            for project in self:
+                for indexed_path in self._get_indexed_paths(project):
+                    self._path_index.add(indexed_path, project.name)
+        project_name = self._path_index.find_longest_prefix(project_path)
+        return self._projects[project_name] if project_name is not None else None
+
+    def __getitem__(self, project_name: str) -> ProjectItemData:
         """Returns project item with given name."""
         if project_name not in self:
             raise KeyError(f"Project with name '{project_name}' does not exist.")
         return self._projects[project_name]
 
+    @property
+    def base_path(self) -> str | None:
+        """Directory that relative project paths are resolved against when looking up projects by path (if None,
+        they are resolved against current working directory at the time path index is built)."""
+        return self._base_path
+
+    @base_path.setter
+    def base_path(self, base_path: str | None) -> None:
+        """Directory that relative project paths are resolved against when looking up projects by path."""
+        if base_path is not None and not path.isabs(base_path):
+            raise ValueError("'base_path' property must be an absolute path.")
+        if base_path != self._base_path:
+            self._base_path = base_path
+            self._path_index = None
+
     @property
     def default_project(self) -> str | None:
         """Project used as default when working with this repository."""
@@ -84,18 +141,40 @@ class ProjectRepositoryData:
         """Project used as default when working with this repository."""
         if default_project is not None:
             if not isinstance(default_project, str):
-                raise ValueError("'default_module' property must be a string.")
+                raise ValueError("'default_project' property must be a string.")
             if not default_project:
-                raise ValueError("'default_module' property cannot be an empty string")
-        self.default_project = default_project
+                raise ValueError("'default_project' property cannot be an empty string")
+        self._default_project = default_project
+
+    @property
+    def revision(self) -> int:
+        """Number of mutations applied to the repository data since it was created (used to order journal records)."""
+        return self._revision
+
+    @revision.setter
+    def revision(self, revision: int) -> None:
+        """Number of mutations applied to the repository data since it was created (used to order journal records)."""
+        if not isinstance(revision, int) or isinstance(revision, bool):
+            raise ValueError("'revision' property must be an integer.")
+        if revision < 0:
+            raise ValueError("'revision' property cannot be negative.")
+        self._revision = revision
 
     def to_dict(self) -> dict[str, Any]:
         """Returns ProjectRepositoryData as a dictionary with its properties (convenient for conversion to JSON)."""
-        result = {
-            "project": list(self),
+        result: dict[str, Any] = {
+            "projects": [project.to_dict() for project in self],
         }
 
         if self._default_project is not None:
             result["default_project"] = self.default_project
+        if self._revision:
+            result["revision"] = self.revision
 
         return result
+
+    def _get_indexed_paths(self, project: ProjectItemData) -> list[str]:
+        """Returns paths owned by the project (see ProjectItemData's 'indexed_paths'), resolved against base path."""
+        if self._base_path is None:
+            return project.indexed_paths
+        return [path.join(self._base_path, indexed_path) for indexed_path in project.indexed_paths]
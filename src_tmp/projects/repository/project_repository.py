@@ -1,16 +1,60 @@
-import json
+import os
+import sys
+from contextlib import contextmanager
 from os import path
-from typing import Iterable
+from typing import Any, Iterator
+
+from reef.common.file_lock import FileLock, get_lock_path
+from reef.common.file_utils import dump_json
+from reef.common.json_cache import load_json_cached
 
 from .data.project_repository_data import ProjectItemData, ProjectRepositoryData
+from .project_repository_journal import ProjectRepositoryJournal
+
+JOURNAL_COMPACTION_THRESHOLD = 1000
+LOCK_WAIT_WARNING_THRESHOLD = 1.0
 
 
 class ProjectRepository:
-    def __init__(self, projects_data_source_path: str):
+    """
+    Repository of registered reef projects, stored in JSON source file.
+
+    In journaled mode (default), saving appends recorded mutations to a journal next to the source file (which is
+    then a snapshot of repository data), instead of rewriting whole file. Journal is replayed when repository is
+    loaded and compacted into a new snapshot once it holds at least 'compaction_threshold' records.
+
+    Access to repository files is coordinated between processes with a lock file: loading takes a shared lock and
+    saving takes a short exclusive one. Saving is optimistic: if repository files were changed by another process
+    since they were loaded, current data is reloaded and pending mutations are re-applied on top of it (failing,
+    if they conflict with concurrent changes, e.g. adding a project with the same name).
+    """
+
+    def __init__(
+        self,
+        projects_data_source_path: str,
+        *,
+        journaled: bool = True,
+        compaction_threshold: int = JOURNAL_COMPACTION_THRESHOLD,
+        lock_timeout: float | None = None,
+    ):
         """Initializes project repository with path to underlying JSON source file to be used."""
         if projects_data_source_path is None or not isinstance(projects_data_source_path, str):
             raise ValueError("Project Repository source path must be a valid string.")
+        if not isinstance(compaction_threshold, int) or compaction_threshold < 1:
+            raise ValueError("Journal compaction threshold must be a positive integer.")
         self._projects_source_path = projects_data_source_path
+        # relative project paths are resolved against repository directory, so lookups do not depend on current one
+        self._base_path = path.dirname(path.abspath(projects_data_source_path))
+        self._journal = ProjectRepositoryJournal(projects_data_source_path)
+        self._is_journaled = journaled
+        self._compaction_threshold = compaction_threshold
+        self._pending_records: list[tuple[dict[str, Any], ProjectItemData | None]] = []
+        self._lock_path = get_lock_path(projects_data_source_path)
+        self._lock_timeout = lock_timeout
+        self._lock_wait_time = 0.0
+        self._lock_count = 0
+        self._edit_depth = 0
+        self._disk_state: tuple[Any, ...] | None = None
 
         self._initialize_data()
         assert self._data is not None
@@ -18,7 +62,27 @@ class ProjectRepository:
     @property
     def projects_data_source_path(self) -> str:
         """Path to data source JSON file for given project repository."""
-        return self._projects_data_source_path
+        return self._projects_source_path
+
+    @property
+    def is_journaled(self) -> bool:
+        """Indicates whether repository saves its mutations to a journal instead of rewriting source file."""
+        return self._is_journaled
+
+    @property
+    def revision(self) -> int:
+        """Revision of repository data (number of mutations applied to it, including unsaved ones)."""
+        return self._data.revision
+
+    @property
+    def lock_wait_time(self) -> float:
+        """Total time (in seconds) spent waiting for repository file locks."""
+        return self._lock_wait_time
+
+    @property
+    def lock_count(self) -> int:
+        """Number of times repository file lock was acquired."""
+        return self._lock_count
 
     @property
     def default_project_name(self) -> str | None:
@@ -28,15 +92,17 @@ class ProjectRepository:
     @default_project_name.setter
     def default_project_name(self, project_name: str | None) -> None:
         """Name of the project set as default."""
-        self._data.default_project = project_name
+        if project_name is not None and project_name not in self._data:
+            raise KeyError(f"Project with name '{project_name}' not found")
+        self._record({"op": "set_default_project", "name": project_name})
 
     @property
     def default_project(self) -> ProjectItemData | None:
         """Project item for the project set as default."""
-        return self[self.default_project_name()] if self.default_project_name() is not None else None
+        return self[self.default_project_name] if self.default_project_name is not None else None
 
     @property
-    def project_names(self) -> Iterable[str]:
+    def project_names(self) -> Iterator[str]:
         """Lists all project names in the repository."""
         return (item.name for item in self._data)
 
@@ -50,10 +116,14 @@ class ProjectRepository:
             raise KeyError(f"Project with name '{project_name}' not found")
         return self._data[project_name]
 
-    def __iter__(self) -> Iterable[ProjectItemData]:
+    def __iter__(self) -> Iterator[ProjectItemData]:
         """Lists all project items."""
         return iter(self._data)
 
+    def find_project_for_path(self, project_path: str) -> ProjectItemData | None:
+        """Returns project whose source or config directory contains given path (or None if there is no such project)."""
+        return self._data.find_project_for_path(project_path)
+
     def add_project(
         self, project_name: str, project_source_path: str, *, project_config_path: str | None = None
     ) -> None:
@@ -66,32 +136,188 @@ class ProjectRepository:
         """Adds new project to repository using pre-made item data."""
         if data.name in self:
             raise KeyError(f"Project with name '{data.name}' already exists.")
-        self._data.add_project(data)
+        self._record({"op": "add", "project": data.to_dict()}, item=data)
 
     def remove_project(self, project_name: str) -> None:
         """Removes project with given name to the repository."""
         if project_name not in self._data:
             raise KeyError(f"Project with name '{project_name}' not found")
-        del self._data[project_name]
+        self._record({"op": "remove", "name": project_name})
+
+    def set_default_module(self, project_name: str, module_name: str | None) -> None:
+        """Sets module used as default for project with given name."""
+        if project_name not in self._data:
+            raise KeyError(f"Project with name '{project_name}' not found")
+        self._record({"op": "set_default_module", "name": project_name, "module": module_name})
+
+    @contextmanager
+    def edit(self) -> Iterator["ProjectRepository"]:
+        """Groups mutations made within the context into a single save at its end (nested contexts are merged into
+        the outermost one). If the context exits with an exception, unsaved mutations are discarded instead.
+        """
+        self._edit_depth += 1
+        try:
+            yield self
+        except BaseException:
+            if self._edit_depth == 1:
+                self.reload()
+            raise
+        finally:
+            self._edit_depth -= 1
+        if self._edit_depth == 0:
+            self.save()
 
     def reload(self) -> None:
-        """Reloads repository data from the underlying JSON source file."""
-        if not path.exists(self.projects_source_path()):
-            raise FileNotFoundError(f"Project repository source file '{self.projects_source_path()}' does not exist.")
-        with open(self.projects_source_path(), encoding="utf-8") as fp:
-            self._data = ProjectRepositoryData(json.load(fp))
+        """Reloads repository data from the underlying JSON source file (or its pre-parsed snapshot) and journal."""
+        if not path.exists(self.projects_data_source_path):
+            raise FileNotFoundError(
+                f"Project repository source file '{self.projects_data_source_path}' does not exist."
+            )
+        with self._locked(shared=True):
+            self._load_data()
+
+    def save(self) -> bool:
+        """Saves mutations made since last load or save (returns False if there were none to save).
+
+        In journaled mode, mutations are appended to the journal, which is compacted if it grows large enough.
+        Otherwise, whole repository data is written to the underlying JSON source file.
+        """
+        if not self._pending_records:
+            return False
+        with self._locked(shared=False):
+            self._merge_concurrent_changes()
+            if self._is_journaled:
+                self._journal.append([record for record, _ in self._pending_records])
+                self._pending_records = []
+                if self._journal.record_count >= self._compaction_threshold:
+                    self._write_snapshot()
+            else:
+                self._write_snapshot()
+            self._disk_state = self._read_disk_state()
+        return True
+
+    def close(self) -> None:
+        """Does nothing, as no resources are held open between operations on repository files (provided for
+        interface compatibility with SqliteProjectRepository)."""
 
-    def save(self) -> None:
-        """Saves repository data to the underlying JSON source file."""
-        with open(self.projects_source_path(), "w", encoding="utf-8") as fp:
-            json.dump(self._data.to_dict(), fp, indent=2)
+    def compact(self) -> bool:
+        """Writes current repository data (including unsaved mutations) to the underlying JSON source file and
+        clears the journal.
+
+        Returns False if source file already contained the same data.
+        """
+        with self._locked(shared=False):
+            self._merge_concurrent_changes()
+            is_written = self._write_snapshot()
+            self._disk_state = self._read_disk_state()
+        return is_written
 
     def _initialize_data(self) -> None:
         """Initializes repository data from existing JSON source or creates an new empty one."""
-        assert self.projects_source_path() is not None and isinstance(self.projects_source_path(), str)
+        assert self.projects_data_source_path is not None and isinstance(self.projects_data_source_path, str)
 
-        if path.exists(self.projects_source_path()):
+        if path.exists(self.projects_data_source_path):
             self.reload()
+            return
+        with self._locked(shared=False):
+            if path.exists(self.projects_data_source_path):
+                self._load_data()
+            else:
+                self._data = ProjectRepositoryData()
+                self._data.base_path = self._base_path
+                self._write_snapshot()
+                self._disk_state = self._read_disk_state()
+
+    @contextmanager
+    def _locked(self, *, shared: bool) -> Iterator[None]:
+        """Holds repository file lock (shared or exclusive) within the context, recording time spent waiting."""
+        with FileLock(self._lock_path, shared=shared, timeout=self._lock_timeout) as lock:
+            self._lock_wait_time += lock.wait_time
+            self._lock_count += 1
+            if lock.wait_time >= LOCK_WAIT_WARNING_THRESHOLD:
+                print(
+                    f"WARNING: [ProjectRepository] Waited {lock.wait_time:.3f}s for lock on '{self._lock_path}'.",
+                    file=sys.stderr,
+                )
+            yield
+
+    def _load_data(self) -> None:
+        """Loads repository data from the source file and replays journal (lock has to be held by the caller)."""
+        self._data = load_json_cached(
+            self.projects_data_source_path,
+            validate=ProjectRepositoryData,
+            from_validated=ProjectRepositoryData.from_validated_dict,
+        )
+        self._data.base_path = self._base_path
+        self._pending_records = []
+
+        for record in self._journal.read_records():
+            # records included in snapshot are left in journal if compaction was interrupted before clearing it
+            if record["rev"] <= self._data.revision:
+                continue
+            if record["rev"] != self._data.revision + 1:
+                raise ValueError(
+                    f"Project repository journal '{self._journal.path}' does not match its snapshot (expected record "
+                    + f"with revision {self._data.revision + 1}, found {record['rev']})."
+                )
+            self._apply_record(record)
+        self._disk_state = self._read_disk_state()
+
+    def _read_disk_state(self) -> tuple[Any, ...]:
+        """Returns key identifying current state of repository files (changed by every write to any of them)."""
+        result: list[tuple[int, int, int] | None] = []
+        for filepath in (self.projects_data_source_path, self._journal.path):
+            try:
+                stat = os.stat(filepath)
+                result.append((stat.st_mtime_ns, stat.st_size, stat.st_ino))
+            except FileNotFoundError:
+                result.append(None)
+        return tuple(result)
+
+    def _merge_concurrent_changes(self) -> None:
+        """Reloads data changed by other processes since last load or save and re-applies pending mutations on top
+        of it (exclusive lock has to be held by the caller)."""
+        if self._read_disk_state() == self._disk_state:
+            return
+        pending_records = self._pending_records
+        self._load_data()
+        try:
+            for record, item in pending_records:
+                self._record({key: value for key, value in record.items() if key != "rev"}, item=item)
+        except (KeyError, ValueError) as e:
+            self._load_data()
+            raise RuntimeError(
+                f"Project repository changes conflict with concurrent changes in '{self.projects_data_source_path}' "
+                + f"(repository was reloaded): {e}"
+            ) from e
+
+    def _write_snapshot(self) -> bool:
+        """Writes repository data to the underlying JSON source file (returns False if it was unchanged).
+
+        Repository file is owned by reef, so it is stored in compact form. Journal is cleared, as all its records
+        are included in the written data (lock has to be held by the caller)."""
+        self._pending_records = []
+        is_written = dump_json(self.projects_data_source_path, self._data.to_dict(), compact=True)
+        self._journal.clear()
+        return is_written
+
+    def _record(self, record: dict[str, Any], *, item: ProjectItemData | None = None) -> None:
+        """Applies mutation described by given record to repository data and queues it for saving."""
+        record = {"rev": self._data.revision + 1, **record}
+        self._apply_record(record, item=item)
+        self._pending_records.append((record, item))
+
+    def _apply_record(self, record: dict[str, Any], *, item: ProjectItemData | None = None) -> None:
+        """Applies mutation described by given (journal) record to repository data."""
+        op = record["op"]
+        if op == "add":
+            self._data.add_project(item if item is not None else ProjectItemData(record["project"]))
+        elif op == "remove":
+            self._data.remove_project(record["name"])
+        elif op == "set_default_project":
+            self._data.default_project = record["name"]
+        elif op == "set_default_module":
+            self._data[record["name"]].default_module = record["module"]
         else:
-            self._data = ProjectRepositoryData()
-            self.save()
+            raise ValueError(f"Project repository journal record has unsupported operation '{op}'.")
+        self._data.revision = record["rev"]
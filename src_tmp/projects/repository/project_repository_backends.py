@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .project_repository import ProjectRepository
+    from .sqlite_project_repository import SqliteProjectRepository
+
+    AnyProjectRepository = ProjectRepository | SqliteProjectRepository
+
+REPOSITORY_BACKEND_JSON = "json"
+REPOSITORY_BACKEND_SQLITE = "sqlite"
+
+# repository classes are imported only when used (to keep CLI startup fast), so backends are given by import paths
+REPOSITORY_BACKENDS = {
+    REPOSITORY_BACKEND_JSON: ".project_repository:ProjectRepository",
+    REPOSITORY_BACKEND_SQLITE: ".sqlite_project_repository:SqliteProjectRepository",
+}
+
+REPOSITORY_FILE_NAMES = {
+    REPOSITORY_BACKEND_JSON: "projects.json",
+    REPOSITORY_BACKEND_SQLITE: "projects.sqlite",
+}
+
+
+def create_project_repository(
+    projects_data_source_path: str, backend: str = REPOSITORY_BACKEND_JSON
+) -> AnyProjectRepository:
+    """Creates project repository of given backend type, using data source file at given path."""
+    if backend not in REPOSITORY_BACKENDS:
+        raise ValueError(
+            f"Project repository backend '{backend}' is not supported "
+            + f"(supported values include: {', '.join(REPOSITORY_BACKENDS)} )."
+        )
+    module_name, _, class_name = REPOSITORY_BACKENDS[backend].partition(":")
+    repository_class = getattr(importlib.import_module(module_name, __package__), class_name)
+    return repository_class(projects_data_source_path)
+
+
+def migrate_project_repository(source_path: str, source_backend: str, target_path: str, target_backend: str) -> int:
+    """Copies all projects and default project setting from source repository to (empty) target repository, both
+    given by path to their data source file and backend type (repositories are closed afterwards).
+
+    Returns number of migrated projects.
+    """
+    source = target = None
+    try:
+        source = create_project_repository(source_path, source_backend)
+        target = create_project_repository(target_path, target_backend)
+        if next(iter(target.project_names), None) is not None:
+            raise ValueError(f"Target project repository '{target_path}' is not empty.")
+        count = 0
+        with target.edit():
+            for item in source:
+                target.add_project_from_data(item)
+                count += 1
+            target.default_project_name = source.default_project_name
+        return count
+    finally:
+        if target is not None:
+            target.close()
+        if source is not None:
+            source.close()
@@ -0,0 +1,84 @@
+import os
+from typing import Any
+
+from reef.common.json_codec import get_json_codec
+
+_JOURNAL_FILE_SUFFIX = ".journal"
+
+
+class ProjectRepositoryJournal:
+    """
+    Append-only journal of project repository mutations, stored next to repository snapshot file.
+
+    Each record is a compact JSON object written in a single line. A trailing line that was not fully written
+    (e.g. due to a crash) is ignored when reading and cut off before the next append.
+    """
+
+    def __init__(self, snapshot_path: str):
+        """Initializes journal for repository snapshot at given path."""
+        self._path = f"{snapshot_path}{_JOURNAL_FILE_SUFFIX}"
+        self._size = 0
+        self._record_count = 0
+
+    @property
+    def path(self) -> str:
+        """Path to journal file."""
+        return self._path
+
+    @property
+    def record_count(self) -> int:
+        """Number of records in the journal (as of last read or append)."""
+        return self._record_count
+
+    def read_records(self) -> list[dict[str, Any]]:
+        """Returns all complete records stored in the journal (empty list if journal does not exist)."""
+        try:
+            with open(self._path, mode="rb") as fp:
+                content = fp.read()
+        except FileNotFoundError:
+            content = b""
+
+        codec = get_json_codec()
+        records = []
+        size = 0
+        for line in content.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break
+            try:
+                records.append(codec.loads(line))
+            except ValueError as e:
+                if size + len(line) < len(content):
+                    raise ValueError(f"Project repository journal '{self._path}' is corrupted.") from e
+                break
+            size += len(line)
+
+        self._size = size
+        self._record_count = len(records)
+        return records
+
+    def append(self, records: list[dict[str, Any]]) -> None:
+        """Appends given records to the journal and flushes them to disk."""
+        if not records:
+            return
+        codec = get_json_codec()
+        content = b"".join(codec.dumps(record, compact=True) + b"\n" for record in records)
+
+        fd = os.open(self._path, os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o666)
+        try:
+            if os.fstat(fd).st_size != self._size:
+                os.ftruncate(fd, self._size)
+            os.lseek(fd, self._size, os.SEEK_SET)
+            os.write(fd, content)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+        self._size += len(content)
+        self._record_count += len(records)
+
+    def clear(self) -> None:
+        """Removes all records from the journal (deletes journal file)."""
+        if os.path.exists(self._path):
+            os.remove(self._path)
+        self._size = 0
+        self._record_count = 0
@@ -0,0 +1,274 @@
+import sqlite3
+import time
+from contextlib import contextmanager
+from os import path
+from typing import Any, Iterator
+
+from reef.common.path_trie import normalize_path
+
+from .data.project_item_data import ProjectItemData
+
+_SCHEMA_VERSION = 1
+_DEFAULT_BUSY_TIMEOUT = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    source_path TEXT NOT NULL,
+    config_path TEXT,
+    default_module TEXT,
+    source_key TEXT NOT NULL,
+    config_key TEXT
+);
+CREATE INDEX IF NOT EXISTS projects_source_key ON projects (source_key);
+CREATE INDEX IF NOT EXISTS projects_config_key ON projects (config_key);
+"""
+
+_ITEM_COLUMNS = "name, source_path, config_path, default_module"
+
+
+class SqliteProjectRepository:
+    """
+    Project repository stored in local SQLite database, intended for very large registries.
+
+    Provides the same interface as (JSON-based) ProjectRepository, but keeps data in indexed tables (by name and
+    source path), so lookups and single-item updates do not require loading or rewriting whole registry.
+    Each mutation is committed immediately in its own write transaction, unless it is made within 'edit' context,
+    where all mutations share a single transaction committed at its end (so database write lock is held only while
+    writing). Time spent waiting for database write lock held by other processes is available as 'lock_wait_time'.
+    """
+
+    def __init__(self, projects_data_source_path: str, *, lock_timeout: float | None = None):
+        """Initializes project repository with path to underlying SQLite database file (created if missing)."""
+        if projects_data_source_path is None or not isinstance(projects_data_source_path, str):
+            raise ValueError("Project Repository source path must be a valid string.")
+        self._projects_source_path = projects_data_source_path
+        # relative project paths are resolved against database directory, so lookups do not depend on current one
+        self._base_path = path.dirname(path.abspath(projects_data_source_path))
+        self._lock_wait_time = 0.0
+        self._lock_count = 0
+        self._edit_depth = 0
+
+        timeout = lock_timeout if lock_timeout is not None else _DEFAULT_BUSY_TIMEOUT
+        self._connection = sqlite3.connect(projects_data_source_path, timeout=timeout, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._initialize_schema()
+
+    @property
+    def projects_data_source_path(self) -> str:
+        """Path to data source SQLite database file for given project repository."""
+        return self._projects_source_path
+
+    @property
+    def lock_wait_time(self) -> float:
+        """Total time (in seconds) spent waiting for database write lock."""
+        return self._lock_wait_time
+
+    @property
+    def lock_count(self) -> int:
+        """Number of write transactions started."""
+        return self._lock_count
+
+    @property
+    def default_project_name(self) -> str | None:
+        """Name of the project set as default."""
+        return self._get_meta("default_project")
+
+    @default_project_name.setter
+    def default_project_name(self, project_name: str | None) -> None:
+        """Name of the project set as default."""
+        if project_name is not None and project_name not in self:
+            raise KeyError(f"Project with name '{project_name}' not found")
+        with self._writing():
+            self._set_meta("default_project", project_name)
+
+    @property
+    def default_project(self) -> ProjectItemData | None:
+        """Project item for the project set as default."""
+        return self[self.default_project_name] if self.default_project_name is not None else None
+
+    @property
+    def project_names(self) -> Iterator[str]:
+        """Lists all project names in the repository."""
+        return (row[0] for row in self._connection.execute("SELECT name FROM projects ORDER BY id"))
+
+    def __contains__(self, project_name: str) -> bool:
+        """Returns whether project with given name is present in the repository."""
+        return self._connection.execute("SELECT 1 FROM projects WHERE name = ?", (project_name,)).fetchone() is not None
+
+    def __getitem__(self, project_name: str) -> ProjectItemData:
+        """Returns data for project in the repository with given name."""
+        row = self._connection.execute(
+            f"SELECT {_ITEM_COLUMNS} FROM projects WHERE name = ?", (project_name,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"Project with name '{project_name}' not found")
+        return _item_from_row(row)
+
+    def __iter__(self) -> Iterator[ProjectItemData]:
+        """Lists all project items."""
+        return (
+            _item_from_row(row) for row in self._connection.execute(f"SELECT {_ITEM_COLUMNS} FROM projects ORDER BY id")
+        )
+
+    def find_project_for_path(self, project_path: str) -> ProjectItemData | None:
+        """Returns project whose source or config directory contains given path (or None if there is no such project).
+
+        Looks up normalized forms of the path and all its parent directories in indexed columns, so lookups take
+        time proportional to path depth (times logarithm of number of projects).
+        """
+        keys = [normalize_path(project_path)]
+        while path.dirname(keys[-1]) != keys[-1]:
+            keys.append(path.dirname(keys[-1]))
+        depths = {key: depth for depth, key in enumerate(reversed(keys))}
+        placeholders = ", ".join("?" * len(keys))
+        rows = self._connection.execute(
+            f"SELECT {_ITEM_COLUMNS}, source_key, config_key FROM projects "
+            + f"WHERE source_key IN ({placeholders}) OR config_key IN ({placeholders}) ORDER BY id DESC",
+            keys + keys,
+        ).fetchall()
+        if not rows:
+            return None
+        row = max(rows, key=lambda row: max(depths.get(row[4], -1), depths.get(row[5], -1)))
+        return _item_from_row(row[:4])
+
+    def add_project(
+        self, project_name: str, project_source_path: str, *, project_config_path: str | None = None
+    ) -> None:
+        """Adds new project to repository with given name and source path (optionally, a non-standard config path)."""
+        self.add_project_from_data(
+            ProjectItemData({}, name=project_name, source_path=project_source_path, config_path=project_config_path)
+        )
+
+    def add_project_from_data(self, data: ProjectItemData) -> None:
+        """Adds new project to repository using pre-made item data."""
+        item = data.to_dict()
+        try:
+            with self._writing():
+                self._connection.execute(
+                    f"INSERT INTO projects ({_ITEM_COLUMNS}, source_key, config_key) VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        item["name"],
+                        item["source_path"],
+                        item.get("config_path"),
+                        item.get("default_module"),
+                        self._get_path_key(item["source_path"]),
+                        self._get_path_key(item["config_path"]) if "config_path" in item else None,
+                    ),
+                )
+        except sqlite3.IntegrityError as e:
+            raise KeyError(f"Project with name '{data.name}' already exists.") from e
+
+    def remove_project(self, project_name: str) -> None:
+        """Removes project with given name to the repository."""
+        with self._writing():
+            if self._connection.execute("DELETE FROM projects WHERE name = ?", (project_name,)).rowcount == 0:
+                raise KeyError(f"Project with name '{project_name}' not found")
+            if self.default_project_name == project_name:
+                self._set_meta("default_project", None)
+
+    def set_default_module(self, project_name: str, module_name: str | None) -> None:
+        """Sets module used as default for project with given name."""
+        item = self[project_name]
+        item.default_module = module_name
+        with self._writing():
+            self._connection.execute(
+                "UPDATE projects SET default_module = ? WHERE name = ?", (item.default_module, project_name)
+            )
+
+    @contextmanager
+    def edit(self) -> Iterator["SqliteProjectRepository"]:
+        """Groups mutations made within the context into a single save at its end (nested contexts are merged into
+        the outermost one). If the context exits with an exception, unsaved mutations are discarded instead.
+        """
+        self._edit_depth += 1
+        try:
+            yield self
+        except BaseException:
+            if self._edit_depth == 1:
+                self.reload()
+            raise
+        finally:
+            self._edit_depth -= 1
+        if self._edit_depth == 0:
+            self.save()
+
+    def reload(self) -> None:
+        """Discards unsaved changes (data is always read directly from the database)."""
+        if self._connection.in_transaction:
+            self._connection.execute("ROLLBACK")
+
+    def save(self) -> bool:
+        """Commits changes made within current edit session so far (returns False if there were none to save)."""
+        if not self._connection.in_transaction:
+            return False
+        self._connection.execute("COMMIT")
+        return True
+
+    def close(self) -> None:
+        """Discards unsaved changes and closes database connection."""
+        self.reload()
+        self._connection.close()
+
+    def _initialize_schema(self) -> None:
+        """Creates database tables (if they do not exist yet) and checks schema version."""
+        is_initialized = self._connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'meta'"
+        ).fetchone()
+        version = self._get_meta("schema_version") if is_initialized else None
+        if version is None:
+            self._connection.executescript(_SCHEMA)
+            with self._writing():
+                self._set_meta("schema_version", str(_SCHEMA_VERSION))
+        elif int(version) != _SCHEMA_VERSION:
+            raise ValueError(
+                f"Project repository database '{self._projects_source_path}' has unsupported schema version {version}."
+            )
+
+    @contextmanager
+    def _writing(self) -> Iterator[None]:
+        """Executes writes made within the context in a write transaction, which is committed at its end (or rolled
+        back on exception), unless it belongs to edit session (then it is completed at the end of the session)."""
+        self._begin()
+        if self._edit_depth > 0:
+            yield
+            return
+        with self._connection:
+            yield
+
+    def _begin(self) -> None:
+        """Starts write transaction (if not started yet), recording time spent waiting for database lock."""
+        if self._connection.in_transaction:
+            return
+        start = time.perf_counter()
+        self._connection.execute("BEGIN IMMEDIATE")
+        self._lock_wait_time += time.perf_counter() - start
+        self._lock_count += 1
+
+    def _get_path_key(self, project_path: str) -> str:
+        """Returns normalized form of project path (resolved against database directory, if it is relative), as
+        stored in indexed columns."""
+        return normalize_path(path.join(self._base_path, project_path))
+
+    def _get_meta(self, key: str) -> Any:
+        """Returns value stored in metadata table under given key (or None)."""
+        row = self._connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row is not None else None
+
+    def _set_meta(self, key: str, value: str | None) -> None:
+        """Stores value in metadata table under given key (None removes it, write transaction has to be started)."""
+        if value is None:
+            self._connection.execute("DELETE FROM meta WHERE key = ?", (key,))
+        else:
+            self._connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+
+def _item_from_row(row: tuple[Any, ...]) -> ProjectItemData:
+    """Constructs project item data from database row (data was validated when it was stored)."""
+    name, source_path, config_path, default_module = row
+    return ProjectItemData.from_validated_dict(
+        {"name": name, "source_path": source_path, "config_path": config_path, "default_module": default_module}
+    )
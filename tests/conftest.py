@@ -0,0 +1,30 @@
+import json
+
+import pytest
+
+
+@pytest.fixture
+def reef_projects():
+    """Names of projects registered by 'reef_env' (override in test modules that need other projects)."""
+    return ("alpha", "beta")
+
+
+@pytest.fixture
+def reef_env(tmp_path, monkeypatch, reef_projects):
+    """Sets up reef config directory ('config' in temporary directory) with given projects registered, and makes
+    temporary directory (holding project sources) current one. Returns path to temporary directory."""
+    # reef CLI and projects require Python 3.10+, so they are only imported by tests which use them
+    from src_tmp.main import VERSION
+    from src_tmp.projects.project_manager import ProjectManager
+
+    config_path = tmp_path / "config"
+    (config_path / "projects").mkdir(parents=True)
+    data = {"config_path": str(config_path), "exec_path": str(config_path), "version": VERSION}
+    (config_path / "config.json").write_text(json.dumps(data))
+    monkeypatch.setenv("REEF_CONFIG", str(config_path))
+    monkeypatch.chdir(tmp_path)
+
+    manager = ProjectManager(repository_path=str(config_path / "projects" / "projects.json"))
+    for name in reef_projects:
+        manager.create(name, "", str(tmp_path))
+    return tmp_path
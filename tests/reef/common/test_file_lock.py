@@ -0,0 +1,63 @@
+import os
+import threading
+
+import pytest
+
+from reef.common.file_lock import FileLock, get_lock_path
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="shared locks are not supported on Windows")
+
+
+def test_file_lock_should_be_acquired_and_released_as_context_manager(tmp_path):
+    lock_path = get_lock_path(tmp_path / "data.json")
+
+    with FileLock(lock_path) as lock:
+        assert lock.is_locked
+        assert lock.wait_time >= 0.0
+
+    assert not lock.is_locked
+    assert os.path.exists(lock_path)
+
+
+def test_exclusive_file_lock_should_time_out_when_lock_is_held(tmp_path):
+    lock_path = get_lock_path(tmp_path / "data.json")
+
+    with FileLock(lock_path), pytest.raises(TimeoutError):
+        FileLock(lock_path, timeout=0.05).acquire()
+    with FileLock(lock_path, shared=True), pytest.raises(TimeoutError):
+        FileLock(lock_path, timeout=0.05).acquire()
+
+
+def test_shared_file_locks_should_be_held_together(tmp_path):
+    lock_path = get_lock_path(tmp_path / "data.json")
+
+    with FileLock(lock_path, shared=True), FileLock(lock_path, shared=True, timeout=0.05) as lock:
+        assert lock.is_locked
+
+
+def test_file_lock_should_be_available_after_release(tmp_path):
+    lock_path = get_lock_path(tmp_path / "data.json")
+    lock = FileLock(lock_path)
+
+    lock.acquire()
+    with pytest.raises(RuntimeError, match="already acquired"):
+        lock.acquire()
+    lock.release()
+    lock.release()
+
+    with FileLock(lock_path, timeout=0.05) as other:
+        assert other.is_locked
+
+
+def test_blocking_file_lock_should_wait_until_lock_is_released(tmp_path):
+    lock_path = get_lock_path(tmp_path / "data.json")
+    holder = FileLock(lock_path)
+    holder.acquire()
+    timer = threading.Timer(0.1, holder.release)
+    timer.start()
+    try:
+        with FileLock(lock_path) as lock:
+            assert lock.wait_time >= 0.05
+    finally:
+        timer.cancel()
+        holder.release()
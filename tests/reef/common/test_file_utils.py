@@ -0,0 +1,86 @@
+import json
+import os
+
+import pytest
+
+from reef.common.file_utils import dump_json, ensure_dir, load_json, write_file_if_changed
+
+DATA = {"name": "zażółć", "projects": [{"name": "a", "source_path": "/a"}]}
+
+
+def _set_old_mtime(filepath):
+    os.utime(filepath, ns=(1_000_000_000, 1_000_000_000))
+
+
+def test_dump_json_should_write_data_readable_by_load_json(tmp_path):
+    filepath = tmp_path / "data.json"
+
+    is_written = dump_json(filepath, DATA)
+
+    assert is_written
+    assert load_json(filepath) == DATA
+    assert "zażółć" in filepath.read_text(encoding="utf-8")
+
+
+def test_dump_json_should_skip_write_when_content_is_unchanged(tmp_path):
+    filepath = tmp_path / "data.json"
+    dump_json(filepath, DATA)
+    _set_old_mtime(filepath)
+
+    is_written = dump_json(filepath, json.loads(json.dumps(DATA)))
+
+    assert not is_written
+    assert os.stat(filepath).st_mtime_ns == 1_000_000_000
+
+
+def test_dump_json_should_rewrite_file_with_same_size_but_different_content(tmp_path):
+    filepath = tmp_path / "data.json"
+    dump_json(filepath, {"name": "a"})
+    _set_old_mtime(filepath)
+
+    is_written = dump_json(filepath, {"name": "b"})
+
+    assert is_written
+    assert load_json(filepath) == {"name": "b"}
+    assert os.stat(filepath).st_mtime_ns != 1_000_000_000
+
+
+def test_write_file_if_changed_should_not_leave_temporary_files(tmp_path):
+    filepath = tmp_path / "data.bin"
+
+    write_file_if_changed(filepath, b"first")
+    write_file_if_changed(filepath, b"second")
+
+    assert os.listdir(tmp_path) == ["data.bin"]
+    assert filepath.read_bytes() == b"second"
+
+
+def test_dump_json_should_keep_original_file_when_serialization_fails(tmp_path):
+    filepath = tmp_path / "data.json"
+    dump_json(filepath, DATA)
+
+    with pytest.raises(TypeError):
+        dump_json(filepath, {"x": object()})
+
+    assert load_json(filepath) == DATA
+    assert os.listdir(tmp_path) == ["data.json"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+def test_write_file_if_changed_should_preserve_permissions_of_existing_file(tmp_path):
+    filepath = tmp_path / "data.bin"
+    filepath.write_bytes(b"first")
+    os.chmod(filepath, 0o640)
+
+    write_file_if_changed(filepath, b"second")
+
+    assert os.stat(filepath).st_mode & 0o777 == 0o640
+
+
+def test_ensure_dir_should_create_nested_directories(tmp_path):
+    dirpath = tmp_path / "a" / "b"
+
+    ensure_dir(dirpath)
+    ensure_dir(dirpath)
+
+    assert dirpath.is_dir()
@@ -0,0 +1,125 @@
+import os
+
+import pytest
+
+from reef.common import json_cache
+from reef.common.file_utils import dump_json
+from reef.common.json_cache import JSON_CACHE_ENV_VAR_NAME, get_json_cache_path, load_json_cached
+
+DATA = {"name": "zażółć", "projects": [{"name": "a", "source_path": "/a"}], "count": 2, "flag": None}
+
+
+class _Loader:
+    """Records calls of validating and trusting constructors of loaded objects."""
+
+    def __init__(self):
+        self.calls = []
+
+    def validate(self, data):
+        self.calls.append("validate")
+        return ("validated", data)
+
+    def from_validated(self, data):
+        self.calls.append("from_validated")
+        return ("trusted", data)
+
+    def load(self, filepath, schema_key="v1"):
+        return load_json_cached(
+            filepath, validate=self.validate, from_validated=self.from_validated, schema_key=schema_key
+        )
+
+
+def test_load_json_cached_should_build_snapshot_on_first_load(tmp_path):
+    filepath = tmp_path / "data.json"
+    dump_json(filepath, DATA)
+
+    assert load_json_cached(filepath) == DATA
+    assert os.path.exists(get_json_cache_path(filepath))
+
+
+def test_load_json_cached_should_return_validated_object_and_trust_snapshot_with_same_schema_key(tmp_path):
+    filepath = tmp_path / "data.json"
+    dump_json(filepath, DATA)
+    loader = _Loader()
+
+    assert loader.load(filepath) == ("validated", DATA)
+    assert loader.load(filepath) == ("trusted", DATA)
+    assert loader.calls == ["validate", "from_validated"]
+
+
+def test_load_json_cached_should_validate_again_when_schema_key_changes(tmp_path):
+    filepath = tmp_path / "data.json"
+    dump_json(filepath, DATA)
+    loader = _Loader()
+    loader.load(filepath, schema_key="v1")
+
+    assert loader.load(filepath, schema_key="v2") == ("validated", DATA)
+    assert loader.load(filepath, schema_key="v2") == ("trusted", DATA)
+    assert loader.calls == ["validate", "validate", "from_validated"]
+
+
+def test_load_json_cached_should_not_trust_snapshot_written_without_validation(tmp_path):
+    filepath = tmp_path / "data.json"
+    dump_json(filepath, DATA)
+    load_json_cached(filepath)
+    loader = _Loader()
+
+    assert loader.load(filepath, schema_key="") == ("validated", DATA)
+    assert loader.calls == ["validate"]
+
+
+def test_load_json_cached_should_not_trust_snapshot_of_other_reef_version(tmp_path, monkeypatch):
+    filepath = tmp_path / "data.json"
+    dump_json(filepath, DATA)
+    loader = _Loader()
+    loader.load(filepath)
+    monkeypatch.setattr(json_cache, "_SNAPSHOT_FORMAT_VERSION", (*json_cache._SNAPSHOT_FORMAT_VERSION, "upgraded"))
+
+    assert loader.load(filepath) == ("validated", DATA)
+
+
+def test_load_json_cached_should_rebuild_snapshot_when_source_changes(tmp_path):
+    filepath = tmp_path / "data.json"
+    dump_json(filepath, DATA)
+    loader = _Loader()
+    loader.load(filepath)
+
+    dump_json(filepath, {"name": "other"})
+
+    assert loader.load(filepath) == ("validated", {"name": "other"})
+    assert loader.load(filepath) == ("trusted", {"name": "other"})
+
+
+def test_load_json_cached_should_not_write_snapshot_for_invalid_data(tmp_path):
+    filepath = tmp_path / "data.json"
+    dump_json(filepath, DATA)
+
+    def validate(data):
+        raise ValueError("invalid")
+
+    with pytest.raises(ValueError, match="invalid"):
+        load_json_cached(filepath, validate=validate)
+
+    assert not os.path.exists(get_json_cache_path(filepath))
+
+
+def test_load_json_cached_should_ignore_corrupted_snapshot(tmp_path):
+    filepath = tmp_path / "data.json"
+    dump_json(filepath, DATA)
+    with open(get_json_cache_path(filepath), mode="wb") as fp:
+        fp.write(b"\x00garbage")
+    loader = _Loader()
+
+    assert loader.load(filepath) == ("validated", DATA)
+    assert loader.load(filepath) == ("trusted", DATA)
+
+
+def test_load_json_cached_should_skip_snapshot_when_disabled(tmp_path, monkeypatch):
+    monkeypatch.setenv(JSON_CACHE_ENV_VAR_NAME, "0")
+    filepath = tmp_path / "data.json"
+    dump_json(filepath, DATA)
+    loader = _Loader()
+
+    assert loader.load(filepath) == ("validated", DATA)
+    assert loader.load(filepath) == ("validated", DATA)
+    assert not os.path.exists(get_json_cache_path(filepath))
@@ -0,0 +1,84 @@
+import contextlib
+from typing import Any, Dict
+
+import pytest
+
+from reef.common import json_codec
+from reef.common.json_codec import (
+    JSON_BACKEND_ENV_VAR_NAME,
+    OrjsonCodec,
+    StdlibJsonCodec,
+    create_json_codec,
+    get_json_codec,
+    set_json_codec,
+)
+
+DATA: Dict[str, Any] = {
+    "name": "zażółć",
+    "projects": [{"name": "a", "source_path": "/a", "is_inplace": True, "count": 3, "ratio": 0.5}],
+    "empty_list": [],
+    "empty_dict": {},
+    "default_project": None,
+}
+
+
+def _codecs():
+    result = [StdlibJsonCodec()]
+    with contextlib.suppress(ImportError):
+        result.append(OrjsonCodec())
+    return result
+
+
+@pytest.fixture(autouse=True)
+def reset_codec():
+    yield
+    set_json_codec(None)
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda codec: codec.name)
+def test_codec_should_round_trip_data_in_both_modes(codec):
+    assert codec.loads(codec.dumps(DATA)) == DATA
+    assert codec.loads(codec.dumps(DATA, compact=True)) == DATA
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda codec: codec.name)
+def test_codec_compact_mode_should_not_contain_whitespace(codec):
+    output = codec.dumps({"a": [1, 2], "b": {"c": "d"}}, compact=True)
+
+    assert output == b'{"a":[1,2],"b":{"c":"d"}}'
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda codec: codec.name)
+def test_codec_should_decode_bytes_and_text(codec):
+    assert codec.loads('{"name": "zażółć"}'.encode()) == {"name": "zażółć"}
+    assert codec.loads('{"name": "zażółć"}') == {"name": "zażółć"}
+
+
+def test_pretty_output_should_be_identical_for_all_backends():
+    pytest.importorskip("orjson")
+
+    assert OrjsonCodec().dumps(DATA) == StdlibJsonCodec().dumps(DATA)
+
+
+def test_codec_should_fall_back_to_stdlib_when_fast_backend_is_missing(monkeypatch):
+    def missing_backend():
+        raise ImportError("No module named 'orjson'")
+
+    monkeypatch.setitem(json_codec.JSON_CODEC_TYPES, "orjson", missing_backend)
+
+    assert create_json_codec().name == "stdlib"
+
+
+def test_codec_should_be_selected_by_environment_variable(monkeypatch):
+    monkeypatch.setenv(JSON_BACKEND_ENV_VAR_NAME, "stdlib")
+    set_json_codec(None)
+
+    assert get_json_codec().name == "stdlib"
+    assert get_json_codec() is get_json_codec()
+
+
+def test_unsupported_codec_should_raise_error():
+    with pytest.raises(ValueError) as ex:
+        set_json_codec("yaml")
+
+    assert "'yaml'" in str(ex.value)
@@ -0,0 +1,84 @@
+import sys
+import types
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from reef.common.lazy_cli import LazyContextObject, LazyGroup
+
+_LAZY_MODULE_NAME = "_reef_test_lazy_cli_commands"
+
+
+@pytest.fixture
+def lazy_module():
+    module = types.ModuleType(_LAZY_MODULE_NAME)
+
+    @click.command("hello")
+    def hello():
+        click.echo("hello")
+
+    module.hello = hello
+    module.not_a_command = 42
+    sys.modules[_LAZY_MODULE_NAME] = module
+    yield module
+    del sys.modules[_LAZY_MODULE_NAME]
+
+
+def _make_group(**lazy_subcommands):
+    @click.group(cls=LazyGroup, lazy_subcommands=lazy_subcommands)
+    def cli():
+        pass
+
+    @cli.command("eager")
+    def eager():
+        click.echo("eager")
+
+    return cli
+
+
+def test_lazy_group_should_import_subcommand_on_dispatch(lazy_module):
+    cli = _make_group(hello=f"{_LAZY_MODULE_NAME}:hello")
+
+    result = CliRunner().invoke(cli, ["hello"])
+
+    assert result.exit_code == 0
+    assert result.output == "hello\n"
+    assert cli.commands["hello"] is lazy_module.hello
+
+
+def test_lazy_group_should_list_lazy_subcommands_without_importing_them():
+    cli = _make_group(hello="_reef_test_missing_module:hello")
+
+    assert cli.list_commands(click.Context(cli)) == ["eager", "hello"]
+    assert CliRunner().invoke(cli, ["eager"]).output == "eager\n"
+
+
+def test_lazy_group_should_reject_objects_that_are_not_commands(lazy_module):
+    cli = _make_group(bad=f"{_LAZY_MODULE_NAME}:not_a_command")
+
+    with pytest.raises(TypeError, match="not a click command"):
+        cli.get_command(click.Context(cli), "bad")
+
+
+def test_lazy_context_object_should_call_loader_once_on_first_access():
+    calls = []
+    obj = LazyContextObject(name="x")
+    obj.set_loader("greeting", lambda o: calls.append(1) or f"hello {o['name']}")
+
+    assert not obj.is_loaded("greeting")
+    assert obj.get("greeting") is None
+    assert obj["greeting"] == "hello x"
+    assert obj["greeting"] == "hello x"
+    assert obj.is_loaded("greeting")
+    assert calls == [1]
+
+
+def test_lazy_context_object_should_prefer_assigned_values_and_raise_for_unknown_keys():
+    obj = LazyContextObject()
+    obj.set_loader("value", lambda o: 1)
+    obj["value"] = 2
+
+    assert obj["value"] == 2
+    with pytest.raises(KeyError):
+        obj["unknown"]
@@ -0,0 +1,56 @@
+import pytest
+
+from reef.common.lru_cache import CacheStats, LruCache
+
+
+def test_lru_cache_should_evict_least_recently_used_entries():
+    cache = LruCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+
+    cache.put("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.stats == CacheStats(hits=1, misses=0, evictions=1, invalidations=0, size=2, maxsize=2)
+
+
+def test_lru_cache_should_count_hits_and_misses():
+    cache = LruCache(4)
+    cache.put("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_lru_cache_should_drop_entries_that_fail_validation():
+    cache = LruCache(4)
+    cache.put("a", 1)
+
+    assert cache.get("a", is_valid=lambda value: value > 1) is None
+    assert "a" not in cache
+    assert cache.stats == CacheStats(hits=0, misses=1, evictions=0, invalidations=1, size=0, maxsize=4)
+
+
+def test_lru_cache_pop_and_clear_should_remove_entries():
+    cache = LruCache(4)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    assert cache.pop("a") == 1
+    assert cache.pop("a") is None
+
+    cache.clear()
+
+    assert len(cache) == 0
+
+
+def test_lru_cache_should_reject_invalid_arguments():
+    with pytest.raises(ValueError, match="positive integer"):
+        LruCache(0)
+    with pytest.raises(ValueError, match="cannot be None"):
+        LruCache(1).put("a", None)
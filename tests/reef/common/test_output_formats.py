@@ -0,0 +1,61 @@
+import io
+import json
+
+import pytest
+
+from reef.common.output_formats import iter_flat_items, write_records
+
+RECORDS = [
+    {"name": "a", "is_config_inplace": True, "settings": {"name": "a", "temp": {"version": "0.1.0"}}},
+    {"name": "b", "is_config_inplace": False, "settings": {"name": "b\tc", "details": None}},
+]
+
+
+def _write(records, output_format):
+    stream = io.StringIO()
+    write_records(stream, iter(records), output_format)
+    return stream.getvalue()
+
+
+def test_json_output_should_be_single_array_of_records():
+    output = _write(RECORDS, "json")
+
+    assert json.loads(output) == RECORDS
+    assert output.count("\n") == len(RECORDS) + 2
+
+
+def test_json_output_for_no_records_should_be_empty_array():
+    assert json.loads(_write([], "json")) == []
+
+
+def test_jsonl_output_should_contain_one_record_per_line():
+    lines = _write(RECORDS, "jsonl").splitlines()
+
+    assert [json.loads(line) for line in lines] == RECORDS
+
+
+def test_tsv_output_should_contain_one_line_per_nested_value():
+    lines = _write(RECORDS, "tsv").splitlines()
+
+    assert lines == [
+        "name\tpath\tvalue",
+        "a\tname\ta",
+        "a\tis_config_inplace\ttrue",
+        "a\tsettings.name\ta",
+        "a\tsettings.temp.version\t0.1.0",
+        "b\tname\tb",
+        "b\tis_config_inplace\tfalse",
+        "b\tsettings.name\tb\\tc",
+        "b\tsettings.details\tnull",
+    ]
+
+
+def test_unsupported_output_format_should_raise_error():
+    with pytest.raises(ValueError) as ex:
+        _write(RECORDS, "xml")
+
+    assert "'xml'" in str(ex.value)
+
+
+def test_iter_flat_items_should_use_dotted_paths():
+    assert list(iter_flat_items({"a": {"b": {"c": 1}, "d": [1, 2]}})) == [("a.b.c", 1), ("a.d", [1, 2])]
@@ -0,0 +1,54 @@
+import os
+
+from reef.common.path_trie import PathTrie, normalize_path, split_path
+
+
+def test_split_path_should_normalize_path(tmp_path):
+    assert split_path(tmp_path / "a" / ".." / "b") == split_path(os.path.join(str(tmp_path), "b"))
+    assert split_path(tmp_path)[-1] == os.path.normcase(tmp_path.name)
+    assert normalize_path("relative") == os.path.normcase(os.path.abspath("relative"))
+
+
+def test_path_trie_should_find_longest_registered_prefix(tmp_path):
+    trie = PathTrie()
+    trie.add(tmp_path / "a", "a")
+    trie.add(tmp_path / "a" / "b" / "c", "c")
+
+    assert trie.find_longest_prefix(tmp_path / "a") == "a"
+    assert trie.find_longest_prefix(tmp_path / "a" / "b" / "file.txt") == "a"
+    assert trie.find_longest_prefix(tmp_path / "a" / "b" / "c" / "d") == "c"
+    assert trie.find_longest_prefix(tmp_path / "ab") is None
+    assert trie.find_longest_prefix(tmp_path) is None
+    assert trie.get(tmp_path / "a" / "b") is None
+    assert trie.get(tmp_path / "a" / "b" / "c") == "c"
+    assert len(trie) == 2
+
+
+def test_path_trie_should_return_most_recent_value_for_shared_path(tmp_path):
+    trie = PathTrie()
+    trie.add(tmp_path, "first")
+    trie.add(tmp_path, "second")
+
+    assert trie.find_longest_prefix(tmp_path / "x") == "second"
+
+    assert trie.remove(tmp_path, "second")
+
+    assert trie.find_longest_prefix(tmp_path / "x") == "first"
+
+
+def test_path_trie_remove_should_prune_empty_nodes(tmp_path):
+    trie = PathTrie()
+    trie.add(tmp_path / "a", "a")
+    trie.add(tmp_path / "a" / "b" / "c", "c")
+
+    assert trie.remove(tmp_path / "a" / "b" / "c", "c")
+    assert not trie.remove(tmp_path / "a" / "b" / "c", "c")
+    assert not trie.remove(tmp_path / "a", "other")
+
+    assert trie.find_longest_prefix(tmp_path / "a" / "b" / "c") == "a"
+    assert len(trie) == 1
+
+    trie.clear()
+
+    assert trie.find_longest_prefix(tmp_path / "a") is None
+    assert len(trie) == 0
@@ -1,8 +1,9 @@
+import io
 from typing import Any, Optional, Type
 
 import pytest
 
-from reef.common.settings_base import SettingsBase
+from reef.common.settings_base import SettingsBase, settings_slots
 
 ### =========== TEST TYPES THAT DERIVE FROM SettingsBase =========== ###
 
@@ -92,6 +93,55 @@ class Multi(SettingsBase):
         self._obj = value
 
 
+class Derived(Simple):
+    def __init__(self) -> None:
+        super().__init__()
+        self._q: Any = None
+
+    @property
+    def q(self) -> Any:
+        return self._q
+
+    @q.setter
+    def q(self, value: Any) -> None:
+        self._q = value
+
+
+class DerivedReadOnly(Simple):
+    @property  # type: ignore[misc]
+    def p(self) -> Any:
+        return self._p
+
+
+@settings_slots
+class Slotted(SettingsBase):
+    def __init__(self) -> None:
+        self._p: Any = None
+
+    @property
+    def p(self) -> Any:
+        return self._p
+
+    @p.setter
+    def p(self, value: Any) -> None:
+        self._p = value
+
+    @property
+    def p_str(self) -> str:
+        return str(self._p)
+
+
+@settings_slots(extra_fields=["_x"])
+class SlottedDerived(Slotted):
+    def __init__(self) -> None:
+        Slotted.__init__(self)
+        self._x: int = 42
+
+    @property
+    def q(self) -> int:
+        return self._x
+
+
 ### =========== TESTS =========== ###
 
 # ----- TESTS FOR Empty TYPE ----- #
@@ -796,3 +846,279 @@ def test_nested_settings_unset_from_nonobject_should_raise_errors():
         s.unset("obj.name.x")
 
     assert "'name'" in str(ex.value)
+
+
+# ----- TESTS FOR Derived TYPES - Inherited Properties ----- #
+
+
+def test_derived_settings_should_handle_inherited_and_own_properties():
+    s = Derived()
+
+    s.set("p", 1)
+    s.set("q", 2)
+
+    assert s.get("p") == 1
+    assert s.get("q") == 2
+    assert s.is_set("p")
+    assert s.is_set("q")
+
+    s.unset("p")
+
+    assert not s.is_set("p")
+    assert s.is_set("q")
+
+
+def test_derived_settings_string_should_list_inherited_properties_in_order():
+    s = Derived()
+
+    s_str = str(s)
+
+    assert s_str.index("p") < s_str.index("q")
+
+
+def test_derived_settings_should_respect_overridden_readonly_property():
+    s = DerivedReadOnly()
+
+    with pytest.raises(RuntimeError) as ex:
+        s.set("p", 42)
+
+    assert "DerivedReadOnly" in str(ex.value)
+    assert "read-only" in str(ex.value)
+
+    Simple().set("p", 42)
+
+
+def test_settings_properties_should_be_discovered_once_per_class(monkeypatch):
+    s = Multi()
+    s.obj = Multi()
+
+    def fail_dir(*args):
+        raise AssertionError("dir() should not be used after class definition")
+
+    monkeypatch.setattr("builtins.dir", fail_dir)
+
+    s.set("obj.num", 7)
+    s.unset("name")
+
+    assert s.get("obj.num") == 7
+    assert not s.is_set("name")
+    assert "7" in s.to_string()
+
+
+# ----- TESTS FOR Multi TYPE - Nasted Objects and Paths - Bulk Access ----- #
+
+
+def test_nested_settings_get_many_should_return_values_for_all_paths():
+    s = Multi()
+    s.name = "L1"
+    s.obj = Multi()
+    s.obj.name = "L2"
+    s.obj.obj = Multi()
+    s.obj.obj.num = 7
+
+    values = s.get_many(["name", "obj.name", "obj.obj.num", "obj.obj.name"])
+
+    assert values == {"name": "L1", "obj.name": "L2", "obj.obj.num": 7, "obj.obj.name": "Default"}
+    assert list(values) == ["name", "obj.name", "obj.obj.num", "obj.obj.name"]
+
+
+def test_nested_settings_get_many_should_resolve_shared_prefixes_once():
+    class Counting(Multi):
+        reads = 0
+
+        @property
+        def obj(self) -> Optional[Type[SettingsBase]]:
+            Counting.reads += 1
+            return self._obj
+
+        @obj.setter
+        def obj(self, value: Type[SettingsBase]) -> None:
+            self._obj = value
+
+    s = Counting()
+    s.obj = Multi()
+    s.obj.obj = Multi()
+    Counting.reads = 0
+
+    s.get_many(["obj.name", "obj.num", "obj.any", "obj.obj.num"])
+
+    assert Counting.reads == 1
+
+
+def test_nested_settings_get_many_from_nonexistent_should_raise_errors():
+    s = Multi()
+    s.obj = Multi()
+
+    with pytest.raises(KeyError) as ex:
+        s.get_many(["name", "obj.x"])
+
+    assert "'x'" in str(ex.value)
+
+    with pytest.raises(KeyError) as ex:
+        s.get_many(["obj.name", "any.name"])
+
+    assert "'any'" in str(ex.value)
+
+
+def test_nested_settings_set_many_should_change_property_values():
+    s = Multi()
+    s.obj = Multi()
+
+    s.set_many({"name": "L1", "obj.name": "L2", "obj.num": 7})
+
+    assert s.get_many(["name", "obj.name", "obj.num"]) == {"name": "L1", "obj.name": "L2", "obj.num": 7}
+
+
+def test_nested_settings_set_many_should_use_replaced_nested_objects():
+    s = Multi()
+    s.obj = Multi()
+    old_obj = s.obj
+
+    s.set_many({"obj.name": "OLD", "obj": Multi(), "obj.num": 7})
+
+    assert old_obj.name == "OLD"
+    assert s.obj is not old_obj
+    assert s.obj.num == 7
+    assert s.obj.name == "Default"
+
+
+def test_nested_settings_paths_should_work_for_different_classes_with_same_path():
+    s = Multi()
+    s.obj = Multi()
+    d = Derived()
+
+    s.set("obj.name", "X")
+    d.set("p", 1)
+
+    with pytest.raises(KeyError):
+        d.get("obj.name")
+
+    assert s.get("obj.name") == "X"
+    assert d.get("p") == 1
+
+
+# ----- TESTS FOR Slotted TYPES ----- #
+
+
+def test_slotted_settings_should_not_have_instance_dict():
+    s = Slotted()
+    d = SlottedDerived()
+
+    assert not hasattr(s, "__dict__")
+    assert not hasattr(d, "__dict__")
+    assert Slotted.__slots__ == ("_p",)
+    assert SlottedDerived.__slots__ == ("_x",)
+
+
+def test_slotted_settings_should_support_string_keyed_access():
+    s = SlottedDerived()
+
+    s.set("p", 7)
+
+    assert s.get("p") == 7
+    assert s.get("p_str") == "7"
+    assert s.get("q") == 42
+    assert s.is_set("p")
+
+    s.unset("p")
+
+    assert not s.is_set("p")
+    assert "p_str" in str(s)
+
+
+def test_slotted_settings_should_unset_field_that_was_never_assigned():
+    s = Slotted.__new__(Slotted)
+
+    assert not s.is_set("p")
+
+    s.unset("p")
+
+    assert s.p is None
+
+
+def test_slotted_settings_should_reject_undeclared_fields():
+    s = Slotted()
+
+    with pytest.raises(AttributeError):
+        s._y = 42
+
+
+# ----- TESTS FOR Multi TYPE - Streaming String Representations ----- #
+
+
+def test_settings_iter_lines_should_yield_lines_with_nested_indentation():
+    s = Multi()
+    s.obj = Multi()
+    s.obj.name = "SET"
+
+    lines = list(s.iter_lines(skip_unset=True))
+
+    assert lines == [" - name: Default", " - obj:", "   - name: SET"]
+
+
+def test_settings_iter_lines_should_respect_initial_indent_level():
+    s = Simple()
+
+    lines = list(s.iter_lines(indent_level=2))
+
+    assert lines == ["     - p: None"]
+
+
+def test_settings_write_to_should_match_to_string():
+    s = Multi()
+    s.any = "xxx"
+    s.obj = Multi()
+    s.obj.obj = Multi()
+    stream = io.StringIO()
+
+    s.write_to(stream)
+
+    assert stream.getvalue() == s.to_string()
+    assert stream.getvalue().count("\n") == 12
+    assert "\n\n" not in stream.getvalue()
+
+
+# ----- TESTS FOR Multi TYPE - Machine-Readable Representations ----- #
+
+
+def test_settings_iter_items_should_yield_paths_and_values_of_all_properties():
+    s = Multi()
+    s.obj = Multi()
+    s.obj.num = 7
+
+    items = list(s.iter_items())
+
+    assert items == [
+        ("any", None),
+        ("name", "Default"),
+        ("num", 42),
+        ("obj.any", None),
+        ("obj.name", "Default"),
+        ("obj.num", 7),
+        ("obj.obj", None),
+    ]
+    assert all(s.get(path) == value for path, value in items)
+
+
+def test_settings_iter_items_optionally_should_skip_unset_properties():
+    s = Multi()
+    s.obj = Multi()
+    s.obj.num = 7
+
+    items = list(s.iter_items(skip_unset=True))
+
+    assert items == [("name", "Default"), ("obj.name", "Default"), ("obj.num", 7)]
+
+
+def test_settings_to_values_dict_should_return_nested_effective_values():
+    s = Multi()
+    s.obj = Multi()
+    s.obj.num = 7
+
+    assert s.to_values_dict() == {
+        "any": None,
+        "name": "Default",
+        "num": 42,
+        "obj": {"any": None, "name": "Default", "num": 7, "obj": None},
+    }
+    assert s.to_values_dict(skip_unset=True) == {"name": "Default", "obj": {"name": "Default", "num": 7}}
@@ -0,0 +1,243 @@
+import pytest
+
+from reef.common.settings_base import SettingsBase
+from reef.common.settings_schema import SettingsField, get_settings_schema_key, settings_schema
+
+### =========== TEST TYPES THAT USE settings_schema =========== ###
+
+
+@settings_schema
+class Leaf(SettingsBase):
+    mode = SettingsField(str, choices=["auto", "never"], doc="Mode.")
+    flag = SettingsField(bool, default=False)
+    version = SettingsField(str, pattern=r"\d+\.\d+", pattern_hint="[INT].[INT]")
+
+    @property
+    def version_major(self) -> int:
+        return int(self.version.split(".")[0])
+
+
+@settings_schema(slots=True)
+class Root(SettingsBase):
+    name = SettingsField(str, required=True)
+    name_short = SettingsField(str, default_factory=lambda self: self.name)
+    leaf = SettingsField(Leaf)
+
+
+@settings_schema
+class DerivedRoot(Root):
+    extra = SettingsField(int)
+
+
+### =========== TESTS =========== ###
+
+
+def test_schema_settings_should_load_values_from_dict():
+    s = Root({"name": "x", "leaf": {"mode": "never", "flag": True, "version": "3.21"}, "unknown": 1})
+
+    assert s.name == "x"
+    assert s.name_short == "x"
+    assert isinstance(s.leaf, Leaf)
+    assert s.get("leaf.mode") == "never"
+    assert s.get("leaf.flag") is True
+    assert s.get("leaf.version_major") == 3
+
+
+def test_schema_settings_keyword_overrides_should_take_precedence():
+    s = Root({"name": "x", "name_short": "y"}, name="z", leaf=Leaf(mode="never"))
+
+    assert s.name == "z"
+    assert s.name_short == "y"
+    assert s.leaf.mode == "never"
+
+
+def test_schema_settings_from_dict_and_to_dict_should_round_trip():
+    data = {"name": "x", "leaf": {"mode": "auto", "flag": False}}
+
+    s = Root.from_dict(data)
+
+    assert s.to_dict() == data
+
+
+def test_schema_settings_to_dict_should_skip_unset_fields():
+    s = Root({"name": "x", "leaf": {}})
+
+    assert s.to_dict() == {"name": "x"}
+    assert Leaf().to_dict() is None
+
+
+def test_schema_settings_should_return_defaults_for_unset_fields():
+    s = Root(name="x")
+
+    assert s.name_short == "x"
+    assert s.leaf.mode == "auto"
+    assert s.leaf.flag is False
+    assert s.leaf.version is None
+    assert not s.is_set("leaf")
+    assert not s.is_set("name_short")
+
+
+def test_schema_settings_setters_should_validate_values():
+    s = Leaf()
+
+    with pytest.raises(ValueError, match="must be a string"):
+        s.mode = 42
+    with pytest.raises(ValueError, match="empty string"):
+        s.mode = ""
+    with pytest.raises(ValueError, match="supported values include: auto, never"):
+        s.mode = "sometimes"
+    with pytest.raises(ValueError, match="must be a boolean"):
+        s.flag = "yes"
+    with pytest.raises(ValueError, match=r"\[INT\]\.\[INT\]"):
+        s.version = "3"
+
+    s.mode = "never"
+    s.set("version", "3.22")
+    s.unset("mode")
+
+    assert s.mode == "auto"
+    assert s.version == "3.22"
+
+
+def test_schema_settings_required_field_should_not_be_none():
+    with pytest.raises(ValueError, match="'name' property cannot be None"):
+        Root({})
+
+    s = Root(name="x")
+
+    with pytest.raises(ValueError, match="'name' property cannot be None"):
+        s.name = None
+
+
+def test_schema_settings_should_reject_invalid_nested_values():
+    with pytest.raises(ValueError, match="instance of Leaf class"):
+        Root({"name": "x", "leaf": "auto"})
+
+    with pytest.raises(ValueError, match="supported values"):
+        Root({"name": "x", "leaf": {"mode": "sometimes"}})
+
+    s = Root(name="x")
+
+    with pytest.raises(ValueError, match="instance of Leaf class"):
+        s.leaf = {"mode": "auto"}
+
+
+def test_schema_settings_validate_should_check_fields_recursively():
+    s = Root(name="x", leaf=Leaf())
+    s.validate()
+
+    s.leaf._mode = "sometimes"
+
+    with pytest.raises(ValueError, match="'mode' cannot be 'sometimes'"):
+        s.validate()
+
+
+def test_schema_settings_should_support_slots_and_property_docs():
+    s = Root(name="x")
+
+    assert not hasattr(s, "__dict__")
+    assert Leaf.mode.__doc__ == "Mode."
+    assert Root.__init__.__qualname__ == "Root.__init__"
+
+
+def test_schema_settings_should_inherit_fields_from_base_schema():
+    s = DerivedRoot({"name": "x", "extra": 7, "leaf": {"flag": True}})
+
+    assert s.get("extra") == 7
+    assert s.get("leaf.flag") is True
+    assert s.to_dict() == {"name": "x", "leaf": {"flag": True}, "extra": 7}
+
+
+def test_schema_settings_should_reject_reserved_field_names():
+    with pytest.raises(ValueError, match="'obj'"):
+
+        @settings_schema
+        class Invalid(SettingsBase):
+            obj = SettingsField(str)
+
+
+def test_schema_settings_unset_nested_fields_should_return_shared_default():
+    s1 = Root(name="x")
+    s2 = Root(name="y")
+
+    assert s1.leaf is s2.leaf
+    assert s1.leaf is Leaf.shared_default()
+    assert s1.leaf.is_shared_default()
+    assert not Leaf().is_shared_default()
+
+
+def test_schema_settings_shared_default_should_not_be_modified_directly():
+    s = Root(name="x")
+
+    with pytest.raises(RuntimeError, match="Shared default"):
+        s.leaf.mode = "never"
+    with pytest.raises(RuntimeError, match="Shared default"):
+        s.leaf.set("mode", "never")
+    with pytest.raises(RuntimeError, match="Shared default"):
+        s.leaf.unset("mode")
+
+    assert Leaf.shared_default().to_dict() is None
+
+
+def test_schema_settings_set_by_path_should_copy_shared_default_on_write():
+    s = Root(name="x")
+    other = Root(name="y")
+
+    s.set("leaf.mode", "never")
+
+    assert s.is_set("leaf")
+    assert not s.leaf.is_shared_default()
+    assert s.get("leaf.mode") == "never"
+    assert other.get("leaf.mode") == "auto"
+    assert s.to_dict() == {"name": "x", "leaf": {"mode": "never"}}
+
+
+def test_schema_settings_set_many_and_unset_should_copy_shared_default_on_write():
+    s = Root(name="x")
+    other = Root(name="y")
+
+    s.set_many({"leaf.mode": "never", "leaf.flag": True})
+
+    assert s.to_dict() == {"name": "x", "leaf": {"mode": "never", "flag": True}}
+
+    other.unset("leaf.mode")
+
+    assert other.is_set("leaf")
+    assert Leaf.shared_default().mode == "auto"
+
+
+def test_schema_settings_from_validated_dict_should_skip_validation():
+    data = {"name": "x", "leaf": {"mode": "never", "version": "3.21"}}
+
+    s = Root.from_validated_dict(data)
+
+    assert isinstance(s, Root)
+    assert isinstance(s.leaf, Leaf)
+    assert s.to_dict() == data
+    assert s.get("leaf.version_major") == 3
+    assert Root.from_validated_dict({"name": "x", "leaf": {"mode": "sometimes"}}).leaf.mode == "sometimes"
+    assert Root.from_validated_dict({"name": "x"}).leaf is Leaf.shared_default()
+
+
+def test_settings_schema_key_should_change_with_validation_rules_of_nested_fields():
+    def make_root(mode_choices):
+        @settings_schema
+        class Leaf(SettingsBase):
+            mode = SettingsField(str, choices=mode_choices, doc="Mode.")
+            flag = SettingsField(bool, default=False)
+            version = SettingsField(str, pattern=r"\d+\.\d+", pattern_hint="[INT].[INT]")
+
+        @settings_schema
+        class Root(SettingsBase):
+            name = SettingsField(str, required=True)
+            name_short = SettingsField(str, default_factory=lambda self: self.name)
+            leaf = SettingsField(Leaf)
+
+        return Root
+
+    key = get_settings_schema_key(Root)
+
+    assert len(key) == 64
+    assert get_settings_schema_key(make_root(["auto", "never"])) == key
+    assert get_settings_schema_key(make_root(["auto", "never", "always"])) != key
+    assert get_settings_schema_key(Leaf) != key
@@ -0,0 +1,119 @@
+import json
+import os
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+if sys.version_info < (3, 10):
+    pytest.skip("reef CLI requires Python 3.10+", allow_module_level=True)
+
+from src_tmp.main import main
+from src_tmp.projects.project import Project
+from src_tmp.projects.project_manager import ProjectManager
+from src_tmp.projects.settings.project_settings import ProjectSettings
+
+
+def _settings(reef_env, name):
+    return json.loads((reef_env / name / ".reef" / "project.json").read_text())
+
+
+def _run_batch(script):
+    return CliRunner().invoke(main, ["batch"], input=script)
+
+
+def test_batch_should_apply_commands_and_save_each_modified_file_once(reef_env):
+    beta_mtime = os.stat(reef_env / "beta" / ".reef" / "project.json").st_mtime_ns
+    script = """
+        # comments and empty lines are skipped
+        project config set details.description "First project" -p alpha
+        reef project config set temp.hierarchy.is_multiproject false -p alpha
+        project config get details.description -p alpha
+        project set-default beta
+        project config reset details.description -p beta
+    """
+
+    result = _run_batch(script)
+
+    assert result.exit_code == 0, result.output
+    assert result.output == "First project\n"
+    assert _settings(reef_env, "alpha") == {
+        "name": "alpha",
+        "details": {"description": "First project"},
+        "temp": {"hierarchy": {"is_multiproject": False}},
+    }
+    assert os.stat(reef_env / "beta" / ".reef" / "project.json").st_mtime_ns == beta_mtime
+    assert CliRunner().invoke(main, ["project", "get-default"]).output == "beta\n"
+
+
+def test_batch_should_not_save_anything_if_any_command_fails(reef_env):
+    script = """
+        project set-default alpha
+        project config set details.description "Changed" -p alpha
+        project config set temp.hierarchy.is_multiproject maybe -p alpha
+    """
+
+    result = _run_batch(script)
+
+    assert result.exit_code == 1
+    assert "Line 4: Value 'maybe' is not valid" in result.output
+    assert _settings(reef_env, "alpha") == {"name": "alpha"}
+    assert CliRunner().invoke(main, ["project", "get-default"]).output == "No project currently set as default.\n"
+
+
+def test_batch_should_reject_unsupported_commands(reef_env):
+    result = _run_batch("project remove alpha\n")
+
+    assert result.exit_code == 1
+    assert "not supported in batch mode" in result.output
+    assert (reef_env / "alpha" / ".reef" / "project.json").exists()
+
+
+def test_deferred_save_should_save_each_project_once_when_projects_exceed_cache(tmp_path, monkeypatch):
+    names = ["alpha", "beta", "gamma", "delta"]
+    manager = ProjectManager(repository_path=str(tmp_path / "projects.json"), project_cache_size=2)
+    for name in names:
+        manager.create(name, "", str(tmp_path))
+    saved_paths = []
+    save_to_json = ProjectSettings.save_to_json
+
+    def recording_save_to_json(settings, config_path):
+        saved_paths.append(config_path)
+        return save_to_json(settings, config_path)
+
+    monkeypatch.setattr(ProjectSettings, "save_to_json", recording_save_to_json)
+    with manager.deferred_save():
+        for name in names:
+            manager.config_set_entry("details.description", f"First {name}", name)
+        for name in names:
+            manager.config_set_entry("cmake.version_required", "3.25", name)
+            assert manager.config_get_entry("details.description", name) == f"First {name}"
+        assert saved_paths == []
+
+    assert manager.project_cache_stats.evictions > 0
+    assert sorted(saved_paths) == sorted(str(tmp_path / name / ".reef") for name in names)
+    for name in names:
+        assert _settings(tmp_path, name) == {
+            "name": name,
+            "details": {"description": f"First {name}"},
+            "cmake": {"version_required": "3.25"},
+        }
+
+
+def test_deferred_save_should_include_list_setting_edits(tmp_path, monkeypatch):
+    manager = ProjectManager(repository_path=str(tmp_path / "projects.json"), project_cache_size=1)
+    for name in ("alpha", "beta"):
+        manager.create(name, "", str(tmp_path))
+
+    def add_entry_item(project, key, value, project_name=None):
+        # list-like settings are not implemented yet, so stand in for one with a plain setting edit
+        with project.edit() as settings:
+            settings.set(key, value)
+
+    monkeypatch.setattr(Project, "config_add_entry_item", add_entry_item)
+    with manager.deferred_save():
+        manager.config_add_entry_item("details.description", "Alpha", "alpha")
+        manager.config_set_entry("details.description", "Beta", "beta")
+        assert _settings(tmp_path, "alpha") == {"name": "alpha"}
+
+    assert _settings(tmp_path, "alpha") == {"name": "alpha", "details": {"description": "Alpha"}}
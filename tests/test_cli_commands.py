@@ -0,0 +1,76 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+if sys.version_info < (3, 10):
+    pytest.skip("reef CLI requires Python 3.10+", allow_module_level=True)
+
+from click.testing import CliRunner
+
+from src_tmp.cli_project import project
+from src_tmp.main import GROUP_COMMANDS, LAZY_SUBCOMMANDS, main
+
+_ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_SUBCOMMAND_MODULES = ["src_tmp.cli_project", "src_tmp.cli_batch"]
+
+
+def _listed_commands(help_output):
+    lines = help_output.split("Commands:\n", 1)[1].splitlines()
+    return {line.split()[0]: line.split(None, 1)[1] for line in lines if line.startswith("  ") and line.split()}
+
+
+def _imported_subcommand_modules(*reef_args):
+    code = "import sys\nfrom src_tmp.main import main\ntry:\n    main()\nexcept SystemExit:\n    pass\n"
+    code += f"print(' '.join(m for m in {_SUBCOMMAND_MODULES!r} if m in sys.modules))"
+    output = subprocess.run(
+        [sys.executable, "-c", code, *reef_args], cwd=_ROOT_PATH, capture_output=True, text=True, check=True
+    ).stdout
+    return output.splitlines()[-1].split() if output.strip() else []
+
+
+def test_cli_help_should_list_every_command_with_its_help():
+    result = CliRunner().invoke(main, ["--help"])
+
+    assert result.exit_code == 0, result.output
+    commands = _listed_commands(result.output)
+    assert set(commands) == {*GROUP_COMMANDS, *LAZY_SUBCOMMANDS}
+    assert all(commands.values())
+
+
+def test_cli_project_help_should_list_every_project_command():
+    result = CliRunner().invoke(main, ["project", "--help"])
+
+    assert result.exit_code == 0, result.output
+    assert set(_listed_commands(result.output)) == set(project.commands)
+
+
+@pytest.mark.parametrize(
+    ("reef_args", "expected_modules"),
+    [
+        (["--version"], []),
+        (["config"], []),
+        (["project", "--help"], ["src_tmp.cli_project"]),
+    ],
+)
+def test_cli_should_import_subcommand_modules_only_when_they_are_used(reef_args, expected_modules):
+    assert _imported_subcommand_modules(*reef_args) == expected_modules
+
+
+def test_cli_project_list_should_not_read_project_settings(reef_env):
+    for name in ("alpha", "beta"):
+        (reef_env / name / ".reef" / "project.json").write_text("not a valid JSON")
+
+    result = CliRunner().invoke(main, ["project", "list"])
+
+    assert result.exit_code == 0, result.output
+    assert result.output == "alpha\nbeta\n"
+
+
+def test_cli_project_config_list_should_output_only_settings_in_machine_readable_format(reef_env):
+    result = CliRunner().invoke(main, ["project", "config", "list", "--all", "--format", "jsonl"])
+
+    assert result.exit_code == 0, result.output
+    assert [json.loads(line) for line in result.output.splitlines()] == [{"name": "alpha"}, {"name": "beta"}]
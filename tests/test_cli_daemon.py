@@ -0,0 +1,100 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+if sys.version_info < (3, 10):
+    pytest.skip("reef CLI requires Python 3.10+", allow_module_level=True)
+
+from src_tmp import client
+from src_tmp.client import forward_command, get_command_name
+from src_tmp.daemon import ReefDaemon
+from src_tmp.main import VERSION
+from src_tmp.projects.repository.project_repository import ProjectRepository
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="reef daemon uses Unix domain sockets")
+
+_ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_daemon_should_execute_commands_with_shared_state(reef_env):
+    daemon = ReefDaemon(VERSION)
+
+    first = daemon.execute(["project", "get-default"])
+    repository = daemon._state["project_repository"]
+    second = daemon.execute(["project", "list"])
+
+    assert first == {"exit_code": 0, "stdout": "No project currently set as default.\n", "stderr": ""}
+    assert second["exit_code"] == 0
+    assert daemon._state["project_repository"] is repository
+    assert daemon.command_count == 2
+
+
+def test_daemon_should_reload_state_when_repository_changes(reef_env, tmp_path_factory):
+    daemon = ReefDaemon(VERSION)
+    daemon.execute(["project", "list"])
+
+    # concurrent change made by another (non-daemon) reef process
+    repository = ProjectRepository(str(reef_env / "config" / "projects" / "projects.json"))
+    repository.add_project("demo", str(tmp_path_factory.mktemp("demo")))
+    repository.default_project_name = "demo"
+    repository.save()
+
+    assert daemon.execute(["project", "get-default"])["stdout"] == "demo\n"
+
+
+def test_daemon_should_keep_state_after_its_own_changes(reef_env, tmp_path_factory):
+    repository = ProjectRepository(str(reef_env / "config" / "projects" / "projects.json"))
+    repository.add_project("demo", str(tmp_path_factory.mktemp("demo")))
+    repository.save()
+    daemon = ReefDaemon(VERSION)
+
+    assert daemon.execute(["project", "set-default", "demo"])["exit_code"] == 0
+    state = daemon._state
+    assert daemon.execute(["project", "get-default"])["stdout"] == "demo\n"
+    assert daemon._state is state
+
+
+def test_daemon_should_report_errors_and_exit_codes(reef_env):
+    daemon = ReefDaemon(VERSION)
+
+    response = daemon.execute(["project", "no-such-command"])
+
+    assert response["exit_code"] == 2
+    assert "No such command" in response["stderr"]
+
+
+def test_client_should_fall_back_when_daemon_is_not_running(reef_env):
+    assert forward_command(["project", "list"]) is None
+    assert forward_command(["serve"]) is None
+
+
+def test_client_should_find_command_name_after_main_options():
+    assert get_command_name(["project", "describe", "-p", "batch"]) == "project"
+    assert get_command_name(["-v", "-c", "serve", "project", "list"]) == "project"
+    assert get_command_name(["-vc", "batch", "project"]) == "project"
+    assert get_command_name(["-cbatch", "--context=serve", "batch"]) == "batch"
+    assert get_command_name(["--", "init"]) == "init"
+    assert get_command_name(["-V"]) is None
+
+
+def test_client_should_execute_only_local_commands_in_process(reef_env, monkeypatch):
+    socket_paths = []
+    monkeypatch.setattr(client, "connect_to_daemon", lambda socket_path: socket_paths.append(socket_path))
+
+    assert forward_command(["-c", "demo", "batch"]) is None
+    assert forward_command(["serve", "--stop"]) is None
+    assert socket_paths == []
+    assert forward_command(["-c", "serve", "project", "describe", "-p", "batch"]) is None
+    assert socket_paths == [str(reef_env / "config" / "daemon.sock")]
+
+
+def test_client_should_be_runnable_as_module(reef_env):
+    env = dict(os.environ, REEF_DAEMON="0")
+    result = subprocess.run(
+        [sys.executable, "-m", "src_tmp", "--version"], cwd=_ROOT_PATH, env=env, capture_output=True, text=True
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert f"reef - version {VERSION}" in result.stdout
@@ -0,0 +1,101 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+if sys.version_info < (3, 10):
+    pytest.skip("reef CLI requires Python 3.10+", allow_module_level=True)
+
+from src_tmp.main import VERSION
+
+# Startup time is checked against budgets only on request (by setting this environment variable), as wall-clock
+# timings are not reliable on shared CI machines; by default, tests check which modules commands import instead.
+BENCHMARK_ENV_VARIABLE = "REEF_STARTUP_BENCHMARK"
+
+# Startup budgets (in seconds) measured on top of interpreter startup with 'click' imported, which every command
+# pays regardless of reef code (and which alone takes tens of milliseconds on slower machines). Budgets are scaled
+# up when the baseline is slower than the reference one (e.g. on loaded machines).
+VERSION_STARTUP_BUDGET = 0.025
+GET_DEFAULT_STARTUP_BUDGET = 0.050
+REFERENCE_BASELINE_TIME = 0.050
+
+_RUN_COUNT = 7
+_ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_REEF_MAIN = "from src_tmp.main import main; main()"
+
+
+@pytest.fixture(scope="module")
+def reef_env(tmp_path_factory):
+    config_path = tmp_path_factory.mktemp("reef_config")
+    os.makedirs(config_path / "projects")
+    data = {"config_path": str(config_path), "exec_path": str(config_path), "version": VERSION}
+    (config_path / "config.json").write_text(json.dumps(data))
+    return dict(os.environ, REEF_CONFIG=str(config_path))
+
+
+def _run(reef_env, *args):
+    return subprocess.run(
+        [sys.executable, *args], cwd=_ROOT_PATH, env=reef_env, capture_output=True, text=True, check=True
+    ).stdout
+
+
+def _best_scaled_startup_overhead(reef_env, *reef_args):
+    # runs are interleaved with baseline ones and the fastest of each is taken, to reduce influence of machine load
+    baseline_time = command_time = float("inf")
+    for _ in range(_RUN_COUNT):
+        start = time.perf_counter()
+        _run(reef_env, "-c", "import click")
+        baseline_time = min(baseline_time, time.perf_counter() - start)
+        start = time.perf_counter()
+        _run(reef_env, "-c", _REEF_MAIN, *reef_args)
+        command_time = min(command_time, time.perf_counter() - start)
+    return (command_time - baseline_time) / max(1.0, baseline_time / REFERENCE_BASELINE_TIME)
+
+
+benchmark = pytest.mark.skipif(
+    not os.environ.get(BENCHMARK_ENV_VARIABLE), reason=f"startup benchmarks run only if {BENCHMARK_ENV_VARIABLE} is set"
+)
+
+
+def _imported_modules(reef_env, *reef_args):
+    code = f"import sys\nsys.argv = ['reef', *sys.argv[1:]]\ntry:\n    {_REEF_MAIN}\nexcept SystemExit:\n    pass\n"
+    code += "print(' '.join(sorted(sys.modules)))"
+
+    output = _run(reef_env, "-c", code, *reef_args)
+    return output, output.splitlines()[-1].split()
+
+
+def test_cli_should_not_import_subcommands_for_version(reef_env):
+    output, modules = _imported_modules(reef_env, "--version")
+
+    assert f"version {VERSION}" in output
+    assert "src_tmp.config" not in modules
+    assert "src_tmp.cli_project" not in modules
+    assert "src_tmp.projects.project_manager" not in modules
+    assert "src_tmp.projects.repository.project_repository" not in modules
+
+
+def test_cli_project_get_default_should_only_import_project_repository(reef_env):
+    output, modules = _imported_modules(reef_env, "project", "get-default")
+
+    assert output.startswith("No project currently set as default.\n")
+    assert "src_tmp.cli_project" in modules
+    assert "src_tmp.projects.repository.project_repository" in modules
+    assert "src_tmp.cli_batch" not in modules
+    assert "src_tmp.projects.project_manager" not in modules
+    assert "src_tmp.projects.settings.project_settings" not in modules
+    assert "src_tmp.projects.repository.sqlite_project_repository" not in modules
+
+
+@benchmark
+def test_cli_version_should_start_within_budget(reef_env):
+    assert _best_scaled_startup_overhead(reef_env, "--version") < VERSION_STARTUP_BUDGET
+
+
+@benchmark
+def test_cli_project_get_default_should_start_within_budget(reef_env):
+    assert _run(reef_env, "-c", _REEF_MAIN, "project", "get-default") == "No project currently set as default.\n"
+    assert _best_scaled_startup_overhead(reef_env, "project", "get-default") < GET_DEFAULT_STARTUP_BUDGET
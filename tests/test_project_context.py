@@ -0,0 +1,109 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+if sys.version_info < (3, 10):
+    pytest.skip("reef projects require Python 3.10+", allow_module_level=True)
+
+from reef.common.lazy_cli import LazyContextObject
+from src_tmp.main import _infer_context_tokens
+from src_tmp.projects.project_context import (
+    CONTEXT_CACHE_FILE_NAME,
+    REEF_CONFIG_DIR_NAME,
+    ProjectContext,
+    ProjectContextResolver,
+)
+from src_tmp.projects.settings.project_settings import ProjectSettings
+
+_ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _create_project(root, name="demo", is_multiproject=True):
+    config_path = root / REEF_CONFIG_DIR_NAME
+    config_path.mkdir(parents=True, exist_ok=True)
+    ProjectSettings({"name": name, "temp": {"hierarchy": {"is_multiproject": is_multiproject}}}).save_to_json(
+        str(config_path)
+    )
+    return config_path
+
+
+@pytest.fixture
+def project_root(tmp_path):
+    root = tmp_path / "demo"
+    (root / "core" / "utils").mkdir(parents=True)
+    _create_project(root)
+    return root
+
+
+def test_resolver_should_infer_module_and_component_in_multi_module_project(project_root):
+    resolver = ProjectContextResolver()
+
+    assert resolver.resolve(str(project_root / "core" / "utils")) == ProjectContext("demo", "core", "utils")
+    assert resolver.resolve(str(project_root / "core")) == ProjectContext("demo", "core")
+    assert resolver.resolve(str(project_root)) == ProjectContext("demo")
+    assert resolver.resolve(str(project_root / REEF_CONFIG_DIR_NAME)) == ProjectContext("demo")
+
+
+def test_resolver_should_infer_component_in_single_module_project(tmp_path):
+    root = tmp_path / "single"
+    (root / "utils").mkdir(parents=True)
+    _create_project(root, "single", is_multiproject=False)
+
+    assert ProjectContextResolver().resolve(str(root / "utils")) == ProjectContext("single", "", "utils")
+
+
+def test_resolver_should_return_none_outside_of_project(project_root, tmp_path):
+    resolver = ProjectContextResolver()
+
+    assert resolver.resolve(str(tmp_path)) is None
+    assert resolver.resolve(str(tmp_path / "missing")) is None
+
+
+def test_resolver_should_return_none_for_unregistered_project(project_root):
+    resolver = ProjectContextResolver()
+    directory = str(project_root / "core")
+
+    assert resolver.resolve(directory, lambda project_name: False) is None
+    assert resolver.resolve(directory, lambda project_name: project_name == "demo") == ProjectContext("demo", "core")
+
+
+def test_resolver_should_reuse_persistent_cache_until_project_config_changes(project_root, tmp_path, monkeypatch):
+    cache_path = str(tmp_path / CONTEXT_CACHE_FILE_NAME)
+    directory = str(project_root / "core")
+    resolver = ProjectContextResolver(cache_path)
+    assert resolver.resolve(directory) == ProjectContext("demo", "core")
+    assert resolver.save_cache()
+    assert not resolver.save_cache()
+
+    def load_from_json(config_path):
+        raise AssertionError("project settings should not be loaded on cache hit")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(ProjectSettings, "load_from_json", load_from_json)
+        assert ProjectContextResolver(cache_path).resolve(directory) == ProjectContext("demo", "core")
+
+    config_path = _create_project(project_root, "renamed")
+    config_file_path = config_path / "project.json"
+    mtime_ns = config_file_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(config_file_path, ns=(mtime_ns, mtime_ns))
+    assert ProjectContextResolver(cache_path).resolve(directory) == ProjectContext("renamed", "core")
+
+
+def test_context_inference_should_fall_back_to_default_project_for_unregistered_project(project_root, monkeypatch):
+    monkeypatch.chdir(project_root / "core")
+    obj = LazyContextObject(config=None)
+    assert _infer_context_tokens(obj) == ["demo", "core", ""]
+
+    obj = LazyContextObject(config=None, project_repository={"other"})
+    assert _infer_context_tokens(obj) == []
+
+
+def test_importing_resolver_should_not_import_project_settings():
+    code = (
+        "import sys\n"
+        + "import src_tmp.projects.project_context\n"
+        + "assert 'src_tmp.projects.settings.project_settings' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=_ROOT_PATH, check=True)
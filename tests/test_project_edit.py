@@ -0,0 +1,146 @@
+import json
+import os
+import sys
+
+import pytest
+
+if sys.version_info < (3, 10):
+    pytest.skip("reef projects require Python 3.10+", allow_module_level=True)
+
+from src_tmp.projects.project import Project
+from src_tmp.projects.project_factory import ProjectFactory
+from src_tmp.projects.repository.data.project_item_data import ProjectItemData
+from src_tmp.projects.repository.project_repository import ProjectRepository
+from src_tmp.projects.repository.sqlite_project_repository import SqliteProjectRepository
+from src_tmp.projects.settings.project_settings import ProjectSettings
+
+
+@pytest.fixture
+def project(tmp_path):
+    info = ProjectItemData(None, name="demo", source_path=str(tmp_path / "demo"))
+    project = Project(info, settings=ProjectSettings({"name": "demo"}))
+    project.initialize_inplace_settings()
+    return project
+
+
+def _saved_settings(project):
+    with open(project.settings_file_path) as fp:
+        return json.load(fp)
+
+
+def test_project_edit_should_save_all_changes_once(project):
+    with project.edit() as settings:
+        settings.set("details.description", "Demo project")
+        settings.set("cmake.version_required", "3.25")
+        project.config_set_entry("temp.hierarchy.is_multiproject", "false")
+        assert project.is_editing
+        assert _saved_settings(project) == {"name": "demo"}
+
+    assert not project.is_editing
+    assert _saved_settings(project) == {
+        "name": "demo",
+        "details": {"description": "Demo project"},
+        "cmake": {"version_required": "3.25"},
+        "temp": {"hierarchy": {"is_multiproject": False}},
+    }
+
+
+def test_project_edit_should_roll_back_on_error_or_failed_validation(project):
+    with pytest.raises(RuntimeError), project.edit() as settings:
+        settings.set("details.description", "Changed")
+        raise RuntimeError("failed migration")
+    with pytest.raises(ValueError), project.edit() as settings:
+        settings.set("details.description", "Changed")
+        settings._name = None  # bypasses setter validation, so only final validation catches it
+
+    assert project.settings.to_dict() == {"name": "demo"}
+    assert _saved_settings(project) == {"name": "demo"}
+
+
+def test_project_edit_should_restore_settings_read_before_failed_edit(tmp_path):
+    repository = ProjectRepository(str(tmp_path / "projects.json"))
+    factory = ProjectFactory(repository)
+    info = ProjectItemData(None, name="demo", source_path=str(tmp_path / "demo"))
+    factory.add(Project(info, settings=ProjectSettings({"name": "demo", "details": {"description": "Demo"}})))
+    factory["demo"].initialize_inplace_settings()
+    settings = factory["demo"].settings
+
+    with pytest.raises(RuntimeError), factory.edit_project("demo") as project:
+        project.config_set_entry("details.description", "Changed")
+        project.config_set_entry("cmake.version_required", "3.25")
+        raise RuntimeError("failed migration")
+
+    assert factory["demo"].settings is settings
+    assert factory["demo"].settings.to_dict() == {"name": "demo", "details": {"description": "Demo"}}
+
+
+def test_project_edit_should_not_write_unchanged_settings(project):
+    mtime = os.stat(project.settings_file_path).st_mtime_ns
+
+    with project.edit() as settings:
+        settings.set("details.description", "Temporary")
+        settings.unset("details.description")
+
+    assert os.stat(project.settings_file_path).st_mtime_ns == mtime
+
+
+def test_factory_edit_should_keep_edited_project_when_it_is_evicted_from_cache(tmp_path):
+    repository = ProjectRepository(str(tmp_path / "projects.json"))
+    factory = ProjectFactory(repository, cache_size=1)
+    for name in ("alpha", "beta"):
+        info = ProjectItemData(None, name=name, source_path=str(tmp_path / name))
+        factory.add(Project(info, settings=ProjectSettings({"name": name})))
+        factory[name].initialize_inplace_settings()
+
+    with factory.edit_project("alpha") as project:
+        project.settings.set("details.description", "Alpha")
+        factory["beta"].settings.get("name")
+        assert factory.cache_stats.evictions >= 1
+        assert factory["alpha"] is project
+        with factory.edit_project("alpha") as nested:
+            nested.config_set_entry("cmake.version_required", "3.25")
+        assert _saved_settings(project) == {"name": "alpha"}
+
+    assert _saved_settings(project) == {
+        "name": "alpha",
+        "details": {"description": "Alpha"},
+        "cmake": {"version_required": "3.25"},
+    }
+    factory["beta"]
+    assert factory["alpha"] is not project
+
+
+def test_factory_should_reject_removing_project_while_it_is_edited(tmp_path):
+    repository = ProjectRepository(str(tmp_path / "projects.json"))
+    factory = ProjectFactory(repository)
+    info = ProjectItemData(None, name="demo", source_path=str(tmp_path / "demo"))
+    factory.add(Project(info, settings=ProjectSettings({"name": "demo"})))
+    factory["demo"].initialize_inplace_settings()
+
+    with factory.edit_project("demo"):
+        with pytest.raises(RuntimeError, match="being edited"):
+            factory.remove("demo")
+        assert "demo" in factory
+
+    factory.remove("demo")
+    assert "demo" not in factory
+
+
+@pytest.mark.parametrize("repository_class", [ProjectRepository, SqliteProjectRepository])
+def test_repository_edit_should_save_once_and_discard_changes_on_error(tmp_path, repository_class):
+    repository_path = str(tmp_path / "projects.db")
+    repository = repository_class(repository_path)
+
+    with repository.edit():
+        repository.add_project("alpha", str(tmp_path / "alpha"))
+        with repository.edit():
+            repository.add_project("beta", str(tmp_path / "beta"))
+        repository.default_project_name = "beta"
+    with pytest.raises(KeyError), repository.edit():
+        repository.remove_project("alpha")
+        repository.remove_project("gamma")
+
+    reloaded = repository_class(repository_path)
+    assert list(reloaded.project_names) == ["alpha", "beta"]
+    assert reloaded.default_project_name == "beta"
+    assert list(repository.project_names) == ["alpha", "beta"]
@@ -0,0 +1,207 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+if sys.version_info < (3, 10):
+    pytest.skip("reef projects require Python 3.10+", allow_module_level=True)
+
+from click.testing import CliRunner
+
+from src_tmp.main import main
+from src_tmp.projects.generation.cmake_generator import parse_cpp_standard
+from src_tmp.projects.generation.refresh_manifest import REFRESH_MANIFEST_FILENAME
+from src_tmp.projects.project import Project
+from src_tmp.projects.project_manager import ProjectManager
+from src_tmp.projects.project_refresh import refresh_project
+from src_tmp.projects.repository.data.project_item_data import ProjectItemData
+from src_tmp.projects.settings.project_settings import ProjectSettings
+
+
+def _write(path, content=""):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+@pytest.fixture
+def project(tmp_path):
+    source_path = tmp_path / "demo"
+    _write(source_path / "core" / "include" / "core.h")
+    _write(source_path / "core" / "src" / "core.cpp")
+    _write(source_path / "app" / "main.cpp", "int main() {}\n")
+    _write(source_path / "build" / "ignored.cpp")
+    info = ProjectItemData(None, name="demo", source_path=str(source_path))
+    settings = ProjectSettings(
+        {
+            "name": "demo",
+            "cmake": {"version_required": "3.21"},
+            "languages": {"cpp": {"standard": "c++20"}},
+            "temp": {"hierarchy": {"is_multiproject": True}},
+        }
+    )
+    return Project(info, settings=settings)
+
+
+def test_refresh_project_should_generate_cmake_files_for_each_module(project):
+    result = refresh_project(project)
+
+    assert result.name == "demo"
+    assert sorted(result.updated_files) == [
+        "CMakeLists.txt",
+        "CMakePresets.json",
+        "app/CMakeLists.txt",
+        "core/CMakeLists.txt",
+    ]
+    assert result.unchanged_files == ()
+    source_path = project.source_path
+    with open(os.path.join(source_path, "CMakeLists.txt")) as fp:
+        top_level = fp.read()
+    assert "cmake_minimum_required(VERSION 3.21)" in top_level
+    assert "set(CMAKE_CXX_STANDARD 20)" in top_level
+    assert "add_subdirectory(app)\nadd_subdirectory(core)\n" in top_level
+    assert "build" not in top_level
+    with open(os.path.join(source_path, "app", "CMakeLists.txt")) as fp:
+        assert "add_executable(demo_app)" in fp.read()
+    with open(os.path.join(source_path, "core", "CMakeLists.txt")) as fp:
+        core = fp.read()
+    assert "add_library(demo::core ALIAS demo_core)" in core
+    assert '    PUBLIC "${CMAKE_CURRENT_SOURCE_DIR}/include"\n    PRIVATE "${CMAKE_CURRENT_SOURCE_DIR}/src"' in core
+    with open(os.path.join(source_path, "CMakePresets.json")) as fp:
+        presets = json.load(fp)
+    assert presets["version"] == 3
+    assert [p["name"] for p in presets["configurePresets"]] == ["debug", "release"]
+
+
+def test_refresh_project_should_not_rewrite_unchanged_files(project):
+    refresh_project(project)
+    filepath = os.path.join(project.source_path, "CMakeLists.txt")
+    mtime = os.stat(filepath).st_mtime_ns
+    os.remove(os.path.join(project.config_path, REFRESH_MANIFEST_FILENAME))
+
+    result = refresh_project(project)
+
+    assert result.updated_files == ()
+    assert len(result.unchanged_files) == 4
+    assert not result.is_up_to_date
+    assert os.stat(filepath).st_mtime_ns == mtime
+
+
+def test_refresh_project_should_skip_scanning_when_no_inputs_changed(project, monkeypatch):
+    refresh_project(project)
+    monkeypatch.setattr("src_tmp.projects.project_refresh.scan_project_layout", None)
+
+    result = refresh_project(project)
+
+    assert result.is_up_to_date
+    assert result.updated_files == ()
+    assert len(result.unchanged_files) == 4
+
+
+def test_refresh_project_should_regenerate_only_files_with_changed_inputs(project):
+    refresh_project(project)
+
+    _write(Path(project.source_path) / "core" / "src" / "extra.cpp")
+    result = refresh_project(project)
+    assert result.updated_files == ("core/CMakeLists.txt",)
+    assert not result.is_up_to_date
+
+    project.settings.set("languages.cpp.standard", "c++17")
+    result = refresh_project(project)
+    assert result.updated_files == ("CMakeLists.txt",)
+    assert refresh_project(project).is_up_to_date
+
+    result = refresh_project(project, reef_version="99.0.0")
+    assert not result.is_up_to_date
+    assert result.updated_files == ()
+    assert refresh_project(project, reef_version="99.0.0").is_up_to_date
+
+
+def test_refresh_project_should_notice_sources_added_without_changing_directory_timestamp(project):
+    refresh_project(project)
+    directory = Path(project.source_path) / "core" / "src"
+    stat = directory.stat()
+    _write(directory / "extra.cpp")
+    os.utime(directory, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    result = refresh_project(project)
+
+    assert result.updated_files == ("core/CMakeLists.txt",)
+
+
+def test_refresh_project_should_restore_modified_generated_files(project):
+    refresh_project(project)
+    filepath = Path(project.source_path) / "app" / "CMakeLists.txt"
+    content = filepath.read_text()
+    filepath.write_text("# edited\n")
+
+    result = refresh_project(project)
+
+    assert result.updated_files == ("app/CMakeLists.txt",)
+    assert filepath.read_text() == content
+
+
+def test_refresh_project_should_skip_presets_for_old_cmake_versions(project):
+    project.settings.set("cmake.version_required", "3.16")
+
+    result = refresh_project(project)
+
+    assert "CMakePresets.json" not in result.updated_files
+    assert not os.path.exists(os.path.join(project.source_path, "CMakePresets.json"))
+
+
+@pytest.fixture
+def reef_projects():
+    return ("alpha", "beta", "gamma")
+
+
+@pytest.fixture
+def manager(reef_env, reef_projects):
+    for name in reef_projects:
+        _write(reef_env / name / "main.cpp", "int main() {}\n")
+    # settings of 'beta' are broken, so its refresh fails
+    (reef_env / "beta" / ".reef" / "project.json").write_text("{")
+    return ProjectManager(repository_path=str(reef_env / "config" / "projects" / "projects.json"))
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_refresh_many_should_refresh_all_projects_and_report_failures(manager, jobs):
+    results = manager.refresh_many(jobs=jobs)
+
+    assert [result.name for result in results] == ["alpha", "beta", "gamma"]
+    assert [result.is_successful for result in results] == [True, False, True]
+    assert "CMakeLists.txt" in results[0].updated_files
+    assert results[1].error is not None
+    assert os.path.exists(os.path.join(os.getcwd(), "gamma", "CMakeLists.txt"))
+
+
+def test_refresh_many_should_filter_projects_by_name_patterns(manager):
+    results = manager.refresh_many(name_patterns=["a*", "g?mma"])
+
+    assert [result.name for result in results] == ["alpha", "gamma"]
+    assert all(result.is_successful for result in results)
+
+
+def test_cli_refresh_all_should_exit_with_error_after_refreshing_all_projects(manager):
+    result = CliRunner().invoke(main, ["project", "refresh", "--all", "-j", "2"])
+
+    assert result.exit_code == 1
+    lines = result.output.splitlines()
+    assert lines[0].startswith("OK   alpha (")
+    assert lines[1].startswith("FAIL beta (")
+    assert lines[2].startswith("OK   gamma (")
+    assert lines[3].startswith("2 of 3 project(s) refreshed")
+
+
+@pytest.mark.parametrize(
+    "standard, expected",
+    [("c++17", ("17", False)), ("gnu++20", ("20", True)), ("23", ("23", False)), (" C++14 ", ("14", False))],
+)
+def test_parse_cpp_standard(standard, expected):
+    assert parse_cpp_standard(standard) == expected
+
+
+def test_parse_cpp_standard_should_reject_unknown_standards():
+    with pytest.raises(ValueError, match="supported values include"):
+        parse_cpp_standard("c++19")
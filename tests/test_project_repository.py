@@ -0,0 +1,193 @@
+import json
+import multiprocessing
+import sys
+
+import pytest
+
+if sys.version_info < (3, 10):
+    pytest.skip("reef projects require Python 3.10+", allow_module_level=True)
+
+from src_tmp.projects.repository.project_repository import ProjectRepository
+from src_tmp.projects.repository.sqlite_project_repository import SqliteProjectRepository
+
+
+@pytest.fixture
+def repository_path(tmp_path):
+    return str(tmp_path / "projects.json")
+
+
+def _snapshot(repository_path):
+    with open(repository_path) as fp:
+        return json.load(fp)
+
+
+def _journal_lines(repository):
+    with open(repository._journal.path, "rb") as fp:
+        return fp.read().splitlines(keepends=True)
+
+
+def test_repository_should_replay_journal_on_load(repository_path, tmp_path):
+    repository = ProjectRepository(repository_path)
+    with repository.edit():
+        repository.add_project("alpha", str(tmp_path / "alpha"))
+        repository.add_project("beta", str(tmp_path / "beta"))
+    repository.default_project_name = "beta"
+    repository.save()
+
+    assert _snapshot(repository_path) == {"projects": []}
+    assert len(_journal_lines(repository)) == 3
+    loaded = ProjectRepository(repository_path)
+    assert list(loaded.project_names) == ["alpha", "beta"]
+    assert loaded.default_project_name == "beta"
+    assert loaded.revision == 3
+
+
+def test_repository_should_ignore_journal_record_truncated_by_crash(repository_path, tmp_path):
+    repository = ProjectRepository(repository_path)
+    repository.add_project("alpha", str(tmp_path / "alpha"))
+    repository.save()
+    repository.add_project("beta", str(tmp_path / "beta"))
+    repository.save()
+    complete_record, truncated_record = _journal_lines(repository)
+    with open(repository._journal.path, "wb") as fp:
+        fp.write(complete_record + truncated_record[: len(truncated_record) // 2])
+
+    loaded = ProjectRepository(repository_path)
+    assert list(loaded.project_names) == ["alpha"]
+
+    loaded.add_project("gamma", str(tmp_path / "gamma"))
+    loaded.save()
+    assert [json.loads(line)["rev"] for line in _journal_lines(loaded)] == [1, 2]
+    assert list(ProjectRepository(repository_path).project_names) == ["alpha", "gamma"]
+
+
+def test_repository_should_reject_journal_corrupted_before_its_end(repository_path, tmp_path):
+    repository = ProjectRepository(repository_path)
+    repository.add_project("alpha", str(tmp_path / "alpha"))
+    repository.add_project("beta", str(tmp_path / "beta"))
+    repository.save()
+    first_record, second_record = _journal_lines(repository)
+    with open(repository._journal.path, "wb") as fp:
+        fp.write(b"{garbage}\n" + second_record)
+
+    with pytest.raises(ValueError, match="corrupted"):
+        ProjectRepository(repository_path)
+
+
+def test_repository_should_compact_journal_into_snapshot_and_replay_records_added_after(repository_path, tmp_path):
+    repository = ProjectRepository(repository_path, compaction_threshold=2)
+    repository.add_project("alpha", str(tmp_path / "alpha"))
+    repository.save()
+    repository.add_project("beta", str(tmp_path / "beta"))
+    repository.save()
+
+    assert [project["name"] for project in _snapshot(repository_path)["projects"]] == ["alpha", "beta"]
+    assert _snapshot(repository_path)["revision"] == 2
+    assert repository._journal.record_count == 0
+
+    repository.remove_project("alpha")
+    repository.save()
+    assert [json.loads(line)["rev"] for line in _journal_lines(repository)] == [3]
+    loaded = ProjectRepository(repository_path, compaction_threshold=2)
+    assert list(loaded.project_names) == ["beta"]
+    assert loaded.revision == 3
+
+
+def test_repository_should_skip_journal_records_already_included_in_snapshot(repository_path, tmp_path):
+    repository = ProjectRepository(repository_path)
+    repository.add_project("alpha", str(tmp_path / "alpha"))
+    repository.add_project("beta", str(tmp_path / "beta"))
+    repository.save()
+    journal = b"".join(_journal_lines(repository))
+    # compaction interrupted after writing snapshot, but before clearing journal
+    repository.compact()
+    with open(repository._journal.path, "wb") as fp:
+        fp.write(journal)
+
+    loaded = ProjectRepository(repository_path)
+    assert list(loaded.project_names) == ["alpha", "beta"]
+    assert loaded.revision == 2
+
+
+def test_repository_should_reject_journal_not_continuing_snapshot_revision(repository_path, tmp_path):
+    repository = ProjectRepository(repository_path)
+    repository.add_project("alpha", str(tmp_path / "alpha"))
+    repository.add_project("beta", str(tmp_path / "beta"))
+    repository.save()
+    _, second_record = _journal_lines(repository)
+    with open(repository._journal.path, "wb") as fp:
+        fp.write(second_record)
+
+    with pytest.raises(ValueError, match="expected record with revision 1, found 2"):
+        ProjectRepository(repository_path)
+
+
+def test_repository_save_should_merge_changes_saved_concurrently(repository_path, tmp_path):
+    first = ProjectRepository(repository_path)
+    second = ProjectRepository(repository_path)
+
+    first.add_project("alpha", str(tmp_path / "alpha"))
+    second.add_project("beta", str(tmp_path / "beta"))
+    second.default_project_name = "beta"
+    first.save()
+    second.save()
+
+    assert list(second.project_names) == ["alpha", "beta"]
+    loaded = ProjectRepository(repository_path)
+    assert list(loaded.project_names) == ["alpha", "beta"]
+    assert loaded.default_project_name == "beta"
+    assert loaded.revision == 3
+
+
+def test_repository_save_should_fail_on_conflicting_concurrent_changes(repository_path, tmp_path):
+    first = ProjectRepository(repository_path)
+    second = ProjectRepository(repository_path)
+
+    first.add_project("alpha", str(tmp_path / "first"))
+    second.add_project("alpha", str(tmp_path / "second"))
+    second.add_project("beta", str(tmp_path / "beta"))
+    first.save()
+
+    with pytest.raises(RuntimeError, match="conflict with concurrent changes"):
+        second.save()
+    assert list(second.project_names) == ["alpha"]
+    assert second["alpha"].source_path == str(tmp_path / "first")
+    assert not second.save()
+
+
+def _add_projects_in_process(repository_path, prefix, count):
+    repository = ProjectRepository(repository_path, compaction_threshold=5)
+    for i in range(count):
+        repository.add_project(f"{prefix}{i}", f"/{prefix}/{i}")
+        repository.save()
+
+
+def test_repository_should_not_lose_changes_saved_by_concurrent_processes(repository_path):
+    ProjectRepository(repository_path)
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=_add_projects_in_process, args=(repository_path, prefix, 10)) for prefix in "abcd"
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+
+    assert [process.exitcode for process in processes] == [0, 0, 0, 0]
+    loaded = ProjectRepository(repository_path)
+    assert sorted(loaded.project_names) == sorted(f"{prefix}{i}" for prefix in "abcd" for i in range(10))
+    assert loaded.revision == 40
+
+
+@pytest.mark.parametrize("repository_class", [ProjectRepository, SqliteProjectRepository])
+def test_repository_should_resolve_relative_project_paths_against_its_directory(
+    tmp_path, monkeypatch, repository_class
+):
+    (tmp_path / "registry").mkdir()
+    (tmp_path / "other" / "nested").mkdir(parents=True)
+    repository = repository_class(str(tmp_path / "registry" / "projects.db"))
+    repository.add_project("demo", "../demo")
+    monkeypatch.chdir(tmp_path / "other" / "nested")
+
+    assert repository.find_project_for_path(str(tmp_path / "demo" / "src")).name == "demo"
+    assert repository.find_project_for_path(str(tmp_path / "other" / "demo")) is None
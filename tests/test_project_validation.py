@@ -0,0 +1,93 @@
+import json
+import sys
+import time
+
+import pytest
+
+if sys.version_info < (3, 10):
+    pytest.skip("reef projects require Python 3.10+", allow_module_level=True)
+
+from src_tmp.projects.project import Project
+from src_tmp.projects.project_manager import ProjectManager
+from src_tmp.projects.project_validation import validate_projects
+
+_PROJECT_NAMES = ["alpha", "beta", "gamma", "delta", "epsilon", "zeta"]
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = ProjectManager(repository_path=str(tmp_path / "projects.json"))
+    for name in _PROJECT_NAMES:
+        manager.create(name, "", str(tmp_path))
+    return manager
+
+
+def _write_settings(tmp_path, name, content):
+    (tmp_path / name / ".reef" / "project.json").write_text(content)
+
+
+@pytest.mark.parametrize("jobs", [1, 3, None])
+def test_validation_should_return_results_in_order_of_given_projects(manager, monkeypatch, jobs):
+    reload_settings = Project.reload_settings
+
+    def slow_reload_settings(project):
+        # projects given earlier take longer, so they finish last when validated concurrently
+        time.sleep(0.01 * (len(_PROJECT_NAMES) - _PROJECT_NAMES.index(project.name)))
+        reload_settings(project)
+
+    monkeypatch.setattr(Project, "reload_settings", slow_reload_settings)
+    results = manager.validate_projects(jobs=jobs)
+
+    assert [result.name for result in results] == _PROJECT_NAMES
+    assert all(result.is_valid and result.error is None and result.duration > 0 for result in results)
+
+
+def test_validation_should_report_each_failure_without_stopping(manager, tmp_path):
+    _write_settings(tmp_path, "beta", "not a valid JSON")
+    _write_settings(tmp_path, "delta", json.dumps({"name": "delta", "default_language": "cobol"}))
+    _write_settings(tmp_path, "zeta", json.dumps({"name": "other"}))
+
+    results = manager.validate_projects(jobs=2)
+
+    assert [result.name for result in results if result.is_valid] == ["alpha", "gamma", "epsilon"]
+    errors = {result.name: result.error for result in results if not result.is_valid}
+    assert list(errors) == ["beta", "delta", "zeta"]
+    assert errors["beta"].startswith("JSONDecodeError: ")
+    assert errors["delta"].startswith("ValueError: ") and "cobol" in errors["delta"]
+    assert errors["zeta"].startswith("ValueError: ") and "does not match its registered name" in errors["zeta"]
+    assert results[1].to_record() == {
+        "name": "beta",
+        "is_valid": False,
+        "duration": results[1].duration,
+        "error": errors["beta"],
+    }
+
+
+def test_validation_should_reload_settings_of_preloaded_projects(manager, tmp_path):
+    projects = [manager.find_project_for_path(str(tmp_path / name)).preload() for name in ("alpha", "beta")]
+    _write_settings(tmp_path, "beta", json.dumps({"name": "beta", "default_language": "cobol"}))
+
+    results = validate_projects(projects, jobs=2)
+
+    assert [result.is_valid for result in results] == [True, False]
+    assert all(project.is_settings_loaded for project in projects)
+
+
+def test_validation_should_only_load_requested_projects(manager, tmp_path):
+    _write_settings(tmp_path, "alpha", "not a valid JSON")
+    manager.change_default_project("gamma")
+
+    results = manager.validate_projects(["beta", None])
+
+    assert [(result.name, result.is_valid) for result in results] == [("beta", True), ("gamma", True)]
+
+
+def test_validation_should_reject_invalid_number_of_jobs(manager):
+    with pytest.raises(ValueError, match="positive integer"):
+        validate_projects([], jobs=0)
+
+
+def test_validation_should_reject_missing_default_project(manager):
+    assert manager.default_project_name is None
+    with pytest.raises(KeyError, match="no default project is set"):
+        manager.validate_projects([None])
@@ -0,0 +1,157 @@
+import sqlite3
+import sys
+
+import pytest
+
+if sys.version_info < (3, 10):
+    pytest.skip("reef projects require Python 3.10+", allow_module_level=True)
+
+from src_tmp.projects.repository.project_repository import ProjectRepository
+from src_tmp.projects.repository.project_repository_backends import (
+    REPOSITORY_BACKEND_JSON,
+    REPOSITORY_BACKEND_SQLITE,
+    migrate_project_repository,
+)
+from src_tmp.projects.repository.sqlite_project_repository import SqliteProjectRepository
+
+
+@pytest.fixture
+def repository_path(tmp_path):
+    return str(tmp_path / "projects.sqlite")
+
+
+@pytest.fixture
+def repository(repository_path):
+    repository = SqliteProjectRepository(repository_path)
+    yield repository
+    repository.close()
+
+
+def test_repository_should_add_get_and_remove_projects(repository, tmp_path):
+    repository.add_project("alpha", str(tmp_path / "alpha"))
+    repository.add_project("beta", str(tmp_path / "beta"), project_config_path=str(tmp_path / "beta-config"))
+    repository.set_default_module("beta", "core")
+
+    assert list(repository.project_names) == ["alpha", "beta"]
+    assert "alpha" in repository and "gamma" not in repository
+    assert repository["beta"].config_path == str(tmp_path / "beta-config")
+    assert repository["beta"].default_module == "core"
+    assert [item.name for item in repository] == ["alpha", "beta"]
+
+    repository.remove_project("alpha")
+    assert list(repository.project_names) == ["beta"]
+    with pytest.raises(KeyError):
+        repository["alpha"]
+    with pytest.raises(KeyError):
+        repository.remove_project("alpha")
+    with pytest.raises(KeyError):
+        repository.add_project("beta", str(tmp_path / "other"))
+
+
+def test_repository_should_commit_mutations_outside_edit_immediately(repository, repository_path, tmp_path):
+    repository.add_project("alpha", str(tmp_path / "alpha"))
+
+    assert not repository.save()
+    other = SqliteProjectRepository(repository_path)
+    try:
+        assert list(other.project_names) == ["alpha"]
+        other.add_project("beta", str(tmp_path / "beta"))
+    finally:
+        other.close()
+    assert list(repository.project_names) == ["alpha", "beta"]
+
+
+def test_repository_should_not_leave_transaction_open_after_failed_mutation(repository, tmp_path):
+    repository.add_project("alpha", str(tmp_path / "alpha"))
+    with pytest.raises(KeyError):
+        repository.add_project("alpha", str(tmp_path / "other"))
+    with pytest.raises(KeyError):
+        repository.remove_project("beta")
+
+    assert not repository._connection.in_transaction
+
+
+def test_repository_should_commit_edit_at_its_end_and_discard_it_on_error(repository, repository_path, tmp_path):
+    lock_count = repository.lock_count
+    with repository.edit():
+        repository.add_project("alpha", str(tmp_path / "alpha"))
+        repository.add_project("beta", str(tmp_path / "beta"))
+    assert repository.lock_count == lock_count + 1
+    with pytest.raises(RuntimeError), repository.edit():
+        repository.remove_project("alpha")
+        raise RuntimeError("failed")
+
+    assert list(repository.project_names) == ["alpha", "beta"]
+    other = SqliteProjectRepository(repository_path)
+    try:
+        assert list(other.project_names) == ["alpha", "beta"]
+    finally:
+        other.close()
+
+
+def test_repository_should_manage_default_project(repository, tmp_path):
+    repository.add_project("alpha", str(tmp_path / "alpha"))
+    assert repository.default_project is None
+
+    repository.default_project_name = "alpha"
+    assert repository.default_project.name == "alpha"
+    with pytest.raises(KeyError):
+        repository.default_project_name = "beta"
+
+    repository.remove_project("alpha")
+    assert repository.default_project_name is None
+
+
+def test_repository_should_find_innermost_project_for_path(repository, tmp_path):
+    repository.add_project("outer", str(tmp_path / "outer"))
+    repository.add_project("inner", str(tmp_path / "outer" / "inner"))
+    repository.add_project("other", str(tmp_path / "other"), project_config_path=str(tmp_path / "configs" / "other"))
+
+    assert repository.find_project_for_path(str(tmp_path / "outer" / "src")).name == "outer"
+    assert repository.find_project_for_path(str(tmp_path / "outer" / "inner" / "src")).name == "inner"
+    assert repository.find_project_for_path(str(tmp_path / "configs" / "other" / "x")).name == "other"
+    assert repository.find_project_for_path(str(tmp_path / "outer-sibling")) is None
+    assert repository.find_project_for_path(str(tmp_path)) is None
+
+
+def test_repository_should_reject_unsupported_schema_version(repository_path):
+    SqliteProjectRepository(repository_path).close()
+    with sqlite3.connect(repository_path) as connection:
+        connection.execute("UPDATE meta SET value = '99' WHERE key = 'schema_version'")
+    connection.close()
+
+    with pytest.raises(ValueError, match="unsupported schema version"):
+        SqliteProjectRepository(repository_path)
+
+
+def test_migration_should_copy_projects_between_backends(tmp_path):
+    json_path = str(tmp_path / "projects.json")
+    source = ProjectRepository(json_path)
+    source.add_project("alpha", str(tmp_path / "alpha"))
+    source.add_project("beta", str(tmp_path / "beta"))
+    source.set_default_module("alpha", "core")
+    source.default_project_name = "beta"
+    source.save()
+
+    sqlite_path = str(tmp_path / "projects.sqlite")
+    assert migrate_project_repository(json_path, REPOSITORY_BACKEND_JSON, sqlite_path, REPOSITORY_BACKEND_SQLITE) == 2
+    json_copy_path = str(tmp_path / "copy.json")
+    assert (
+        migrate_project_repository(sqlite_path, REPOSITORY_BACKEND_SQLITE, json_copy_path, REPOSITORY_BACKEND_JSON) == 2
+    )
+
+    copy = ProjectRepository(json_copy_path)
+    assert [item.to_dict() for item in copy] == [item.to_dict() for item in source]
+    assert copy.default_project_name == "beta"
+
+
+def test_migration_should_reject_non_empty_target(tmp_path):
+    sqlite_path = str(tmp_path / "projects.sqlite")
+    target = SqliteProjectRepository(sqlite_path)
+    target.add_project("alpha", str(tmp_path / "alpha"))
+    target.close()
+
+    with pytest.raises(ValueError, match="is not empty"):
+        migrate_project_repository(
+            str(tmp_path / "projects.json"), REPOSITORY_BACKEND_JSON, sqlite_path, REPOSITORY_BACKEND_SQLITE
+        )